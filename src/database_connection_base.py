@@ -9,6 +9,9 @@ from typing import List, Dict, Any, Tuple, Optional
 class DatabaseConnectionBase(ABC):
     """Base class for all database connections"""
     
+    # SQL dialect key used to pick dialect-specific query templates
+    dialect = None
+    
     def __init__(self, host: str, port: int, username: str, password: str, **kwargs):
         self.host = host
         self.port = port
@@ -2,19 +2,34 @@
 Database Test Framework - Base Classes
 Implements test execution framework based on test categories for smoke tests.
 """
-import sys
-import os
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(__file__))
-sys.path.insert(0, project_root)
+import asyncio
+import importlib
+import traceback
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import IntEnum
+from time import perf_counter_ns
+from typing import Dict, Any, Iterable, List, Literal, Tuple
 
 from src.database_config_manager import DatabaseConfigManager
-from src.postgresql_connector import PostgreSQLConnector
-from src.oracle_connector import OracleConnector
-from src.sqlserver_connector import SQLServerConnector
+
+# Connector modules by db_type, imported on first use so a run only loads the backends it needs
+_CONNECTOR_MODULES = {
+    'postgresql': ('src.postgresql_connector', 'PostgreSQLConnector'),
+    'oracle': ('src.oracle_connector', 'OracleConnector'),
+    'sqlserver': ('src.sqlserver_connector', 'SQLServerConnector'),
+}
+_connector_classes = {}
+
+
+def _get_connector_class(db_type: str):
+    """Import and cache the connector class for a database type."""
+    connector_class = _connector_classes.get(db_type)
+    if connector_class is None:
+        module_name, class_name = _CONNECTOR_MODULES[db_type]
+        connector_class = getattr(importlib.import_module(module_name), class_name)
+        _connector_classes[db_type] = connector_class
+    return connector_class
 
 
 class DatabaseConnectionFactory:
@@ -61,7 +76,7 @@ class DatabaseConnectionFactory:
         
         try:
             if db_type == 'postgresql':
-                connector = PostgreSQLConnector(
+                connector = _get_connector_class('postgresql')(
                     host=config['host'],
                     port=config['port'],
                     username=username,
@@ -70,16 +85,17 @@ class DatabaseConnectionFactory:
                 )
                 
             elif db_type == 'oracle':
-                connector = OracleConnector(
+                connector = _get_connector_class('oracle')(
                     host=config['host'],
                     port=config['port'],
                     username=username,
                     password=password,
-                    service_name=config['service_name']
+                    service_name=config['service_name'],
+                    statement_cache_size=config.get('statement_cache_size', 64)
                 )
                 
             elif db_type == 'sqlserver':
-                connector = SQLServerConnector(
+                connector = _get_connector_class('sqlserver')(
                     host=config['host'],
                     port=config['port'],
                     username=username,
@@ -99,13 +115,89 @@ class DatabaseConnectionFactory:
             return None, f"Error creating connector: {str(e)}"
 
 
-class DatabaseTest(ABC):
+class DatabaseSession:
     """
-    Abstract base class for all database tests.
+    Context manager holding one open connection for an (environment, application)
+    pair so that a sequence of tests can share it instead of reconnecting per test.
+    """
+    
+    def __init__(self, environment: str, application: str, factory: DatabaseConnectionFactory = None):
+        """
+        Initialize the session.
+        
+        Args:
+            environment: Environment name (e.g., "DEV", "QA", "ACC")
+            application: Application name (e.g., "RED", "TPS", "MDW")
+            factory: Connection factory to reuse; a new one is created if omitted
+        """
+        self.environment = environment
+        self.application = application
+        self.factory = factory or DatabaseConnectionFactory()
+        self.connector = None
+        self.connection_error = None
+    
+    def open(self) -> Tuple[bool, str]:
+        """
+        Create the connector and connect once for the whole session.
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        connector, message = self.factory.create_connection(self.environment, self.application)
+        if not connector:
+            self.connection_error = message
+            return False, message
+        
+        success, connect_message = connector.connect()
+        if not success:
+            self.connection_error = f"Connection failed: {connect_message}"
+            return False, self.connection_error
+        
+        self.connector = connector
+        return True, "Database connection established successfully"
+    
+    def close(self):
+        """Close the shared connection."""
+        if self.connector:
+            with suppress(ConnectionError, OSError):
+                self.connector.disconnect()
+            self.connector = None
+    
+    def __enter__(self) -> "DatabaseSession":
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of a database test run."""
+    __test__ = False  # Not a pytest test class despite the name
+    
+    status: Literal['PASSED', 'FAILED', 'SKIPPED']
+    message: str = ""
+    duration_ns: int = 0
+    
+    def __str__(self) -> str:
+        """Render the legacy "PASSED" / "FAILED: message" status string."""
+        if self.status == "PASSED" or not self.message:
+            return self.status
+        return f"{self.status}: {self.message}"
+
+
+class DatabaseTest:
+    """
+    Base class for all database tests.
     Provides common functionality for database connection and test execution.
+    Subclasses implement execute_test_logic.
     """
     
-    def __init__(self, environment: str, application: str, parameters: Dict[str, Any] = None):
+    __slots__ = ('environment', 'application', 'parameters', 'factory', 'connector', 'connection_error', 'session')
+    
+    def __init__(self, environment: str, application: str, parameters: Dict[str, Any] = None,
+                 session: DatabaseSession = None):
         """
         Initialize the database test.
         
@@ -113,11 +205,13 @@ class DatabaseTest(ABC):
             environment: Environment name (e.g., "DEV", "QA", "ACC")
             application: Application name (e.g., "RED", "TPS", "MDW") 
             parameters: Additional test parameters from Excel
+            session: Open DatabaseSession to run on instead of connecting per test
         """
         self.environment = environment
         self.application = application
         self.parameters = parameters or {}
-        self.factory = DatabaseConnectionFactory()
+        self.session = session
+        self.factory = session.factory if session else DatabaseConnectionFactory()
         self.connector = None
         self.connection_error = None
     
@@ -128,6 +222,14 @@ class DatabaseTest(ABC):
         Returns:
             Tuple of (success: bool, message: str)
         """
+        if self.session:
+            # Reuse the session's connection; it is opened and closed by the session
+            self.connector = self.session.connector
+            if not self.connector:
+                self.connection_error = self.session.connection_error
+                return False, self.connection_error
+            return True, "Using shared session connection"
+        
         try:
             self.connector, message = self.factory.create_connection(
                 self.environment, 
@@ -151,14 +253,12 @@ class DatabaseTest(ABC):
             return False, f"Error during connection setup: {str(e)}"
     
     def teardown_connection(self):
-        """Clean up database connection."""
-        if self.connector:
-            try:
+        """Clean up database connection. The connection is left open in session mode."""
+        if self.connector and not self.session:
+            # Connectors swallow driver close errors; only ignore transport failures here
+            with suppress(ConnectionError, OSError):
                 self.connector.disconnect()
-            except Exception:
-                pass  # Ignore cleanup errors
     
-    @abstractmethod
     def execute_test_logic(self) -> Tuple[bool, str]:
         """
         Execute the specific test logic. Must be implemented by subclasses.
@@ -166,428 +266,545 @@ class DatabaseTest(ABC):
         Returns:
             Tuple of (success: bool, message: str)
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute_test_logic")
     
-    def execute(self) -> str:
+    def execute(self) -> TestResult:
         """
         Main test execution method that handles setup, test execution, and cleanup.
         
         Returns:
-            Test status: "PASSED", "FAILED", or "SKIPPED"
+            TestResult with status "PASSED", "FAILED" or "SKIPPED"; str() of it
+            gives the legacy "FAILED: message" form
         """
+        start_ns = perf_counter_ns()
         try:
             # Setup connection
             setup_success, setup_message = self.setup_connection()
             if not setup_success:
-                return f"FAILED: {setup_message}"
+                return TestResult("FAILED", setup_message, perf_counter_ns() - start_ns)
             
-            # Execute test logic
+            # Execute test logic; subclasses let unexpected errors propagate to here
             test_success, test_message = self.execute_test_logic()
             
-            # Cleanup
-            self.teardown_connection()
-            
-            if test_success:
-                return "PASSED"
-            else:
-                return f"FAILED: {test_message}"
-                
         except Exception as e:
             self.teardown_connection()
-            return f"FAILED: Unexpected error - {str(e)}"
+            error = traceback.format_exception_only(type(e), e)[-1].strip()
+            return TestResult("FAILED", f"Unexpected error - {error}", perf_counter_ns() - start_ns)
+        
+        # Cleanup
+        self.teardown_connection()
+        
+        return TestResult("PASSED" if test_success else "FAILED", test_message, perf_counter_ns() - start_ns)
+    
+    async def execute_async(self) -> TestResult:
+        """
+        Run execute() without blocking the event loop.
+        
+        The connectors wrap blocking DB-API drivers, so the test runs in a
+        worker thread while the loop keeps scheduling other tests.
+        
+        Returns:
+            Same TestResult as execute()
+        """
+        return await asyncio.to_thread(self.execute)
 
 
 class SetupValidationTest(DatabaseTest):
     """Test database setup and initial configuration."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Validate basic database setup."""
-        try:
-            # Test basic query execution
-            success, result = self.connector.execute_query("SELECT 1")
-            if not success:
-                return False, f"Basic query failed: {result}"
-            
-            # Verify connection parameters
-            if not self.connector.is_connected:
-                return False, "Connection status inconsistent"
-            
-            return True, "Database setup validation passed"
-            
-        except Exception as e:
-            return False, f"Setup validation error: {str(e)}"
+        # Test basic query execution
+        success, result = self.connector.execute_query("SELECT 1")
+        if not success:
+            return False, f"Basic query failed: {result}"
+        
+        # Verify connection parameters
+        if not self.connector.is_connected:
+            return False, "Connection status inconsistent"
+        
+        return True, "Database setup validation passed"
 
 
 class ConfigurationTest(DatabaseTest):
     """Test database configuration and settings."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Validate database configuration."""
-        try:
-            # Check database version and settings based on type
-            connector_type = type(self.connector).__name__
-            
-            if "PostgreSQL" in connector_type:
-                success, result = self.connector.execute_query("SELECT version()")
-            elif "Oracle" in connector_type:
-                success, result = self.connector.execute_query("SELECT * FROM v$version WHERE rownum = 1")
-            elif "SQLServer" in connector_type:
-                success, result = self.connector.execute_query("SELECT @@VERSION")
-            else:
-                return False, f"Unknown connector type: {connector_type}"
-            
-            if not success:
-                return False, f"Configuration query failed: {result}"
-            
-            return True, f"Configuration test passed - Database accessible"
-            
-        except Exception as e:
-            return False, f"Configuration test error: {str(e)}"
+        # Check database version and settings based on type
+        connector_type = type(self.connector).__name__
+        
+        if "PostgreSQL" in connector_type:
+            success, result = self.connector.execute_query("SELECT version()")
+        elif "Oracle" in connector_type:
+            success, result = self.connector.execute_query("SELECT * FROM v$version WHERE rownum = 1")
+        elif "SQLServer" in connector_type:
+            success, result = self.connector.execute_query("SELECT @@VERSION")
+        else:
+            return False, f"Unknown connector type: {connector_type}"
+        
+        if not success:
+            return False, f"Configuration query failed: {result}"
+        
+        return True, f"Configuration test passed - Database accessible"
 
 
 class SecurityTest(DatabaseTest):
     """Test database security and access controls."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Validate security settings and access."""
-        try:
-            # Test user access and permissions
-            connector_type = type(self.connector).__name__
-            
-            if "PostgreSQL" in connector_type:
-                success, result = self.connector.execute_query("SELECT current_user, session_user")
-            elif "Oracle" in connector_type:
-                success, result = self.connector.execute_query("SELECT USER FROM DUAL")
-            elif "SQLServer" in connector_type:
-                success, result = self.connector.execute_query("SELECT SYSTEM_USER, USER_NAME()")
-            else:
-                return False, f"Unknown connector type: {connector_type}"
-            
-            if not success:
-                return False, f"Security query failed: {result}"
-            
-            # Verify we got a valid user result
-            if not result or len(result) == 0:
-                return False, "No user information returned"
-            
-            return True, "Security test passed - User access verified"
-            
-        except Exception as e:
-            return False, f"Security test error: {str(e)}"
+        # Test user access and permissions
+        connector_type = type(self.connector).__name__
+        
+        if "PostgreSQL" in connector_type:
+            success, result = self.connector.execute_query("SELECT current_user, session_user")
+        elif "Oracle" in connector_type:
+            success, result = self.connector.execute_query("SELECT USER FROM DUAL")
+        elif "SQLServer" in connector_type:
+            success, result = self.connector.execute_query("SELECT SYSTEM_USER, USER_NAME()")
+        else:
+            return False, f"Unknown connector type: {connector_type}"
+        
+        if not success:
+            return False, f"Security query failed: {result}"
+        
+        # Verify we got a valid user result
+        if not result or len(result) == 0:
+            return False, "No user information returned"
+        
+        return True, "Security test passed - User access verified"
 
 
 class ConnectionTest(DatabaseTest):
     """Test database connection stability and parameters."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test connection stability."""
-        try:
-            # Test multiple queries to verify connection stability
-            test_queries = [
-                "SELECT 1",
-                "SELECT 1 + 1", 
-                "SELECT 'connection_test'"
-            ]
-            
-            for i, query in enumerate(test_queries):
-                success, result = self.connector.execute_query(query)
-                if not success:
-                    return False, f"Connection test query {i+1} failed: {result}"
-            
-            # Test connection properties
-            if not hasattr(self.connector, 'host') or not self.connector.host:
-                return False, "Connection missing host information"
-            
-            if not hasattr(self.connector, 'port') or not self.connector.port:
-                return False, "Connection missing port information"
-            
-            return True, "Connection test passed - Stable connection verified"
-            
-        except Exception as e:
-            return False, f"Connection test error: {str(e)}"
+        # Test multiple queries to verify connection stability
+        test_queries = [
+            "SELECT 1",
+            "SELECT 1 + 1", 
+            "SELECT 'connection_test'"
+        ]
+        
+        for i, query in enumerate(test_queries):
+            success, result = self.connector.execute_query(query)
+            if not success:
+                return False, f"Connection test query {i+1} failed: {result}"
+        
+        # Test connection properties
+        if not hasattr(self.connector, 'host') or not self.connector.host:
+            return False, "Connection missing host information"
+        
+        if not hasattr(self.connector, 'port') or not self.connector.port:
+            return False, "Connection missing port information"
+        
+        return True, "Connection test passed - Stable connection verified"
 
 
 class QueriesTest(DatabaseTest):
     """Test database query execution capabilities."""
     
+    __slots__ = ()
+    
+    # Constant, timestamp and catalog queries combined into one round trip
+    _COMBINED_QUERIES = {
+        'postgresql': (
+            "SELECT 1 AS test_column, NOW() AS checked_at, "
+            "(SELECT COUNT(*) FROM information_schema.tables) AS table_count"
+        ),
+        'oracle': (
+            "SELECT 1 AS test_column, SYSDATE AS checked_at, "
+            "(SELECT COUNT(*) FROM user_tables) AS table_count FROM DUAL"
+        ),
+        'sqlserver': (
+            "SELECT 1 AS test_column, GETDATE() AS checked_at, "
+            "(SELECT COUNT(*) FROM information_schema.tables) AS table_count"
+        ),
+    }
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test various query types."""
-        try:
-            # Test different types of queries
-            queries_to_test = []
-            connector_type = type(self.connector).__name__
-            
-            if "PostgreSQL" in connector_type:
-                queries_to_test = [
-                    "SELECT 1 as test_column",
-                    "SELECT NOW() as current_time",
-                    "SELECT COUNT(*) FROM information_schema.tables"
-                ]
-            elif "Oracle" in connector_type:
-                queries_to_test = [
-                    "SELECT 1 as test_column FROM DUAL",
-                    "SELECT SYSDATE as current_time FROM DUAL", 
-                    "SELECT COUNT(*) FROM user_tables"
-                ]
-            elif "SQLServer" in connector_type:
-                queries_to_test = [
-                    "SELECT 1 as test_column",
-                    "SELECT GETDATE() as current_time",
-                    "SELECT COUNT(*) FROM information_schema.tables"
-                ]
-            
-            for query in queries_to_test:
-                success, result = self.connector.execute_query(query)
-                if not success:
-                    return False, f"Query test failed: {query} - {result}"
-            
-            return True, f"Queries test passed - {len(queries_to_test)} queries executed successfully"
-            
-        except Exception as e:
-            return False, f"Queries test error: {str(e)}"
+        query = self._COMBINED_QUERIES.get(self.connector.dialect)
+        if query is None:
+            return False, f"Unknown connector type: {type(self.connector).__name__}"
+        
+        success, result = self.connector.execute_query(query)
+        if not success:
+            return False, f"Query test failed: {query} - {result}"
+        
+        if not result or len(result[0]) != 3:
+            return False, "Query test failed: combined query returned no row"
+        
+        return True, "Queries test passed - constant, timestamp and catalog queries executed successfully"
 
 
 class PerformanceTest(DatabaseTest):
     """Test database performance and responsiveness."""
     
+    __slots__ = ('max_execution_time', '_max_execution_ns', '_threshold_error')
+    
+    def __init__(self, environment: str, application: str, parameters: Dict[str, Any] = None,
+                 session: DatabaseSession = None):
+        super().__init__(environment, application, parameters, session)
+        # Maximum allowed query time (default 5 seconds), compared in nanoseconds
+        self._threshold_error = None
+        try:
+            self.max_execution_time = float(self.parameters.get('max_execution_time_ms', 5000))
+            self._max_execution_ns = int(self.max_execution_time * 1_000_000)
+        except (TypeError, ValueError, OverflowError) as e:
+            # Building the test must not raise; an invalid threshold is reported as a FAILED result
+            self.max_execution_time = self._max_execution_ns = None
+            self._threshold_error = str(e)
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test basic performance metrics."""
-        try:
-            import time
-            
-            # Simple performance test - measure query execution time
-            start_time = time.time()
-            success, result = self.connector.execute_query("SELECT 1")
-            end_time = time.time()
-            
-            if not success:
-                return False, f"Performance test query failed: {result}"
-            
-            execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            
-            # Check if execution time is reasonable (less than 5 seconds)
-            max_execution_time = float(self.parameters.get('max_execution_time_ms', 5000))
-            
-            if execution_time > max_execution_time:
-                return False, f"Performance test failed - Query took {execution_time:.2f}ms (max: {max_execution_time}ms)"
-            
-            return True, f"Performance test passed - Query executed in {execution_time:.2f}ms"
-            
-        except Exception as e:
-            return False, f"Performance test error: {str(e)}"
+        if self._threshold_error is not None:
+            return False, f"Performance test error: invalid max_execution_time_ms - {self._threshold_error}"
+        
+        # Simple performance test - measure query execution time
+        start_ns = perf_counter_ns()
+        success, result = self.connector.execute_query("SELECT 1")
+        elapsed_ns = perf_counter_ns() - start_ns
+        
+        if not success:
+            return False, f"Performance test query failed: {result}"
+        
+        execution_time = elapsed_ns / 1_000_000  # Convert to milliseconds
+        
+        if elapsed_ns > self._max_execution_ns:
+            return False, f"Performance test failed - Query took {execution_time:.2f}ms (max: {self.max_execution_time}ms)"
+        
+        return True, f"Performance test passed - Query executed in {execution_time:.2f}ms"
 
 
 class TableExistsTest(DatabaseTest):
     """Test if specific tables exist in the database."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test table existence."""
-        try:
-            # Get table name from parameters or use default
-            table_name = self.parameters.get('table_name', 'test_table')
+        # Get table name from parameters or use default
+        table_name = self.parameters.get('table_name', 'test_table')
+        
+        # Use the connector's table_exists method
+        if hasattr(self.connector, 'table_exists'):
+            exists = self.connector.table_exists(table_name)
             
-            # Use the connector's table_exists method
-            if hasattr(self.connector, 'table_exists'):
-                exists = self.connector.table_exists(table_name)
-                
-                if exists:
-                    return True, f"Table '{table_name}' exists"
-                else:
-                    return False, f"Table '{table_name}' does not exist"
+            if exists:
+                return True, f"Table '{table_name}' exists"
             else:
-                return False, "Connector does not support table_exists method"
-            
-        except Exception as e:
-            return False, f"Table exists test error: {str(e)}"
+                return False, f"Table '{table_name}' does not exist"
+        else:
+            return False, "Connector does not support table_exists method"
 
 
 class TableSelectTest(DatabaseTest):
     """Test data selection from tables."""
     
+    __slots__ = ()
+    
+    _SELECT_TEMPLATES = {
+        'postgresql': "SELECT * FROM {table} LIMIT {limit}",
+        'sqlserver': "SELECT TOP {limit} * FROM {table}",
+        'oracle': "SELECT * FROM {table} WHERE rownum <= {limit}",
+    }
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test table data selection."""
-        try:
-            # Get table name from parameters
-            table_name = self.parameters.get('table_name', 'test_table')
-            limit = self.parameters.get('row_limit', 1)
-            
-            # First check if table exists
-            if hasattr(self.connector, 'table_exists'):
-                if not self.connector.table_exists(table_name):
-                    return False, f"Table '{table_name}' does not exist"
-            
-            # Try to select data
-            query = f"SELECT * FROM {table_name}"
-            
-            # Add LIMIT clause based on database type
-            connector_type = type(self.connector).__name__
-            if "PostgreSQL" in connector_type or "SQLServer" in connector_type:
-                query += f" LIMIT {limit}" if "PostgreSQL" in connector_type else f" TOP {limit}"
-            elif "Oracle" in connector_type:
-                query = f"SELECT * FROM {table_name} WHERE rownum <= {limit}"
-            
-            success, result = self.connector.execute_query(query)
-            
-            if not success:
-                return False, f"Table select failed: {result}"
-            
-            return True, f"Table select successful - Retrieved {len(result) if result else 0} rows"
-            
-        except Exception as e:
-            return False, f"Table select test error: {str(e)}"
+        # Get table name from parameters
+        table_name = self.parameters.get('table_name', 'test_table')
+        limit = self.parameters.get('row_limit', 1)
+        
+        # First check if table exists
+        if hasattr(self.connector, 'table_exists'):
+            if not self.connector.table_exists(table_name):
+                return False, f"Table '{table_name}' does not exist"
+        
+        # Try to select data
+        query = self.build_select_query(self.connector, table_name, limit)
+        
+        success, result = self.connector.execute_query(query)
+        
+        if not success:
+            return False, f"Table select failed: {result}"
+        
+        return True, f"Table select successful - Retrieved {len(result) if result else 0} rows"
+    
+    @staticmethod
+    def build_select_query(connector, table_name: str, limit) -> str:
+        """Build a row-limited SELECT for the connector's database type."""
+        template = TableSelectTest._SELECT_TEMPLATES.get(connector.dialect, "SELECT * FROM {table}")
+        return template.format(table=table_name, limit=int(limit))
 
 
 class TableRowsTest(DatabaseTest):
     """Test table row count operations."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test table row counting."""
-        try:
-            # Get table name from parameters
-            table_name = self.parameters.get('table_name', 'test_table')
-            
-            # First check if table exists
-            if hasattr(self.connector, 'table_exists'):
-                if not self.connector.table_exists(table_name):
-                    return False, f"Table '{table_name}' does not exist"
+        # Get table name from parameters
+        table_name = self.parameters.get('table_name', 'test_table')
+        
+        # First check if table exists
+        if hasattr(self.connector, 'table_exists'):
+            if not self.connector.table_exists(table_name):
+                return False, f"Table '{table_name}' does not exist"
+        
+        # Use connector's get_row_count method if available
+        if hasattr(self.connector, 'get_row_count'):
+            row_count = self.connector.get_row_count(table_name)
+            return True, f"Table '{table_name}' has {row_count} rows"
+        else:
+            # Fallback to manual count query
+            success, result = self.connector.execute_query(f"SELECT COUNT(*) FROM {table_name}")
             
-            # Use connector's get_row_count method if available
-            if hasattr(self.connector, 'get_row_count'):
-                row_count = self.connector.get_row_count(table_name)
-                return True, f"Table '{table_name}' has {row_count} rows"
-            else:
-                # Fallback to manual count query
-                success, result = self.connector.execute_query(f"SELECT COUNT(*) FROM {table_name}")
-                
-                if not success:
-                    return False, f"Row count query failed: {result}"
-                
-                row_count = result[0][0] if result and len(result) > 0 else 0
-                return True, f"Table '{table_name}' has {row_count} rows"
+            if not success:
+                return False, f"Row count query failed: {result}"
             
-        except Exception as e:
-            return False, f"Table rows test error: {str(e)}"
+            row_count = result[0][0] if result and len(result) > 0 else 0
+            return True, f"Table '{table_name}' has {row_count} rows"
 
 
 class TableStructureTest(DatabaseTest):
     """Test table structure and schema information."""
     
+    __slots__ = ()
+    
     def execute_test_logic(self) -> Tuple[bool, str]:
         """Test table structure retrieval."""
-        try:
-            # Get table name from parameters
-            table_name = self.parameters.get('table_name', 'test_table')
-            
-            # First check if table exists
-            if hasattr(self.connector, 'table_exists'):
-                if not self.connector.table_exists(table_name):
-                    return False, f"Table '{table_name}' does not exist"
-            
-            # Get table structure based on database type
-            connector_type = type(self.connector).__name__
-            
-            if "PostgreSQL" in connector_type:
-                # Handle schema-qualified table names (e.g., 'public.products')
-                if '.' in table_name:
-                    schema_name, table_only = table_name.split('.', 1)
-                    # Remove quotes if present and sanitize
-                    schema_name = schema_name.strip('\'"').replace("'", "''")
-                    table_only = table_only.strip('\'"').replace("'", "''")
-                    
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_schema = '{schema_name}' AND table_name = '{table_only}'
-                        ORDER BY ordinal_position
-                    """
-                else:
-                    # No schema specified, use current schema
-                    table_name_clean = table_name.replace("'", "''")
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_name = '{table_name_clean}' AND table_schema = current_schema()
-                        ORDER BY ordinal_position
-                    """
-            elif "Oracle" in connector_type:
-                # Handle schema-qualified table names for Oracle
-                if '.' in table_name:
-                    schema_name, table_only = table_name.split('.', 1)
-                    schema_name = schema_name.strip('\'"').replace("'", "''").upper()
-                    table_only = table_only.strip('\'"').replace("'", "''").upper()
-                    
-                    query = f"""
-                        SELECT column_name, data_type, nullable 
-                        FROM all_tab_columns 
-                        WHERE owner = '{schema_name}' AND table_name = '{table_only}'
-                        ORDER BY column_id
-                    """
-                else:
-                    table_name_clean = table_name.replace("'", "''").upper()
-                    query = f"""
-                        SELECT column_name, data_type, nullable 
-                        FROM user_tab_columns 
-                        WHERE table_name = '{table_name_clean}'
-                        ORDER BY column_id
-                    """
-            elif "SQLServer" in connector_type:
-                # Handle schema-qualified table names for SQL Server
-                if '.' in table_name:
-                    schema_name, table_only = table_name.split('.', 1)
-                    schema_name = schema_name.strip('\'"').replace("'", "''")
-                    table_only = table_only.strip('\'"').replace("'", "''")
-                    
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_schema = '{schema_name}' AND table_name = '{table_only}'
-                        ORDER BY ordinal_position
-                    """
-                else:
-                    table_name_clean = table_name.replace("'", "''")
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable
-                        FROM information_schema.columns 
-                        WHERE table_name = '{table_name_clean}' AND table_schema = SCHEMA_NAME()
-                        ORDER BY ordinal_position
-                    """
+        # Get table name from parameters
+        table_name = self.parameters.get('table_name', 'test_table')
+        
+        # First check if table exists
+        if hasattr(self.connector, 'table_exists'):
+            if not self.connector.table_exists(table_name):
+                return False, f"Table '{table_name}' does not exist"
+        
+        # Get table structure based on database type
+        query = self.build_structure_query(self.connector, table_name)
+        if query is None:
+            return False, f"Unknown connector type: {type(self.connector).__name__}"
+        
+        success, result = self.connector.execute_query(query)
+        
+        if not success:
+            return False, f"Table structure query failed: {result}"
+        
+        if not result:
+            return False, f"No structure information found for table '{table_name}'"
+        
+        column_count = len(result)
+        return True, f"Table '{table_name}' structure retrieved - {column_count} columns found"
+    
+    @staticmethod
+    def build_structure_query(connector, table_name: str, ordered: bool = True):
+        """
+        Build the column metadata query for the connector's database type.
+        
+        Args:
+            ordered: Order the columns by position; subqueries that only count
+                them leave this off (SQL Server rejects ORDER BY in a subquery)
+        
+        Returns:
+            SQL query string, or None for an unknown connector type
+        """
+        connector_type = type(connector).__name__
+        position_order = "ORDER BY ordinal_position" if ordered else ""
+        column_id_order = "ORDER BY column_id" if ordered else ""
+        
+        if "PostgreSQL" in connector_type:
+            # Handle schema-qualified table names (e.g., 'public.products')
+            if '.' in table_name:
+                schema_name, table_only = table_name.split('.', 1)
+                # Remove quotes if present and sanitize
+                schema_name = schema_name.strip('\'"').replace("'", "''")
+                table_only = table_only.strip('\'"').replace("'", "''")
+                
+                query = f"""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_schema = '{schema_name}' AND table_name = '{table_only}'
+                    {position_order}
+                """
             else:
-                return False, f"Unknown connector type: {connector_type}"
-            
-            success, result = self.connector.execute_query(query)
-            
-            if not success:
-                return False, f"Table structure query failed: {result}"
-            
-            if not result:
-                return False, f"No structure information found for table '{table_name}'"
-            
-            column_count = len(result)
-            return True, f"Table '{table_name}' structure retrieved - {column_count} columns found"
-            
-        except Exception as e:
-            return False, f"Table structure test error: {str(e)}"
+                # No schema specified, use current schema
+                table_name_clean = table_name.replace("'", "''")
+                query = f"""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_name = '{table_name_clean}' AND table_schema = current_schema()
+                    {position_order}
+                """
+        elif "Oracle" in connector_type:
+            # Handle schema-qualified table names for Oracle
+            if '.' in table_name:
+                schema_name, table_only = table_name.split('.', 1)
+                schema_name = schema_name.strip('\'"').replace("'", "''").upper()
+                table_only = table_only.strip('\'"').replace("'", "''").upper()
+                
+                query = f"""
+                    SELECT column_name, data_type, nullable 
+                    FROM all_tab_columns 
+                    WHERE owner = '{schema_name}' AND table_name = '{table_only}'
+                    {column_id_order}
+                """
+            else:
+                table_name_clean = table_name.replace("'", "''").upper()
+                query = f"""
+                    SELECT column_name, data_type, nullable 
+                    FROM user_tab_columns 
+                    WHERE table_name = '{table_name_clean}'
+                    {column_id_order}
+                """
+        elif "SQLServer" in connector_type:
+            # Handle schema-qualified table names for SQL Server
+            if '.' in table_name:
+                schema_name, table_only = table_name.split('.', 1)
+                schema_name = schema_name.strip('\'"').replace("'", "''")
+                table_only = table_only.strip('\'"').replace("'", "''")
+                
+                query = f"""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_schema = '{schema_name}' AND table_name = '{table_only}'
+                    {position_order}
+                """
+            else:
+                table_name_clean = table_name.replace("'", "''")
+                query = f"""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_name = '{table_name_clean}' AND table_schema = SCHEMA_NAME()
+                    {position_order}
+                """
+        else:
+            return None
+        
+        return query
+
+
+class TableBundleTest(DatabaseTest):
+    """
+    Run the table select, row count and structure checks together.
+    The three checks are combined into one query, so a healthy table costs a
+    single round trip instead of three separate test setups.
+    """
+    
+    __slots__ = ()
+    
+    # Scalar subqueries for the row-limited select, the row count and the column metadata
+    _BUNDLE_TEMPLATE = (
+        "SELECT (SELECT COUNT(*) FROM ({select}) selected_rows) AS selected_count, "
+        "(SELECT COUNT(*) FROM {table}) AS row_count, "
+        "(SELECT COUNT(*) FROM ({structure}) table_columns) AS column_count"
+    )
+    
+    def execute_test_logic(self) -> Tuple[bool, str]:
+        """Test table selection, row counting and structure retrieval."""
+        # Get table name from parameters
+        table_name = self.parameters.get('table_name', 'test_table')
+        limit = self.parameters.get('row_limit', 1)
+        
+        query = self.build_bundle_query(self.connector, table_name, limit)
+        if query is None:
+            return False, f"Unknown connector type: {type(self.connector).__name__}"
+        
+        success, result = self.connector.execute_query(query)
+        if not success:
+            # Only a failed bundle pays for the existence check, to tell a missing table from other errors
+            if hasattr(self.connector, 'table_exists') and not self.connector.table_exists(table_name):
+                return False, f"Table '{table_name}' does not exist"
+            return False, f"Table bundle query failed: {result}"
+        
+        if not result or len(result[0]) != 3:
+            return False, "Table bundle query failed: combined query returned no row"
+        
+        selected_count, row_count, column_count = result[0]
+        if not column_count:
+            return False, f"No structure information found for table '{table_name}'"
+        
+        return True, (
+            f"Table '{table_name}' bundle passed - Retrieved {selected_count} rows, "
+            f"{row_count} total rows, {column_count} columns found"
+        )
+    
+    @staticmethod
+    def build_bundle_query(connector, table_name: str, limit):
+        """
+        Build the combined select, row count and structure query for the connector's database type.
+        
+        Returns:
+            SQL query string, or None for an unknown connector type
+        """
+        structure_query = TableStructureTest.build_structure_query(connector, table_name, ordered=False)
+        if structure_query is None:
+            return None
+        
+        query = TableBundleTest._BUNDLE_TEMPLATE.format(
+            select=TableSelectTest.build_select_query(connector, table_name, limit),
+            table=table_name,
+            structure=structure_query.strip(),
+        )
+        return f"{query} FROM DUAL" if connector.dialect == 'oracle' else query
+
+
+class TestCategory(IntEnum):
+    """Smoke test categories; values index DatabaseTestFactory._test_classes."""
+    SETUP = 0
+    CONFIGURATION = 1
+    SECURITY = 2
+    CONNECTION = 3
+    QUERIES = 4
+    PERFORMANCE = 5
+    TABLE_EXISTS = 6
+    TABLE_SELECT = 7
+    TABLE_ROWS = 8
+    TABLE_STRUCTURE = 9
+    TABLE_BUNDLE = 10
 
 
 # Test factory to create appropriate test instances
 class DatabaseTestFactory:
     """Factory to create database test instances based on test category."""
     
-    _test_classes = {
-        'SETUP': SetupValidationTest,
-        'CONFIGURATION': ConfigurationTest,
-        'SECURITY': SecurityTest,
-        'CONNECTION': ConnectionTest,
-        'QUERIES': QueriesTest,
-        'PERFORMANCE': PerformanceTest,
-        'TABLE_EXISTS': TableExistsTest,
-        'TABLE_SELECT': TableSelectTest,
-        'TABLE_ROWS': TableRowsTest,
-        'TABLE_STRUCTURE': TableStructureTest,
+    # Ordered by TestCategory value
+    _test_classes = (
+        SetupValidationTest,
+        ConfigurationTest,
+        SecurityTest,
+        ConnectionTest,
+        QueriesTest,
+        PerformanceTest,
+        TableExistsTest,
+        TableSelectTest,
+        TableRowsTest,
+        TableStructureTest,
+        TableBundleTest,
+    )
+    
+    # Upper- and lower-case spellings resolve without normalizing per call
+    _name_to_category = {
+        name: category
+        for category in TestCategory
+        for name in (category.name, category.name.lower())
     }
     
     @classmethod
-    def create_test(cls, test_category: str, environment: str, application: str, parameters: Dict[str, Any] = None) -> DatabaseTest:
+    def create_test(cls, test_category: str, environment: str, application: str, parameters: Dict[str, Any] = None,
+                    session: DatabaseSession = None) -> DatabaseTest:
         """
         Create a database test instance based on test category.
         
@@ -596,16 +813,86 @@ class DatabaseTestFactory:
             environment: Environment name
             application: Application name
             parameters: Additional test parameters
+            session: Optional shared DatabaseSession for the test to run on
             
         Returns:
             DatabaseTest instance or None if category not found
         """
-        test_class = cls._test_classes.get(test_category.upper())
-        if test_class:
-            return test_class(environment, application, parameters)
-        return None
+        category = cls._name_to_category.get(test_category)
+        if category is None:
+            # Mixed-case spellings fall back to normalizing
+            category = cls._name_to_category.get(test_category.upper())
+            if category is None:
+                return None
+        return cls._test_classes[category](environment, application, parameters, session)
+    
+    @classmethod
+    def run_batch(cls, specs: Iterable[Dict[str, Any]]) -> List[TestResult]:
+        """
+        Execute tests sequentially, sharing one connection per (environment, application).
+        
+        Args:
+            specs: Dicts with test_category, environment, application and
+                optional parameters keys (the create_test arguments)
+            
+        Returns:
+            TestResults in the same order as specs
+        """
+        specs = list(specs)
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for index, spec in enumerate(specs):
+            key = (spec['environment'].upper(), spec['application'].upper())
+            groups.setdefault(key, []).append(index)
+        
+        results: List[TestResult] = [None] * len(specs)
+        for indexes in groups.values():
+            first = specs[indexes[0]]
+            with DatabaseSession(first['environment'], first['application']) as session:
+                for index in indexes:
+                    spec = specs[index]
+                    test = cls.create_test(
+                        spec['test_category'],
+                        spec['environment'],
+                        spec['application'],
+                        spec.get('parameters'),
+                        session
+                    )
+                    if not test:
+                        results[index] = TestResult("SKIPPED", f"Unsupported test category '{spec['test_category']}'")
+                    else:
+                        results[index] = test.execute()
+        return results
+    
+    @classmethod
+    async def run_batch_async(cls, specs: Iterable[Dict[str, Any]], limit: int = 200) -> List[TestResult]:
+        """
+        Execute many tests concurrently with at most `limit` in flight.
+        
+        Args:
+            specs: Dicts with test_category, environment, application and
+                optional parameters keys (the create_test arguments)
+            limit: Maximum number of tests running at the same time
+            
+        Returns:
+            TestResults in the same order as specs
+        """
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run_one(spec: Dict[str, Any]) -> TestResult:
+            test = cls.create_test(
+                spec['test_category'],
+                spec['environment'],
+                spec['application'],
+                spec.get('parameters')
+            )
+            if not test:
+                return TestResult("SKIPPED", f"Unsupported test category '{spec['test_category']}'")
+            async with semaphore:
+                return await test.execute_async()
+        
+        return await asyncio.gather(*(run_one(spec) for spec in specs))
     
     @classmethod
     def get_supported_categories(cls) -> list:
         """Get list of supported test categories."""
-        return list(cls._test_classes.keys())
\ No newline at end of file
+        return [category.name for category in TestCategory]
\ No newline at end of file
@@ -1,6 +1,126 @@
+import io
 import os
-import datetime
-from typing import Dict, List, Any
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple, Any
+
+_STATUS_EMOJI = {"PASSED": "✅", "FAILED": "❌", "SKIPPED": "⏭️"}
+# Counter key per exact status; "SKIPPED..." variants are matched by prefix
+_STATUS_BUCKET = {"PASSED": "passed", "FAILED": "failed", "SKIPPED": "skipped"}
+# Row fields add_test_results requires, in add_test_result argument order
+_REQUIRED_ROW_FIELDS = itemgetter("sheet_name", "test_case_id", "test_case_name", "status")
+# Detailed results row, filled from a stored record with its pre-rendered badges
+_ROW_TEMPLATE = "| `{test_case_id}` | {test_case_name} | {_category_badge} | {_status_badge} | `{timestamp}` |\n"
+# Progress bar cells: passed, failed, skipped, remaining
+_BAR_CHARS = ("🟢", "🔴", "🟡", "⚪")
+
+_CATEGORY_TABLE_HEADER = """
+| Category | ✅ Passed | ❌ Failed | ⏭️ Skipped | 📊 Total | Success Rate |
+|----------|-----------|-----------|------------|----------|--------------|
+"""
+
+_HEADER_TEMPLATE = """# 🚀 {title}
+
+> **Generated on:** {timestamp} | **Framework:** Cross Database Validator
+
+---
+
+## 📊 Executive Summary
+
+"""
+
+_PERFORMANCE_TEMPLATE = """
+
+### 🎯 Overall Performance
+- **Success Rate:** {success_rate}
+- **Total Test Cases:** {total}
+- **Execution Status:** {execution_status}
+
+{progress_bar}
+
+---
+
+## 📈 Category Breakdown
+
+"""
+
+_DETAILS_HEADING = """
+
+---
+
+## 📝 Detailed Test Results
+
+"""
+
+_QUICK_STATS_TEMPLATE = """
+
+---
+
+## 🔍 Quick Stats
+
+- 🎯 **Best Performing Category:** {best_category}
+- ⚠️ **Categories Needing Attention:** {failing_categories}
+- ⏱️ **Report Generated:** {timestamp}
+- 🏷️ **Report Version:** Enhanced Markdown v2.0
+"""
+
+_LEGEND = """
+---
+
+## 📋 Legend
+
+| Symbol | Meaning |
+|--------|---------|
+| ✅ | Test Passed Successfully |
+| ❌ | Test Failed |
+| ⏭️ | Test Skipped |
+| 🟢 | Passed Test Block |
+| 🔴 | Failed Test Block |
+| 🟡 | Skipped Test Block |
+| ⚪ | Empty/Remaining Block |
+
+---
+
+*This report was automatically generated by the Cross Database Validator framework.*
+"""
+
+
+def _status_bucket(status_upper: str):
+    """Return the summary counter key for an upper-cased status, or None if it is not counted."""
+    return _STATUS_BUCKET.get(status_upper) or (
+        "skipped" if status_upper.startswith("SKIPPED") else None
+    )
+
+
+def _pct(n: int, d: int) -> str:
+    """Return n as a percentage of d with one decimal, or N/A when d is zero."""
+    return f"{n * 100 / d:.1f}%" if d else "N/A"
+
+
+def _category_row(category: str, stats: Dict[str, int]) -> str:
+    """Return the category breakdown row; the success rate excludes skipped tests."""
+    return "| **{}** | {} | {} | {} | {} | {} |".format(
+        category,
+        stats["passed"],
+        stats["failed"],
+        stats["skipped"],
+        stats["total"],
+        _pct(stats["passed"], stats["passed"] + stats["failed"]),
+    )
+
+
+def _single_status_bar(block: str, count: int, total: int, width: int) -> str:
+    """Return a progress bar showing one status against empty blocks."""
+    blocks = int((count / total) * width)
+    return f"`{block * blocks}{'⚪' * (width - blocks)}`"
+
+
+@lru_cache(maxsize=16)
+def _status_badge(status_upper: str) -> str:
+    """Return the status badge for an upper-cased status; statuses repeat, so cache them."""
+    return f"{_STATUS_EMOJI.get(status_upper, '❓')} **{status_upper}**"
 
 
 class EnhancedMarkdownReportGenerator:
@@ -11,9 +131,22 @@ class EnhancedMarkdownReportGenerator:
     def __init__(self, title="Test Execution Report", output_file="report.md"):
         self.title = title
         self.output_file = output_file
+        self._output_abspath = os.path.abspath(output_file)
         self.test_results = []
         self.summary_stats = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
         self.sheets_data = {}
+        # Last formatted timestamp, reused for results added within the same second
+        self._last_ts_second = -1
+        self._last_ts_str = ""
+        # Aggregates derived from test_results, rebuilt lazily after new results arrive
+        self._aggregates_dirty = True
+        self._category_stats = {}
+        self._sorted_categories = []
+        # Last rendered sections around the per-sheet detail, reused by repeated saves until another
+        # result is added; the joined report is only built when generate_markdown() asks for it
+        self._markdown_dirty = True
+        self._cached_chunks = ([], [])
+        self._cached_markdown = None
 
     def add_test_result(
         self,
@@ -26,42 +159,142 @@ class EnhancedMarkdownReportGenerator:
         error_message: str = "",
     ):
         """Add a test result to the report."""
-        test_result = {
+        test_result = self._make_record(
+            sheet_name,
+            test_case_id,
+            test_case_name,
+            status,
+            category,
+            execution_time,
+            error_message,
+            self._current_timestamp(),
+        )
+        self.test_results.append(test_result)
+
+        # Group by sheet, keeping per-sheet counters alongside the tests
+        sheet = self._get_sheet(sheet_name)
+        sheet["tests"].append(test_result)
+
+        # Update summary and sheet stats
+        self.summary_stats["total"] += 1
+        bucket = _status_bucket(test_result["status"])
+        if bucket:
+            self.summary_stats[bucket] += 1
+            sheet[bucket] += 1
+        self._aggregates_dirty = True
+        self._markdown_dirty = True
+
+    def add_test_results(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Add several test results at once.
+
+        Each row is a dict keyed like the add_test_result arguments; category,
+        execution_time and error_message are optional. Rows in one batch share a timestamp.
+        """
+        timestamp = self._current_timestamp()
+        records = [
+            self._make_record(
+                *_REQUIRED_ROW_FIELDS(row),
+                row.get("category", ""),
+                row.get("execution_time", ""),
+                row.get("error_message", ""),
+                timestamp,
+            )
+            for row in rows
+        ]
+        if not records:
+            return
+        self.test_results.extend(records)
+
+        by_sheet = defaultdict(list)
+        for record in records:
+            by_sheet[record["sheet_name"]].append(record)
+
+        summary_counts = Counter()
+        for sheet_name, sheet_records in by_sheet.items():
+            sheet = self._get_sheet(sheet_name)
+            sheet["tests"].extend(sheet_records)
+            counts = Counter(_status_bucket(record["status"]) for record in sheet_records)
+            counts.pop(None, None)
+            for bucket, count in counts.items():
+                sheet[bucket] += count
+            summary_counts.update(counts)
+
+        self.summary_stats["total"] += len(records)
+        for bucket, count in summary_counts.items():
+            self.summary_stats[bucket] += count
+        self._aggregates_dirty = True
+        self._markdown_dirty = True
+
+    @staticmethod
+    def _make_record(
+        sheet_name, test_case_id, test_case_name, status, category, execution_time, error_message, timestamp
+    ) -> Dict[str, Any]:
+        """Build the stored record for one test result."""
+        status_upper = status.upper()
+        return {
             "sheet_name": sheet_name,
             "test_case_id": test_case_id,
             "test_case_name": test_case_name,
-            "status": status.upper(),
+            "status": status_upper,  # Stored upper-cased for badge and counter lookups
             "category": category,
             "execution_time": execution_time,
             "error_message": error_message,
-            "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
+            # Pre-rendered cells for the detailed results table
+            "_status_badge": _status_badge(status_upper),
+            "_category_badge": f"`{category}`" if category else "N/A",
+            # Status before any colon, used as the category breakdown counter key
+            "_status_key": status_upper.partition(":")[0].lower(),
         }
 
-        self.test_results.append(test_result)
+    def _get_sheet(self, sheet_name: str) -> Dict[str, Any]:
+        """Return the sheet entry holding its tests and per-sheet counters, creating it if needed."""
+        sheet = self.sheets_data.get(sheet_name)
+        if sheet is None:
+            sheet = self.sheets_data[sheet_name] = {
+                "tests": [],
+                "passed": 0,
+                "failed": 0,
+                "skipped": 0,
+            }
+        return sheet
+
+    def _current_timestamp(self) -> str:
+        """Return the current local time, formatting at most once per second."""
+        now = time.time()
+        second = int(now)
+        if second != self._last_ts_second:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_ts_second = second
+        return self._last_ts_str
+
+    def _compute_aggregates(self):
+        """Scan test results once to build the per-category aggregates."""
+        if not self._aggregates_dirty:
+            return
+
+        category_stats = defaultdict(
+            lambda: {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+        )
+        for result in self.test_results:
+            stats = category_stats[result["category"] or "Unknown"]
+            bucket = result["_status_key"]
+            if bucket in ("passed", "failed", "skipped"):
+                stats[bucket] += 1
+            stats["total"] += 1
 
-        # Update summary stats
-        self.summary_stats["total"] += 1
-        if status.upper() == "PASSED":
-            self.summary_stats["passed"] += 1
-        elif status.upper() == "FAILED":
-            self.summary_stats["failed"] += 1
-        elif status.upper().startswith("SKIPPED"):
-            self.summary_stats["skipped"] += 1
-
-        # Group by sheet
-        if sheet_name not in self.sheets_data:
-            self.sheets_data[sheet_name] = []
-        self.sheets_data[sheet_name].append(test_result)
+        self._category_stats = category_stats
+        self._sorted_categories = sorted(category_stats)
+        self._aggregates_dirty = False
 
     def _get_status_emoji(self, status: str) -> str:
         """Return emoji for status."""
-        emoji_map = {"PASSED": "✅", "FAILED": "❌", "SKIPPED": "⏭️"}
-        return emoji_map.get(status.upper(), "❓")
+        return _STATUS_EMOJI.get(status.upper(), "❓")
 
     def _get_status_badge(self, status: str) -> str:
         """Return status badge with emoji."""
-        emoji = self._get_status_emoji(status)
-        return f"{emoji} **{status.upper()}**"
+        return _status_badge(status.upper())
 
     def _generate_progress_bar(
         self, passed: int, failed: int, skipped: int, total: int, width: int = 50
@@ -75,96 +308,81 @@ class EnhancedMarkdownReportGenerator:
         skipped_blocks = int((skipped / total) * width)
         remaining = width - (passed_blocks + failed_blocks + skipped_blocks)
 
-        progress = (
-            "🟢" * passed_blocks
-            + "🔴" * failed_blocks
-            + "🟡" * skipped_blocks
-            + "⚪" * remaining
+        passed_char, failed_char, skipped_char, empty_char = _BAR_CHARS
+        return "".join(
+            (
+                "`",
+                passed_char * passed_blocks,
+                failed_char * failed_blocks,
+                skipped_char * skipped_blocks,
+                empty_char * remaining,
+                "`",
+            )
         )
 
-        return f"`{progress}`"
-
     def _generate_summary_table(self) -> str:
         """Generate summary statistics table."""
         total = self.summary_stats["total"]
         if total == 0:
             return "No test results to display."
 
-        passed_pct = (self.summary_stats["passed"] / total) * 100
-        failed_pct = (self.summary_stats["failed"] / total) * 100
-        skipped_pct = (self.summary_stats["skipped"] / total) * 100
+        passed = self.summary_stats["passed"]
+        failed = self.summary_stats["failed"]
+        skipped = self.summary_stats["skipped"]
+        # Single-status rows only need one colored run plus padding
+        passed_bar = _single_status_bar("🟢", passed, total, 20)
+        failed_bar = _single_status_bar("🔴", failed, total, 20)
+        skipped_bar = _single_status_bar("🟡", skipped, total, 20)
+        total_bar = self._generate_progress_bar(passed, failed, skipped, total, 20)
 
         return f"""
 | Status | Count | Percentage | Visual |
 |--------|-------|------------|---------|
-| ✅ **Passed** | {self.summary_stats['passed']} | {passed_pct:.1f}% | {self._generate_progress_bar(self.summary_stats['passed'], 0, 0, total, 20)} |
-| ❌ **Failed** | {self.summary_stats['failed']} | {failed_pct:.1f}% | {self._generate_progress_bar(0, self.summary_stats['failed'], 0, total, 20)} |
-| ⏭️ **Skipped** | {self.summary_stats['skipped']} | {skipped_pct:.1f}% | {self._generate_progress_bar(0, 0, self.summary_stats['skipped'], total, 20)} |
-| 📊 **Total** | {total} | 100.0% | {self._generate_progress_bar(self.summary_stats['passed'], self.summary_stats['failed'], self.summary_stats['skipped'], total, 20)} |
+| ✅ **Passed** | {passed} | {_pct(passed, total)} | {passed_bar} |
+| ❌ **Failed** | {failed} | {_pct(failed, total)} | {failed_bar} |
+| ⏭️ **Skipped** | {skipped} | {_pct(skipped, total)} | {skipped_bar} |
+| 📊 **Total** | {total} | 100.0% | {total_bar} |
 """
 
     def _generate_category_breakdown(self) -> str:
         """Generate category breakdown table."""
-        category_stats = {}
-        for result in self.test_results:
-            category = result["category"] or "Unknown"
-            if category not in category_stats:
-                category_stats[category] = {
-                    "passed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total": 0,
-                }
-
-            status = (
-                result["status"].split(":")[0].lower()
-            )  # Extract status before any colon
-            category_stats[category][status] += 1
-            category_stats[category]["total"] += 1
+        self._compute_aggregates()
+        category_stats = self._category_stats
 
         if not category_stats:
             return "No category data available."
 
-        table = """
-| Category | ✅ Passed | ❌ Failed | ⏭️ Skipped | 📊 Total | Success Rate |
-|----------|-----------|-----------|------------|----------|--------------|
-"""
-
-        for category, stats in sorted(category_stats.items()):
-            # Calculate success rate excluding skipped tests
-            executed_tests = stats["passed"] + stats["failed"]
-            if executed_tests > 0:
-                success_rate = stats["passed"] / executed_tests * 100
-                success_rate_text = f"{success_rate:.1f}%"
-            else:
-                success_rate_text = "N/A"
-            table += f"| **{category}** | {stats['passed']} | {stats['failed']} | {stats['skipped']} | {stats['total']} | {success_rate_text} |\n"
+        rows = [
+            _category_row(category, category_stats[category])
+            for category in self._sorted_categories
+        ]
 
-        return table
+        return _CATEGORY_TABLE_HEADER + "\n".join(rows) + "\n"
 
     def _generate_sheet_summary(self) -> str:
         """Generate per-sheet summary."""
+        out = io.StringIO()
+        self._write_sheet_summary(out)
+        return out.getvalue()
+
+    def _write_sheet_summary(self, out) -> None:
+        """Write the per-sheet summary to a text stream."""
         if not self.sheets_data:
-            return "No sheet data available."
-
-        summary = ""
-        for sheet_name, tests in self.sheets_data.items():
-            sheet_passed = sum(1 for test in tests if test["status"] == "PASSED")
-            sheet_failed = sum(1 for test in tests if test["status"] == "FAILED")
-            sheet_skipped = sum(
-                1 for test in tests if test["status"].upper().startswith("SKIPPED")
-            )
+            out.write("No sheet data available.")
+            return
+
+        for sheet_name, sheet in self.sheets_data.items():
+            tests = sheet["tests"]
+            sheet_passed = sheet["passed"]
+            sheet_failed = sheet["failed"]
+            sheet_skipped = sheet["skipped"]
             sheet_total = len(tests)
 
             # Calculate success rate excluding skipped tests
-            sheet_executed = sheet_passed + sheet_failed
-            if sheet_executed > 0:
-                success_rate = sheet_passed / sheet_executed * 100
-                success_rate_text = f"{success_rate:.1f}%"
-            else:
-                success_rate_text = "N/A"
-
-            summary += f"""
+            success_rate_text = _pct(sheet_passed, sheet_passed + sheet_failed)
+
+            out.write(
+                f"""
 ### 📋 {sheet_name}
 
 **Summary:** {sheet_total} tests | ✅ {sheet_passed} passed | ❌ {sheet_failed} failed | ⏭️ {sheet_skipped} skipped | Success Rate: **{success_rate_text}**
@@ -174,26 +392,49 @@ class EnhancedMarkdownReportGenerator:
 | Test ID | Test Case | Category | Status | Timestamp |
 |---------|-----------|----------|---------|-----------|
 """
+            )
 
-            for test in tests:
-                status_badge = self._get_status_badge(test["status"])
-                category_badge = f"`{test['category']}`" if test["category"] else "N/A"
-                summary += f"| `{test['test_case_id']}` | {test['test_case_name']} | {category_badge} | {status_badge} | `{test['timestamp']}` |\n"
-
-            summary += "\n---\n"
+            out.writelines(_ROW_TEMPLATE.format_map(test) for test in tests)
 
-        return summary
+            out.write("\n---\n")
 
     def generate_markdown(self) -> str:
-        """Generate the complete enhanced Markdown report."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
+        """Generate the complete enhanced Markdown report, reusing it while no results were added."""
+        self._report_chunks()
+        if self._cached_markdown is None:
+            out = io.StringIO()
+            self._write_markdown(out)
+            self._cached_markdown = out.getvalue()
+        return self._cached_markdown
+
+    def _write_markdown(self, out) -> None:
+        """Write the complete report to a text stream, streaming the per-sheet detail between the cached sections."""
+        before_details, after_details = self._report_chunks()
+        out.writelines(before_details)
+        self._write_sheet_summary(out)
+        out.writelines(after_details)
+
+    def _report_chunks(self) -> Tuple[List[str], List[str]]:
+        """Return the cached report sections, re-rendering them only after results were added."""
+        if self._markdown_dirty:
+            self._cached_chunks = self._markdown_chunks()
+            self._cached_markdown = None
+            self._markdown_dirty = False
+        return self._cached_chunks
+
+    def _markdown_chunks(self) -> Tuple[List[str], List[str]]:
+        """Return the independently rendered sections before and after the per-sheet detail."""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+        passed = self.summary_stats["passed"]
+        failed = self.summary_stats["failed"]
+        skipped = self.summary_stats["skipped"]
         total = self.summary_stats["total"]
         # Calculate success rate excluding skipped tests (passed / (passed + failed))
-        executed_tests = self.summary_stats["passed"] + self.summary_stats["failed"]
+        executed_tests = passed + failed
         if executed_tests > 0:
-            passed_pct = self.summary_stats["passed"] / executed_tests * 100
-            success_rate_text = f"{passed_pct:.1f}%"
+            passed_pct = passed * 100 / executed_tests
+            success_rate_text = _pct(passed, executed_tests)
             execution_status = (
                 "🟢 HEALTHY"
                 if passed_pct >= 80
@@ -201,128 +442,65 @@ class EnhancedMarkdownReportGenerator:
             )
         else:
             # All tests were skipped - no actual execution to evaluate
-            passed_pct = 0  # For visual progress bar
             success_rate_text = "N/A (All tests skipped)"
             execution_status = "⚪ NO EXECUTION"
 
-        # Header with better styling
-        markdown_content = f"""# 🚀 {self.title}
-
-> **Generated on:** {timestamp} | **Framework:** Cross Database Validator
-
----
-
-## 📊 Executive Summary
-
-{self._generate_summary_table()}
-
-### 🎯 Overall Performance
-- **Success Rate:** {success_rate_text}
-- **Total Test Cases:** {total}
-- **Execution Status:** {execution_status}
-
-{self._generate_progress_bar(self.summary_stats['passed'], self.summary_stats['failed'], self.summary_stats['skipped'], total, 50)}
-
----
-
-## 📈 Category Breakdown
-
-{self._generate_category_breakdown()}
-
----
-
-## 📝 Detailed Test Results
-
-{self._generate_sheet_summary()}
-
----
-
-## 🔍 Quick Stats
-
-- 🎯 **Best Performing Category:** {self._get_best_category()}
-- ⚠️ **Categories Needing Attention:** {self._get_failing_categories()}
-- ⏱️ **Report Generated:** {timestamp}
-- 🏷️ **Report Version:** Enhanced Markdown v2.0
-
----
-
-## 📋 Legend
-
-| Symbol | Meaning |
-|--------|---------|
-| ✅ | Test Passed Successfully |
-| ❌ | Test Failed |
-| ⏭️ | Test Skipped |
-| 🟢 | Passed Test Block |
-| 🔴 | Failed Test Block |
-| 🟡 | Skipped Test Block |
-| ⚪ | Empty/Remaining Block |
-
----
-
-*This report was automatically generated by the Cross Database Validator framework.*
-"""
-
-        return markdown_content
+        before_details = [
+            _HEADER_TEMPLATE.format(title=self.title, timestamp=timestamp),
+            self._generate_summary_table(),
+            _PERFORMANCE_TEMPLATE.format(
+                success_rate=success_rate_text,
+                total=total,
+                execution_status=execution_status,
+                progress_bar=self._generate_progress_bar(passed, failed, skipped, total, 50),
+            ),
+            self._generate_category_breakdown(),
+            _DETAILS_HEADING,
+        ]
+        # The per-sheet detail grows with the number of tests, so it is written separately
+        after_details = [
+            _QUICK_STATS_TEMPLATE.format(
+                best_category=self._get_best_category(),
+                failing_categories=self._get_failing_categories(),
+                timestamp=timestamp,
+            ),
+            _LEGEND,
+        ]
+        return before_details, after_details
 
     def _get_best_category(self) -> str:
         """Get the best performing category."""
-        category_stats = {}
-        for result in self.test_results:
-            category = result["category"] or "Unknown"
-            if category not in category_stats:
-                category_stats[category] = {"passed": 0, "total": 0}
-
-            if result["status"] == "PASSED":
-                category_stats[category]["passed"] += 1
-            category_stats[category]["total"] += 1
-
-        best_category = "None"
-        best_rate = 0
-
-        for category, stats in category_stats.items():
-            if stats["total"] > 0:
-                rate = (stats["passed"] / stats["total"]) * 100
-                if rate > best_rate:
-                    best_rate = rate
-                    best_category = category
-
-        return (
-            f"{best_category} ({best_rate:.1f}%)" if best_category != "None" else "None"
+        self._compute_aggregates()
+        if not self._category_stats:
+            return "None"
+
+        category, stats = max(
+            self._category_stats.items(),
+            key=lambda item: item[1]["passed"] / item[1]["total"],
         )
+        if stats["passed"] == 0:
+            return "None"
+        return f"{category} ({_pct(stats['passed'], stats['total'])})"
 
     def _get_failing_categories(self) -> str:
         """Get categories with failures."""
-        category_stats = {}
-        for result in self.test_results:
-            category = result["category"] or "Unknown"
-            if category not in category_stats:
-                category_stats[category] = {"failed": 0, "total": 0}
-
-            if result["status"] == "FAILED":
-                category_stats[category]["failed"] += 1
-            category_stats[category]["total"] += 1
-
-        failing_categories = []
-        for category, stats in category_stats.items():
-            if stats["failed"] > 0:
-                fail_rate = (stats["failed"] / stats["total"]) * 100
-                failing_categories.append(
-                    f"{category} ({stats['failed']} failures, {fail_rate:.1f}%)"
-                )
-
+        self._compute_aggregates()
+        failing_categories = [
+            f"{category} ({stats['failed']} failures, {_pct(stats['failed'], stats['total'])})"
+            for category, stats in self._category_stats.items()
+            if stats["failed"] > 0
+        ]
         return ", ".join(failing_categories) if failing_categories else "None 🎉"
 
     def save(self) -> bool:
         """Save the enhanced Markdown report to file."""
         try:
-            markdown_content = self.generate_markdown()
-            output_path = os.path.abspath(self.output_file)
-
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            # Sections and per-sheet rows go straight into a large write buffer instead of one
+            # joined string; repeated saves without new results reuse the cached sections
+            with open(self.output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                self._write_markdown(f)
 
-            print(f"🎉 Enhanced Markdown Report saved successfully to: `{output_path}`")
+            print(f"🎉 Enhanced Markdown Report saved successfully to: `{self._output_abspath}`")
             return True
         except Exception as e:
             print(f"🛑 Error saving enhanced Markdown report: {e}")
@@ -1,63 +1,246 @@
 import os
+import base64
+import gzip
 import json
+import hashlib
+import heapq
+import html
+import shutil
+import string
+import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache, partial
+from typing import Dict, Any, Tuple
 
+import pandas as pd
 
-class EnhancedTrendsHTMLReportGenerator:
-    """
-    Generates comprehensive interactive HTML reports for test execution trends analysis.
-    Features tab-based navigation, drill-down capabilities, and time-series visualizations.
-    """
+try:
+    import orjson
+except ImportError:
+    # Optional: the standard json module is used when orjson is not installed
+    orjson = None
+
+# Dashboard stylesheet, written once next to the reports and linked from each page
+_DASHBOARD_CSS_FILE = "trends_dashboard.css"
+_DASHBOARD_CSS = """body {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+}
+
+.dashboard-container {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
+    backdrop-filter: blur(10px);
+    margin: 20px;
+    padding: 30px;
+    max-width: 95%;
+}
+
+.chart-container {
+    background: white;
+    border-radius: 15px;
+    padding: 25px;
+    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.08);
+    margin-bottom: 25px;
+}
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 15px;
+    padding: 20px;
+    text-align: center;
+    margin-bottom: 20px;
+}
+
+.nav-tabs .nav-link {
+    border-radius: 10px;
+    margin-right: 10px;
+    font-weight: 500;
+}
+
+.nav-tabs .nav-link.active {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-color: transparent;
+    color: white;
+}
+
+.table-container {
+    max-height: 400px;
+    overflow-y: auto;
+    border-radius: 10px;
+}
+
+.drill-down-btn {
+    cursor: pointer;
+    color: #007bff;
+    text-decoration: underline;
+}
+
+.drill-down-btn:hover {
+    color: #0056b3;
+}
+
+.collapse-content {
+    background: #f8f9fa;
+    border-radius: 10px;
+    padding: 15px;
+    margin-top: 10px;
+}
+
+.chart-canvas {
+    height: 300px !important;
+}
+
+.time-chart {
+    height: 400px !important;
+}
+
+/* Enhanced Filter Styles */
+.filters-container {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-radius: 20px;
+    overflow: hidden;
+    box-shadow: 0 15px 35px rgba(102, 126, 234, 0.3);
+    margin-bottom: 30px;
+}
+
+.filters-header {
+    background: rgba(255, 255, 255, 0.1);
+    padding: 20px 30px;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.2);
+    backdrop-filter: blur(10px);
+}
+
+.filter-icon-wrapper {
+    background: rgba(255, 255, 255, 0.2);
+    width: 50px;
+    height: 50px;
+    border-radius: 15px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: white;
+    font-size: 20px;
+}
+
+.filters-title {
+    color: white;
+    font-weight: 600;
+    font-size: 1.5rem;
+}
+
+.filters-subtitle {
+    color: rgba(255, 255, 255, 0.8);
+    font-size: 0.9rem;
+}
+
+.filter-clear-btn {
+    border: 1px solid rgba(255, 255, 255, 0.3);
+    background: rgba(255, 255, 255, 0.1);
+    color: white;
+    transition: all 0.3s ease;
+    backdrop-filter: blur(10px);
+}
+
+.filter-clear-btn:hover {
+    background: rgba(255, 255, 255, 0.2);
+    border-color: rgba(255, 255, 255, 0.5);
+    color: white;
+    transform: translateY(-2px);
+}
+
+.filters-content {
+    padding: 30px;
+    background: white;
+}
+
+.filter-group {
+    position: relative;
+}
+
+.filter-label {
+    display: flex;
+    align-items: center;
+    margin-bottom: 10px;
+    font-weight: 600;
+    color: #495057;
+}
+
+.filter-label label {
+    margin-bottom: 0;
+    margin-left: 5px;
+}
+
+.filter-select {
+    border: 2px solid #e9ecef;
+    border-radius: 12px;
+    padding: 12px 16px;
+    font-size: 0.95rem;
+    transition: all 0.3s ease;
+    background: #f8f9fa;
+}
+
+.filter-select:focus {
+    border-color: #667eea;
+    box-shadow: 0 0 0 0.2rem rgba(102, 126, 234, 0.15);
+    background: white;
+}
+
+.filter-select:hover {
+    background: white;
+    border-color: #667eea;
+}
+
+.filter-status-container {
+    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+    border-radius: 15px;
+    padding: 15px 20px;
+    border: 1px solid #dee2e6;
+}
+
+.filter-status-wrapper {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.filter-status-text {
+    color: #6c757d;
+    font-weight: 500;
+    font-size: 0.95rem;
+}
+
+.filter-status-text.active {
+    color: #667eea;
+    font-weight: 600;
+}
+
+@media (max-width: 768px) {
+    .filters-header {
+        padding: 15px 20px;
+    }
     
-    def __init__(self, execution_history: list = None, output_file: str = None):
-        self.execution_history = execution_history or []
-        if not output_file:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            self.output_file = f"output/Enhanced_Test_Trends_Report_{timestamp}.html"
-        else:
-            self.output_file = output_file
+    .filters-content {
+        padding: 20px;
+    }
     
-    def generate_comprehensive_trends_report(self, trends_data: Dict, output_file: str = None) -> str:
-        """
-        Generate comprehensive HTML trends report from persistent data.
-        
-        Args:
-            trends_data: Comprehensive trends data from PersistentTrendsAnalyzer
-            output_file: Optional specific output file path to override default
-            
-        Returns:
-            str: Path to the generated HTML report
-        """
-        print("🌐 Generating comprehensive interactive trends dashboard...")
-        
-        # Use provided output file or default
-        if output_file:
-            self.output_file = output_file
-        
-        # Generate HTML content from persistent trends data
-        html_content = self._generate_comprehensive_html_content(trends_data)
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        
-        # Save report
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return self.output_file
+    .filter-icon-wrapper {
+        width: 40px;
+        height: 40px;
+        font-size: 16px;
+    }
     
-    def _generate_comprehensive_html_content(self, trends_data: Dict) -> str:
-        """Generate comprehensive HTML content from persistent trends data."""
-        metadata = trends_data.get('metadata', {})
-        overall_trends = trends_data.get('overall_trends', {})
-        time_trends = trends_data.get('time_based_trends', {})
-        sheet_trends = trends_data.get('sheet_level_trends', {})
-        category_trends = trends_data.get('category_level_trends', {})
-        individual_trends = trends_data.get('individual_test_trends', {})
-        insights = trends_data.get('insights', [])
-        
-        return f"""
+    .filters-title {
+        font-size: 1.25rem;
+    }
+}
+"""
+
+# Dashboard page in str.format syntax; literal CSS/JS braces are doubled
+_DASHBOARD_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -68,223 +251,7 @@ class EnhancedTrendsHTMLReportGenerator:
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/date-fns@2.29.3/index.min.js"></script>
-    <style>
-        body {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }}
-        
-        .dashboard-container {{
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-            backdrop-filter: blur(10px);
-            margin: 20px;
-            padding: 30px;
-            max-width: 95%;
-        }}
-        
-        .chart-container {{
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.08);
-            margin-bottom: 25px;
-        }}
-        
-        .metric-card {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 15px;
-            padding: 20px;
-            text-align: center;
-            margin-bottom: 20px;
-        }}
-        
-        .nav-tabs .nav-link {{
-            border-radius: 10px;
-            margin-right: 10px;
-            font-weight: 500;
-        }}
-        
-        .nav-tabs .nav-link.active {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-color: transparent;
-            color: white;
-        }}
-        
-        .table-container {{
-            max-height: 400px;
-            overflow-y: auto;
-            border-radius: 10px;
-        }}
-        
-        .drill-down-btn {{
-            cursor: pointer;
-            color: #007bff;
-            text-decoration: underline;
-        }}
-        
-        .drill-down-btn:hover {{
-            color: #0056b3;
-        }}
-        
-        .collapse-content {{
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 15px;
-            margin-top: 10px;
-        }}
-        
-        .chart-canvas {{
-            height: 300px !important;
-        }}
-        
-        .time-chart {{
-            height: 400px !important;
-        }}
-        
-        /* Enhanced Filter Styles */
-        .filters-container {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 20px;
-            overflow: hidden;
-            box-shadow: 0 15px 35px rgba(102, 126, 234, 0.3);
-            margin-bottom: 30px;
-        }}
-        
-        .filters-header {{
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px 30px;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.2);
-            backdrop-filter: blur(10px);
-        }}
-        
-        .filter-icon-wrapper {{
-            background: rgba(255, 255, 255, 0.2);
-            width: 50px;
-            height: 50px;
-            border-radius: 15px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 20px;
-        }}
-        
-        .filters-title {{
-            color: white;
-            font-weight: 600;
-            font-size: 1.5rem;
-        }}
-        
-        .filters-subtitle {{
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 0.9rem;
-        }}
-        
-        .filter-clear-btn {{
-            border: 1px solid rgba(255, 255, 255, 0.3);
-            background: rgba(255, 255, 255, 0.1);
-            color: white;
-            transition: all 0.3s ease;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .filter-clear-btn:hover {{
-            background: rgba(255, 255, 255, 0.2);
-            border-color: rgba(255, 255, 255, 0.5);
-            color: white;
-            transform: translateY(-2px);
-        }}
-        
-        .filters-content {{
-            padding: 30px;
-            background: white;
-        }}
-        
-        .filter-group {{
-            position: relative;
-        }}
-        
-        .filter-label {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 10px;
-            font-weight: 600;
-            color: #495057;
-        }}
-        
-        .filter-label label {{
-            margin-bottom: 0;
-            margin-left: 5px;
-        }}
-        
-        .filter-select {{
-            border: 2px solid #e9ecef;
-            border-radius: 12px;
-            padding: 12px 16px;
-            font-size: 0.95rem;
-            transition: all 0.3s ease;
-            background: #f8f9fa;
-        }}
-        
-        .filter-select:focus {{
-            border-color: #667eea;
-            box-shadow: 0 0 0 0.2rem rgba(102, 126, 234, 0.15);
-            background: white;
-        }}
-        
-        .filter-select:hover {{
-            background: white;
-            border-color: #667eea;
-        }}
-        
-        .filter-status-container {{
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            border-radius: 15px;
-            padding: 15px 20px;
-            border: 1px solid #dee2e6;
-        }}
-        
-        .filter-status-wrapper {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .filter-status-text {{
-            color: #6c757d;
-            font-weight: 500;
-            font-size: 0.95rem;
-        }}
-        
-        .filter-status-text.active {{
-            color: #667eea;
-            font-weight: 600;
-        }}
-        
-        @media (max-width: 768px) {{
-            .filters-header {{
-                padding: 15px 20px;
-            }}
-            
-            .filters-content {{
-                padding: 20px;
-            }}
-            
-            .filter-icon-wrapper {{
-                width: 40px;
-                height: 40px;
-                font-size: 16px;
-            }}
-            
-            .filters-title {{
-                font-size: 1.25rem;
-            }}
-        }}
-    </style>
+    <link href="trends_dashboard.css" rel="stylesheet">
 </head>
 <body>
     <div class="dashboard-container">
@@ -300,38 +267,11 @@ class EnhancedTrendsHTMLReportGenerator:
         </div>
 
         <!-- Filters Section -->
-        {self._generate_filters_section(trends_data.get('filter_data', {}))}
+        {filters_section}
 
         <!-- Key Metrics Row -->
         <div class="row mb-4">
-            <div class="col-md-3">
-                <div class="metric-card">
-                    <h3><i class="fas fa-play-circle"></i></h3>
-                    <h4>{metadata.get('total_executions', 0)}</h4>
-                    <p>Total Executions</p>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card">
-                    <h3><i class="fas fa-calendar-alt"></i></h3>
-                    <h4>{metadata.get('date_range', {}).get('span_days', 0)} Days</h4>
-                    <p>History Span</p>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card">
-                    <h3><i class="fas fa-percentage"></i></h3>
-                    <h4>{overall_trends.get('overall_passed_rate', 0):.1f}%</h4>
-                    <p>Overall Success Rate</p>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="metric-card">
-                    <h3><i class="fas fa-clock"></i></h3>
-                    <h4>{overall_trends.get('avg_execution_time_ms', 0):.0f}ms</h4>
-                    <p>Avg Execution Time</p>
-                </div>
-            </div>
+{metric_cards}
         </div>
 
         <!-- Filters Section -->
@@ -344,28 +284,28 @@ class EnhancedTrendsHTMLReportGenerator:
                             <label for="applicationFilter" class="form-label"><i class="fas fa-cube"></i> Application</label>
                             <select class="form-select" id="applicationFilter" onchange="applyFilters()">
                                 <option value="">All Applications</option>
-                                {self._generate_application_options(trends_data.get('filter_data', {}))}
+                                {application_options}
                             </select>
                         </div>
                         <div class="col-md-3">
                             <label for="environmentFilter" class="form-label"><i class="fas fa-server"></i> Environment</label>
                             <select class="form-select" id="environmentFilter" onchange="applyFilters()">
                                 <option value="">All Environments</option>
-                                {self._generate_environment_options(trends_data.get('filter_data', {}))}
+                                {environment_options}
                             </select>
                         </div>
                         <div class="col-md-3">
                             <label for="sourceFilter" class="form-label"><i class="fas fa-arrow-right"></i> Source DB</label>
                             <select class="form-select" id="sourceFilter" onchange="applyFilters()">
                                 <option value="">All Source DBs</option>
-                                {self._generate_source_db_options(trends_data.get('filter_data', {}))}
+                                {source_db_options}
                             </select>
                         </div>
                         <div class="col-md-3">
                             <label for="targetFilter" class="form-label"><i class="fas fa-bullseye"></i> Target DB</label>
                             <select class="form-select" id="targetFilter" onchange="applyFilters()">
                                 <option value="">All Target DBs</option>
-                                {self._generate_target_db_options(trends_data.get('filter_data', {}))}
+                                {target_db_options}
                             </select>
                         </div>
                     </div>
@@ -387,7 +327,7 @@ class EnhancedTrendsHTMLReportGenerator:
                 <div class="chart-container">
                     <h3 class="mb-3"><i class="fas fa-lightbulb text-warning"></i> Key Insights</h3>
                     <div class="row">
-                        {''.join([f'<div class="col-md-6"><div class="alert alert-info mb-2">{insight}</div></div>' for insight in insights[:6]])}
+                        {insights}
                     </div>
                 </div>
             </div>
@@ -484,265 +424,445 @@ class EnhancedTrendsHTMLReportGenerator:
 
             <!-- Sheets Tab -->
             <div class="tab-pane fade" id="sheets" role="tabpanel">
-                {self._generate_sheet_analysis_content(sheet_trends)}
+                {sheet_analysis}
             </div>
 
             <!-- Categories Tab -->
             <div class="tab-pane fade" id="categories" role="tabpanel">
-                {self._generate_category_analysis_content(category_trends)}
+                {category_analysis}
             </div>
 
             <!-- Individual Tests Tab -->
             <div class="tab-pane fade" id="individual" role="tabpanel">
-                {self._generate_individual_tests_content(individual_trends)}
+                {individual_tests}
             </div>
         </div>
 
         <div class="text-center mt-5 pt-4 border-top">
             <p class="text-muted">
-                <i class="fas fa-clock"></i> Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} |
+                <i class="fas fa-clock"></i> Generated on {generated_on} |
                 <i class="fas fa-database"></i> Persistent Data Source |
                 <i class="fas fa-info-circle"></i> Click on charts and tables for detailed drill-down
             </p>
         </div>
     </div>
 
+    <script type="application/json" id="trendsData">{trends_json}</script>
+
     <script>
-        // Global data
-        const trendsData = {json.dumps(trends_data)};
+        // Global data, parsed by the browser's JSON parser from the data block above
+        const trendsData = JSON.parse(document.getElementById('trendsData').textContent);
         
-        {self._generate_javascript_charts(trends_data)}
+        {javascript_charts}
     </script>
 
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
 </body>
 </html>
 """
-    
-    def _generate_sheet_analysis_content(self, sheet_trends: Dict) -> str:
-        """Generate detailed sheet analysis content."""
-        content = '''
-        <div class="row">
+
+# (literal_text, field_name, format_spec, conversion) parts, parsed once so pages can be streamed
+_DASHBOARD_PARTS = tuple(string.Formatter().parse(_DASHBOARD_TEMPLATE))
+
+# Smart Filters panel above the dashboard; only the four option lists vary between reports
+_FILTERS_SECTION_TEMPLATE = """
+        <div class="row mb-5">
             <div class="col-12">
-                <div class="chart-container">
-                    <h4><i class="fas fa-layer-group text-success"></i> Sheet Performance Analysis</h4>
-                    <div class="table-container">
-                        <table class="table table-hover">
-                            <thead class="table-dark">
-                                <tr>
-                                    <th>Sheet Name</th>
-                                    <th>Success Rate</th>
-                                    <th>Total Executions</th>
-                                    <th>Avg Execution Time</th>
-                                    <th>Actions</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-        '''
-        
-        for sheet_name, data in sheet_trends.items():
-            success_rate = data.get('overall_passed_rate', 0)
-            total_exec = data.get('total_executions', 0)
-            avg_time = data.get('avg_execution_time_ms', 0)
-            
-            status_class = 'success' if success_rate >= 90 else 'warning' if success_rate >= 70 else 'danger'
-            
-            content += f'''
-                            <tr>
-                                <td><strong>{sheet_name}</strong></td>
-                                <td><span class="badge bg-{status_class}">{success_rate:.1f}%</span></td>
-                                <td>{total_exec}</td>
-                                <td>{avg_time:.0f}ms</td>
-                                <td>
-                                    <span class="drill-down-btn" data-bs-toggle="collapse" data-bs-target="#sheet-{sheet_name.replace(' ', '_')}">
-                                        <i class="fas fa-search-plus"></i> Drill Down
-                                    </span>
-                                </td>
-                            </tr>
-                            <tr>
-                                <td colspan="5" class="p-0">
-                                    <div class="collapse" id="sheet-{sheet_name.replace(' ', '_')}">
-                                        <div class="collapse-content">
-                                            <h6>Categories in {sheet_name}:</h6>
-                                            <div class="row">
-            '''
-            
-            # Add category breakdown for this sheet
-            categories = data.get('categories', {})
-            for cat_name, cat_data in categories.items():
-                cat_success = cat_data.get('passed_rate', 0)
-                cat_class = 'success' if cat_success >= 90 else 'warning' if cat_success >= 70 else 'danger'
-                content += f'''
-                                                <div class="col-md-4 mb-2">
-                                                    <small class="text-muted">{cat_name}</small><br>
-                                                    <span class="badge bg-{cat_class}">{cat_success:.1f}%</span>
-                                                </div>
-                '''
-            
-            content += '''
-                                            </div>
-                                        </div>
-                                    </div>
-                                </td>
-                            </tr>
-            '''
-        
-        content += '''
-                            </tbody>
-                        </table>
+                <div class="filters-container">
+                    <div class="filters-header">
+                        <div class="row align-items-center">
+                            <div class="col-auto">
+                                <div class="filter-icon-wrapper">
+                                    <i class="fas fa-sliders-h"></i>
+                                </div>
+                            </div>
+                            <div class="col">
+                                <h4 class="filters-title mb-0">Smart Filters</h4>
+                                <p class="filters-subtitle mb-0">Drill down into your test execution data</p>
+                            </div>
+                            <div class="col-auto">
+                                <button class="btn btn-outline-light btn-sm filter-clear-btn" onclick="clearAllFilters()">
+                                    <i class="fas fa-undo me-1"></i>Reset All
+                                </button>
+                            </div>
+                        </div>
                     </div>
-                </div>
-            </div>
-        </div>
-        '''
-        return content
-    
-    def _generate_category_analysis_content(self, category_trends: Dict) -> str:
-        """Generate detailed category analysis content."""
-        content = '''
-        <div class="row">
-            <div class="col-md-8">
-                <div class="chart-container">
-                    <h4><i class="fas fa-tags text-warning"></i> Category Performance Detailed Analysis</h4>
-                    <div class="table-container">
-                        <table class="table table-hover">
-                            <thead class="table-dark">
-                                <tr>
-                                    <th>Category</th>
-                                    <th>Success Rate</th>
-                                    <th>Total Tests</th>
-                                    <th>Executions</th>
-                                    <th>Avg Time</th>
-                                    <th>Trend</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-        '''
-        
-        for cat_name, data in category_trends.items():
-            success_rate = data.get('overall_passed_rate', 0)
-            total_tests = data.get('unique_test_count', 0)
-            total_exec = data.get('total_executions', 0)
-            avg_time = data.get('avg_execution_time_ms', 0)
-            
-            status_class = 'success' if success_rate >= 90 else 'warning' if success_rate >= 70 else 'danger'
-            trend_icon = '📈' if success_rate >= 85 else '📉' if success_rate < 70 else '➡️'
-            
-            content += f'''
-                            <tr>
-                                <td><strong>{cat_name}</strong></td>
-                                <td><span class="badge bg-{status_class}">{success_rate:.1f}%</span></td>
-                                <td>{total_tests}</td>
-                                <td>{total_exec}</td>
-                                <td>{avg_time:.0f}ms</td>
-                                <td>{trend_icon}</td>
-                            </tr>
-            '''
-        
-        content += '''
-                            </tbody>
-                        </table>
+                    
+                    <div class="filters-content">
+                        <div class="row g-4">
+                            <div class="col-lg-3 col-md-6">
+                                <div class="filter-group">
+                                    <div class="filter-label">
+                                        <i class="fas fa-cube text-primary me-2"></i>
+                                        <label for="application-filter" class="form-label">Application</label>
+                                    </div>
+                                    <select id="application-filter" class="form-select filter-select" onchange="applyFilters()">
+                                        <option value="">🌐 All Applications</option>
+                                        {application_options}
+                                    </select>
+                                </div>
+                            </div>
+                            
+                            <div class="col-lg-3 col-md-6">
+                                <div class="filter-group">
+                                    <div class="filter-label">
+                                        <i class="fas fa-server text-success me-2"></i>
+                                        <label for="environment-filter" class="form-label">Environment</label>
+                                    </div>
+                                    <select id="environment-filter" class="form-select filter-select" onchange="applyFilters()">
+                                        <option value="">🏗️ All Environments</option>
+                                        {environment_options}
+                                    </select>
+                                </div>
+                            </div>
+                            
+                            <div class="col-lg-3 col-md-6">
+                                <div class="filter-group">
+                                    <div class="filter-label">
+                                        <i class="fas fa-database text-info me-2"></i>
+                                        <label for="source-db-filter" class="form-label">Source Database</label>
+                                    </div>
+                                    <select id="source-db-filter" class="form-select filter-select" onchange="applyFilters()">
+                                        <option value="">📤 All Source DBs</option>
+                                        {source_db_options}
+                                    </select>
+                                </div>
+                            </div>
+                            
+                            <div class="col-lg-3 col-md-6">
+                                <div class="filter-group">
+                                    <div class="filter-label">
+                                        <i class="fas fa-hdd text-warning me-2"></i>
+                                        <label for="target-db-filter" class="form-label">Target Database</label>
+                                    </div>
+                                    <select id="target-db-filter" class="form-select filter-select" onchange="applyFilters()">
+                                        <option value="">📥 All Target DBs</option>
+                                        {target_db_options}
+                                    </select>
+                                </div>
+                            </div>
+                        </div>
+                        
+                        <div class="row mt-4">
+                            <div class="col-12">
+                                <div class="filter-status-container">
+                                    <div class="filter-status-wrapper">
+                                        <i class="fas fa-info-circle me-2"></i>
+                                        <span id="filter-status" class="filter-status-text">No filters applied</span>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
                     </div>
                 </div>
             </div>
-            <div class="col-md-4">
-                <div class="chart-container">
-                    <h4><i class="fas fa-chart-pie"></i> Category Distribution</h4>
-                    <canvas id="categoryDistributionChart" class="chart-canvas"></canvas>
-                </div>
-            </div>
         </div>
-        '''
-        return content
-    
-    def _generate_individual_tests_content(self, individual_trends: Dict) -> str:
-        """Generate detailed individual test analysis content."""
-        content = '''
-        <div class="row">
-            <div class="col-12">
-                <div class="chart-container">
-                    <h4><i class="fas fa-list text-info"></i> Individual Test Performance</h4>
-                    <div class="mb-3">
-                        <input type="text" class="form-control" id="testFilter" placeholder="🔍 Filter tests by name...">
-                    </div>
-                    <div class="table-container">
-                        <table class="table table-hover table-sm" id="individualTestsTable">
-                            <thead class="table-dark">
-                                <tr>
-                                    <th>Test ID</th>
-                                    <th>Category</th>
-                                    <th>Sheet</th>
-                                    <th>Success Rate</th>
-                                    <th>Executions</th>
-                                    <th>Avg Time</th>
-                                    <th>Status</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-        '''
-        
-        # Sort tests by success rate (worst first for attention)
-        sorted_tests = sorted(individual_trends.items(), 
-                            key=lambda x: x[1].get('passed_rate', 0))
-        
-        for test_id, data in sorted_tests:
-            success_rate = data.get('passed_rate', 0)
-            category = data.get('category', 'Unknown')
-            sheet = data.get('sheet_name', 'Unknown')
-            executions = data.get('execution_count', 0)
-            avg_time = data.get('avg_execution_time_ms', 0)
-            
-            status_class = 'success' if success_rate >= 90 else 'warning' if success_rate >= 70 else 'danger'
-            status_text = '✅ Stable' if success_rate >= 90 else '⚠️ Unstable' if success_rate >= 70 else '❌ Failing'
-            
-            content += f'''
+        """
+
+# Parsed once like _DASHBOARD_PARTS, so rendering the panel only splices in the option lists
+_FILTERS_SECTION_PARTS = tuple(string.Formatter().parse(_FILTERS_SECTION_TEMPLATE))
+
+# Trends metadata that changes on every analysis run without changing what the report shows
+_VOLATILE_METADATA_KEYS = frozenset({'analysis_generated'})
+
+# Success-rate buckets: status tables are indexed by rate // 10 (<70, 70-89, 90+),
+# the trend table by rate // 5 (<70, 70-84, 85+); indexes are clamped to the tables' ends
+_STATUS_CLASS_TBL = ('danger',) * 7 + ('warning',) * 2 + ('success',) * 2
+_STATUS_TEXT_TBL = ('❌ Failing',) * 7 + ('⚠️ Unstable',) * 2 + ('✅ Stable',) * 2
+_TREND_ICON_TBL = ('📉',) * 14 + ('➡️',) * 3 + ('📈',) * 4
+
+
+def _rate_bucket(rate, width: int, last: int) -> int:
+    """Index a success-rate table by rate // width, clamped to 0..last for out-of-range rates."""
+    # Clamping at 0 too keeps negative rates from bad data on the lowest bucket instead of wrapping around
+    return max(0, min(int(rate) // width, last))
+
+
+def _dumps_compact(data, sort_keys: bool = False) -> bytes:
+    """Serialize data to compact UTF-8 JSON, using orjson when it is available."""
+    if orjson is not None:
+        # Match json.dumps: stringify non-str keys and hand datetimes to default=str
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(
+        data, separators=(',', ':'), ensure_ascii=False, default=str, sort_keys=sort_keys
+    ).encode('utf-8')
+
+
+def _json_island(data) -> str:
+    """Serialize data compactly for a <script type="application/json"> block or a dashboard script literal."""
+    # "<\/" is the same string to JSON and JavaScript but keeps a "</script>" inside string
+    # values from closing the surrounding block early
+    return _dumps_compact(data).decode('utf-8').replace('</', '<\\/')
+
+
+def _iter_template(parts, context: Dict[str, Any]):
+    """Yield a pre-parsed str.format template, building callable fields only when they are reached."""
+    for literal_text, field_name, format_spec, _ in parts:
+        yield literal_text
+        if field_name is not None:
+            value = context[field_name]
+            if callable(value):
+                value = value()
+            if isinstance(value, str):
+                yield format(value, format_spec)
+            else:
+                # Sections built as iterators are streamed through unjoined
+                yield from value
+
+
+# Key metric card at the top of the dashboard
+_METRIC_CARD_FMT = """            <div class="col-md-3">
+                <div class="metric-card">
+                    <h3><i class="fas fa-{icon}"></i></h3>
+                    <h4>{value}</h4>
+                    <p>{label}</p>
+                </div>
+            </div>"""
+
+# Key insight card; bound format method so it can be mapped over the insights directly
+_INSIGHT_FMT = '<div class="col-md-6"><div class="alert alert-info mb-2">{0}</div></div>'.format
+
+# Defaults for trend fields a row may omit; rows are rendered from {**_ROW_DEFAULTS, **data}
+_ROW_DEFAULTS = {
+    'overall_passed_rate': 0,
+    'passed_rate': 0,
+    'total_executions': 0,
+    'avg_execution_time_ms': 0,
+    'unique_test_count': 0,
+}
+
+# Characters replaced when a sheet name becomes an element id; "." and "/" would break the
+# "#sheet-..." selector used by the drill-down toggle
+_ANCHOR_TBL = str.maketrans({' ': '_', '/': '_', '.': '_'})
+
+# Table row templates for the sheet, category and individual test tabs
+_SHEET_ROW_FMT = """
                             <tr>
-                                <td><code>{test_id}</code></td>
-                                <td><span class="badge bg-secondary">{category}</span></td>
-                                <td>{sheet}</td>
-                                <td><span class="badge bg-{status_class}">{success_rate:.1f}%</span></td>
-                                <td>{executions}</td>
-                                <td>{avg_time:.0f}ms</td>
-                                <td>{status_text}</td>
+                                <td><strong>{sheet_name}</strong></td>
+                                <td><span class="badge bg-{status_class}">{overall_passed_rate:.1f}%</span></td>
+                                <td>{total_executions}</td>
+                                <td>{avg_execution_time_ms:.0f}ms</td>
+                                <td>
+                                    <span class="drill-down-btn" data-bs-toggle="collapse" data-bs-target="#sheet-{anchor}">
+                                        <i class="fas fa-search-plus"></i> Drill Down
+                                    </span>
+                                </td>
                             </tr>
-            '''
-        
-        content += '''
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-        </div>
-        '''
-        return content
-    
-    def _generate_javascript_charts(self, trends_data: Dict) -> str:
-        """Generate comprehensive JavaScript for all charts."""
-        time_trends = trends_data.get('time_based_trends', {})
-        sheet_trends = trends_data.get('sheet_level_trends', {})
-        category_trends = trends_data.get('category_level_trends', {})
-        
-        # Convert data to JSON strings safely
-        sheet_data = json.dumps(list(sheet_trends.keys()))
-        sheet_rates = json.dumps([sheet_trends[sheet].get('overall_passed_rate', 0) for sheet in sheet_trends.keys()])
-        category_data = json.dumps(list(category_trends.keys()))
-        category_rates = json.dumps([category_trends[cat].get('overall_passed_rate', 0) for cat in category_trends.keys()])
-        hourly_data = json.dumps(time_trends.get('hourly', {}))
-        daily_data = json.dumps(time_trends.get('daily', {}))
-        weekly_data = json.dumps(time_trends.get('weekly', {}))
-        monthly_data = json.dumps(time_trends.get('monthly', {}))
-        yearly_data = json.dumps(time_trends.get('yearly', {}))
-        category_executions = json.dumps([category_trends[cat].get('total_executions', 0) for cat in category_trends.keys()])
-        
-        return f"""
-        // Store raw execution data for filtering
-        window.rawExecutionData = {json.dumps(self.execution_history, indent=2, default=str)};
+                            <tr>
+                                <td colspan="5" class="p-0">
+                                    <div class="collapse" id="sheet-{anchor}">
+                                        <div class="collapse-content">
+                                            <h6>Categories in {sheet_name}:</h6>
+                                            <div class="row">
+            """
+
+_SHEET_CATEGORY_FMT = """
+                                                <div class="col-md-4 mb-2">
+                                                    <small class="text-muted">{cat_name}</small><br>
+                                                    <span class="badge bg-{cat_class}">{passed_rate:.1f}%</span>
+                                                </div>
+                """
+
+_SHEET_ROW_END = """
+                                            </div>
+                                        </div>
+                                    </div>
+                                </td>
+                            </tr>
+            """
+
+_CATEGORY_ROW_FMT = """
+                            <tr>
+                                <td><strong>{cat_name}</strong></td>
+                                <td><span class="badge bg-{status_class}">{overall_passed_rate:.1f}%</span></td>
+                                <td>{unique_test_count}</td>
+                                <td>{total_executions}</td>
+                                <td>{avg_execution_time_ms:.0f}ms</td>
+                                <td>{trend_icon}</td>
+                            </tr>
+            """
+
+# The individual test row is %-formatted from a positional tuple: it is the innermost loop of the
+# page and skips building a merged dict per test
+_INDIVIDUAL_ROW_FMT = """
+                            <tr data-test-id="%s" data-search="%s">
+                                <td><code>%s</code></td>
+                                <td><span class="badge bg-secondary">%s</span></td>
+                                <td>%s</td>
+                                <td><span class="badge bg-%s">%.1f%%</span></td>
+                                <td>%s</td>
+                                <td>%.0fms</td>
+                                <td>%s</td>
+                            </tr>
+            """
+
+
+# Counters summed per time bucket for the filtered time trends
+_TIME_TREND_COUNTERS = ('executions', 'total_tests', 'passed_tests', 'failed_tests', 'skipped_tests')
+
+# Time trend bucket label per time frame, from the bucket's hour, start timestamp or year
+_BUCKET_LABEL_FORMATS = {
+    'hourly': int,
+    'daily': lambda start: start.strftime('%Y-%m-%d'),
+    'weekly': lambda start: '%d-W%02d' % start.isocalendar()[:2],
+    'monthly': lambda start: start.strftime('%Y-%m'),
+    'yearly': str,
+}
+
+# Above this many individual tests, the rendered rows are selected with a heap instead of a full sort
+_HEAP_SELECT_MIN_TESTS = 1000
+
+# filter_data entries the filter option lists are built from
+_FILTER_DATA_KEYS = (
+    'applications',
+    'environments',
+    'source_applications',
+    'source_environments',
+    'target_applications',
+    'target_environments',
+)
+
+# Filter option icons for known applications and environments
+_APP_ICONS = {
+    'DUMMY': '🎯',
+    'cross_db_validator': '⚡',
+    'default': '📦'
+}
+_ENV_ICONS = {
+    'DEV': '🛠️',
+    'NP1': '🧪',
+    'production': '🏭',
+    'default': '🌐'
+}
+
+# Per filter: (icon by value, icon for other values, option label from value)
+_FILTER_OPTION_STYLES = {
+    'application': (_APP_ICONS, '🔧', str),
+    'environment': (_ENV_ICONS, '⚙️', str.upper),
+    'source_db': ({}, '📤', str),
+    'target_db': ({}, '📥', str),
+}
+
+
+@lru_cache(maxsize=64)
+def _db_combos(applications: Tuple[str, ...], environments: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Combine applications and environments into application.environment database names, once per pair of lists."""
+    return tuple(f"{app}.{env}" for app in applications for env in environments)
+
+
+def _wall_clock_time(value) -> Any:
+    """Parse an ISO 8601 execution time as its naive wall-clock time, or None when it cannot be parsed."""
+    # Offsets are dropped per value, as PersistentTrendsAnalyzer does, so histories mixing UTC
+    # offsets (e.g. across a DST change) or naive and aware times still bucket together
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        return None
+
+# Placeholder row shown below the rendered individual tests while more are pending
+_INDIVIDUAL_MORE_ROW_FMT = """
+                            <tr id="individualTestsMore">
+                                <td colspan="7" class="text-center text-muted">Showing {shown} of {total} tests - scroll for more</td>
+                            </tr>
+            """
+
+# Pending individual test rows and the script that renders them in batches when the placeholder scrolls into view
+_INDIVIDUAL_LAZY_ROWS_FMT = """
+        <script type="application/json" id="pendingIndividualTests">{pending_json}</script>
+        <script>
+            (function() {{
+                // Stable sort by success rate, worst first, matching the rendered rows
+                const pending = JSON.parse(document.getElementById('pendingIndividualTests').textContent)
+                    .sort((a, b) => a[3] - b[3]);
+                const placeholder = document.getElementById('individualTestsMore');
+                const statusClass = rate => rate >= 90 ? 'success' : rate >= 70 ? 'warning' : 'danger';
+                const statusText = rate => rate >= 90 ? '✅ Stable' : rate >= 70 ? '⚠️ Unstable' : '❌ Failing';
+                const escapeAttr = value => String(value).replace(/&/g, '&amp;').replace(/"/g, '&quot;');
+                const searchText = (testId, category) => `${{testId}}|${{category}}`.toLowerCase();
+                let observer = null;
+                
+                function renderBatch() {{
+                    const rows = pending.splice(0, {batch_size}).map(([testId, category, sheet, rate, executions, avgTime]) =>
+                        `<tr data-test-id="${{escapeAttr(testId)}}" data-search="${{escapeAttr(searchText(testId, category))}}"><td><code>${{testId}}</code></td><td><span class="badge bg-secondary">${{category}}</span></td>` +
+                        `<td>${{sheet}}</td><td><span class="badge bg-${{statusClass(rate)}}">${{rate.toFixed(1)}}%</span></td>` +
+                        `<td>${{executions}}</td><td>${{avgTime.toFixed(0)}}ms</td><td>${{statusText(rate)}}</td></tr>`
+                    );
+                    placeholder.insertAdjacentHTML('beforebegin', rows.join(''));
+                    if (pending.length) {{
+                        placeholder.cells[0].textContent = `Showing ${{{total} - pending.length}} of {total} tests - scroll for more`;
+                    }} else {{
+                        if (observer) observer.disconnect();
+                        placeholder.remove();
+                    }}
+                }}
+                
+                if (!placeholder) return;
+                if (!('IntersectionObserver' in window)) {{
+                    while (pending.length) renderBatch();
+                    return;
+                }}
+                observer = new IntersectionObserver(entries => {{
+                    if (entries.some(entry => entry.isIntersecting)) renderBatch();
+                }}, {{ root: placeholder.closest('.table-container') }});
+                observer.observe(placeholder);
+            }})();
+        </script>
+        """
+
+
+# Chart script appended to the dashboard; filled from JSON literals of the trends data
+_CHARTS_SCRIPT_TEMPLATE = """
+        // Time trends per application/environment filter ('' matches any), aggregated when the report was generated;
+        // embedded as base64 gzip JSON and decoded the first time a filter needs them. Browsers without
+        // DecompressionStream cannot decode them, so filtered trends are reported as unavailable there
+        const partitionedTimeDataGzip = "{partitioned_time_data}";
+        let partitionedTimeData = null;
+        
+        function loadPartitionedTimeData() {{
+            if (!partitionedTimeData) {{
+                if (typeof DecompressionStream === 'undefined') {{
+                    return Promise.reject(new Error('this browser cannot decompress the embedded data'));
+                }}
+                const bytes = Uint8Array.from(atob(partitionedTimeDataGzip), c => c.charCodeAt(0));
+                const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                // A failed decode is not memoized, so the next filter change tries again
+                partitionedTimeData = new Response(stream).json().catch(error => {{
+                    partitionedTimeData = null;
+                    throw error;
+                }});
+            }}
+            return partitionedTimeData;
+        }}
         
         // Chart configurations
         Chart.defaults.responsive = true;
         Chart.defaults.maintainAspectRatio = false;
         
+        // Category colours, cycled when there are more categories than colours
+        const CHART_PALETTE = [
+            '#ef4444', '#f97316', '#eab308', '#22c55e',
+            '#3b82f6', '#8b5cf6', '#ec4899', '#06b6d4',
+            '#64748b', '#84cc16'
+        ];
+        const paletteFor = labels => labels.map((_, i) => CHART_PALETTE[i % CHART_PALETTE.length]);
+        
+        // Create a chart on a canvas (element or id), destroying any chart already drawn there so
+        // re-initialization does not leave detached canvas contexts and listeners behind
+        function makeChart(canvas, config) {{
+            const element = typeof canvas === 'string' ? document.getElementById(canvas) : canvas;
+            Chart.getChart(element)?.destroy();
+            return new Chart(element, config);
+        }}
+        
+        // Run chart work once the browser is idle, so drawing several charts is split into separate
+        // tasks and input events are handled in between
+        const whenIdle = window.requestIdleCallback
+            ? task => window.requestIdleCallback(task, {{ timeout: 200 }})
+            : task => setTimeout(task, 1);
+        
         // Overview Charts
         function initOverviewCharts() {{
             try {{
@@ -756,7 +876,7 @@ class EnhancedTrendsHTMLReportGenerator:
                     return;
                 }}
                 
-                new Chart(sheetCanvas, {{
+                makeChart(sheetCanvas, {{
                     type: 'bar',
                     data: {{
                         labels: sheetData,
@@ -784,8 +904,17 @@ class EnhancedTrendsHTMLReportGenerator:
                         }}
                     }}
                 }});
-
-                // Category Overview Chart
+            }} catch (error) {{
+                console.error('Error initializing overview charts:', error);
+                showChartError('sheetOverviewChart', 'Error loading sheet performance chart');
+            }}
+            
+            // The category chart is drawn in its own task after the sheet chart
+            whenIdle(initCategoryOverviewChart);
+        }}
+        
+        function initCategoryOverviewChart() {{
+            try {{
                 const categoryData = {category_data};
                 const categoryRates = {category_rates};
                 
@@ -795,17 +924,13 @@ class EnhancedTrendsHTMLReportGenerator:
                     return;
                 }}
                 
-                new Chart(categoryCanvas, {{
+                makeChart(categoryCanvas, {{
                     type: 'doughnut',
                     data: {{
                         labels: categoryData,
                         datasets: [{{
                             data: categoryRates,
-                            backgroundColor: [
-                                '#ef4444', '#f97316', '#eab308', '#22c55e', 
-                                '#3b82f6', '#8b5cf6', '#ec4899', '#06b6d4',
-                                '#64748b', '#84cc16'
-                            ]
+                            backgroundColor: paletteFor(categoryData)
                         }}]
                     }},
                     options: {{
@@ -824,11 +949,26 @@ class EnhancedTrendsHTMLReportGenerator:
                 }});
             }} catch (error) {{
                 console.error('Error initializing overview charts:', error);
-                showChartError('sheetOverviewChart', 'Error loading sheet performance chart');
                 showChartError('categoryOverviewChart', 'Error loading category distribution chart');
             }}
         }}
         
+        // Time trend points are placed by bucket position (labels are hours, days, ISO weeks...);
+        // the x axis maps positions back to the bucket labels. Both series are filled into arrays of
+        // the known length in one walk over the buckets, whose rates were computed with the report
+        function timeSeriesPoints(data) {{
+            const labels = Object.keys(data);
+            const n = labels.length;
+            const rates = new Array(n);
+            const executions = new Array(n);
+            for (let x = 0; x < n; x++) {{
+                const d = data[labels[x]];
+                rates[x] = {{ x, y: d.passed_rate || 0 }};
+                executions[x] = {{ x, y: d.executions || 0 }};
+            }}
+            return [labels, rates, executions];
+        }}
+        
         // Time Trends Charts
         function initTimeTrendsCharts() {{
             const hourlyData = {hourly_data};
@@ -847,21 +987,21 @@ class EnhancedTrendsHTMLReportGenerator:
             }};
             
             // Main time trends chart
-            const ctx = document.getElementById('timeTrendsChart').getContext('2d');
-            window.timeTrendsChart = new Chart(ctx, {{
+            const [dailyLabels, dailyRates, dailyExecutions] = timeSeriesPoints(dailyData);
+            window.timeTrendsChart = makeChart('timeTrendsChart', {{
                 type: 'line',
                 data: {{
-                    labels: Object.keys(dailyData),
+                    labels: dailyLabels,
                     datasets: [{{
                         label: 'Success Rate %',
-                        data: Object.values(dailyData).map(d => d.passed_rate || 0),
+                        data: dailyRates,
                         borderColor: '#3b82f6',
                         backgroundColor: 'rgba(59, 130, 246, 0.1)',
                         fill: true,
                         tension: 0.4
                     }}, {{
                         label: 'Execution Count',
-                        data: Object.values(dailyData).map(d => d.executions || 0),
+                        data: dailyExecutions,
                         borderColor: '#10b981',
                         backgroundColor: 'rgba(16, 185, 129, 0.1)',
                         fill: false,
@@ -871,7 +1011,17 @@ class EnhancedTrendsHTMLReportGenerator:
                 options: {{
                     responsive: true,
                     maintainAspectRatio: false,
+                    // Points are pre-built, index-sorted {{x, y}} objects: Chart.js skips parsing and
+                    // normalizing them on every draw, and long histories can be decimated
+                    parsing: false,
+                    normalized: true,
+                    spanGaps: true,
                     plugins: {{
+                        decimation: {{
+                            enabled: true,
+                            algorithm: 'lttb',
+                            samples: 500
+                        }},
                         title: {{
                             display: true,
                             text: 'Test Execution Trends - Daily View',
@@ -879,9 +1029,21 @@ class EnhancedTrendsHTMLReportGenerator:
                         }},
                         legend: {{
                             position: 'top'
+                        }},
+                        tooltip: {{
+                            callbacks: {{
+                                title: items => items.length ? items[0].chart.data.labels[items[0].parsed.x] : ''
+                            }}
                         }}
                     }},
                     scales: {{
+                        x: {{
+                            type: 'linear',
+                            ticks: {{
+                                stepSize: 1,
+                                callback: function(value) {{ return this.chart.data.labels[value]; }}
+                            }}
+                        }},
                         y: {{
                             type: 'linear',
                             display: true,
@@ -913,8 +1075,15 @@ class EnhancedTrendsHTMLReportGenerator:
                 }});
             }});
             
+            // The pattern charts are drawn in later tasks, after the main trends chart
+            whenIdle(initPatternCharts);
+        }}
+        
+        function initPatternCharts() {{
+            const hourlyData = window.originalTimeData.hourly;
+            
             // Hourly patterns chart
-            window.hourlyTrendsChart = new Chart(document.getElementById('hourlyTrendsChart'), {{
+            window.hourlyTrendsChart = makeChart('hourlyTrendsChart', {{
                 type: 'bar',
                 data: {{
                     labels: Array.from({{length: 24}}, (_, i) => i + ':00'),
@@ -946,23 +1115,9 @@ class EnhancedTrendsHTMLReportGenerator:
                     }}
                 }}
             }});
-        }}
-        
-        function updateTimeTrendsChart(timeframe) {{
-            if (!window.timeTrendsChart || !window.originalTimeData) return;
-            
-            let data = window.originalTimeData[timeframe] || window.originalTimeData.daily;
-            let chartTitle = `Test Execution Trends - ${{timeframe.charAt(0).toUpperCase() + timeframe.slice(1)}} View`;
-            
-            window.timeTrendsChart.data.labels = Object.keys(data);
-            window.timeTrendsChart.data.datasets[0].data = Object.values(data).map(d => d.passed_rate || 0);
-            window.timeTrendsChart.data.datasets[1].data = Object.values(data).map(d => d.executions || 0);
-            window.timeTrendsChart.options.plugins.title.text = chartTitle;
-            window.timeTrendsChart.update('active');
-        }}
             
             // Weekly pattern chart
-            new Chart(document.getElementById('weeklyPatternChart'), {{
+            whenIdle(() => makeChart('weeklyPatternChart', {{
                 type: 'radar',
                 data: {{
                     labels: ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'],
@@ -981,7 +1136,13 @@ class EnhancedTrendsHTMLReportGenerator:
                         r: {{ beginAtZero: true }}
                     }}
                 }}
-            }});
+            }}));
+        }}
+        
+        function updateTimeTrendsChart(timeframe) {{
+            if (!window.timeTrendsChart || !window.originalTimeData) return;
+            
+            updateTimeTrendsChartWithData(timeframe, window.originalTimeData[timeframe] || window.originalTimeData.daily);
         }}
         
         // Category distribution chart
@@ -989,16 +1150,13 @@ class EnhancedTrendsHTMLReportGenerator:
             const categoryData = {category_data};
             const categoryExecutions = {category_executions};
             
-            new Chart(document.getElementById('categoryDistributionChart'), {{
+            makeChart('categoryDistributionChart', {{
                 type: 'pie',
                 data: {{
                     labels: categoryData,
                     datasets: [{{
                         data: categoryExecutions,
-                        backgroundColor: [
-                            '#ef4444', '#f97316', '#eab308', '#22c55e', 
-                            '#3b82f6', '#8b5cf6', '#ec4899', '#06b6d4'
-                        ]
+                        backgroundColor: paletteFor(categoryData)
                     }}]
                 }},
                 options: {{
@@ -1017,17 +1175,18 @@ class EnhancedTrendsHTMLReportGenerator:
             const table = document.getElementById('individualTestsTable');
             
             if (filterInput && table) {{
+                // Rows carry their lowercased test id and category in data-search, and typing
+                // is coalesced into one filter pass per animation frame
+                let pendingFrame = 0;
                 filterInput.addEventListener('input', function() {{
-                    const filter = this.value.toLowerCase();
-                    const rows = table.getElementsByTagName('tr');
-                    
-                    for (let i = 1; i < rows.length; i++) {{
-                        const testId = rows[i].getElementsByTagName('td')[0];
-                        if (testId) {{
-                            const txtValue = testId.textContent || testId.innerText;
-                            rows[i].style.display = txtValue.toLowerCase().indexOf(filter) > -1 ? '' : 'none';
+                    if (pendingFrame) return;
+                    pendingFrame = requestAnimationFrame(() => {{
+                        pendingFrame = 0;
+                        const filter = filterInput.value.toLowerCase();
+                        for (const row of table.querySelectorAll('tbody tr[data-search]')) {{
+                            row.style.display = row.dataset.search.includes(filter) ? '' : 'none';
                         }}
-                    }}
+                    }});
                 }});
             }}
         }}
@@ -1067,119 +1226,82 @@ class EnhancedTrendsHTMLReportGenerator:
                 showChartError('categoryOverviewChart', 'Error initializing overview charts');
             }}
             
-            // Initialize other charts when their tabs are shown
-            document.getElementById('time-trends-tab').addEventListener('shown.bs.tab', function() {{
-                if (checkChartJsLoaded()) {{
-                    setTimeout(initTimeTrendsCharts, 100);
-                }} else {{
-                    showChartError('timeTrendsChart', 'Charts unavailable - Chart.js library not loaded');
-                }}
-            }});
+            // Initialize other charts the first time their tabs are shown, once the browser is idle;
+            // later tab switches reuse the existing charts and filter listeners
+            const initializedTabs = new Set();
             
-            document.getElementById('categories-tab').addEventListener('shown.bs.tab', function() {{
-                if (checkChartJsLoaded()) {{
-                    setTimeout(initCategoryDistributionChart, 100);
-                }} else {{
-                    showChartError('categoryChart', 'Charts unavailable - Chart.js library not loaded');
-                }}
-            }});
+            function initOnFirstShow(tabId, init, chartId) {{
+                document.getElementById(tabId).addEventListener('shown.bs.tab', function() {{
+                    if (initializedTabs.has(tabId)) return;
+                    if (chartId && !checkChartJsLoaded()) {{
+                        showChartError(chartId, 'Charts unavailable - Chart.js library not loaded');
+                        return;
+                    }}
+                    initializedTabs.add(tabId);
+                    whenIdle(init);
+                }});
+            }}
             
-            document.getElementById('individual-tab').addEventListener('shown.bs.tab', function() {{
-                setTimeout(initTestFilter, 100);
-            }});
+            initOnFirstShow('time-trends-tab', initTimeTrendsCharts, 'timeTrendsChart');
+            initOnFirstShow('categories-tab', initCategoryDistributionChart, 'categoryChart');
+            initOnFirstShow('individual-tab', initTestFilter);
         }});
         
         // Filtering functionality
-        function applyFilters() {{
-            const appFilter = document.getElementById('applicationFilter').value;
-            const envFilter = document.getElementById('environmentFilter').value;
-            const sourceFilter = document.getElementById('sourceFilter').value;
-            const targetFilter = document.getElementById('targetFilter').value;
+        // Smart Filters selects, in applyFilters argument order; their elements, the status line and the
+        // trends filter notice are looked up once and shared by every filter handler
+        const FILTER_SELECTS = Object.freeze([
+            {{ id: 'application-filter', name: '🔹 Application' }},
+            {{ id: 'environment-filter', name: '🔹 Environment' }},
+            {{ id: 'source-db-filter', name: '🔹 Source DB' }},
+            {{ id: 'target-db-filter', name: '🔹 Target DB' }}
+        ]);
+        let filterElements = null;
+        
+        function getFilterElements() {{
+            if (!filterElements) {{
+                filterElements = {{
+                    selects: FILTER_SELECTS.map(filter => document.getElementById(filter.id)),
+                    status: document.getElementById('filter-status'),
+                    trendsNotice: document.getElementById('trends-filter-notice')
+                }};
+            }}
+            return filterElements;
+        }}
+        
+        function filterIndividualTestsTable(app, env, source, target) {{
+            // Rows carry their test id in data-test-id; one generated rule hides the non-matching rows,
+            // so the browser restyles the table once instead of once per row
+            let style = document.getElementById('individualTestsFilterStyle');
+            if (!style) {{
+                style = document.head.appendChild(document.createElement('style'));
+                style.id = 'individualTestsFilterStyle';
+            }}
             
-            updateFilterStatus(appFilter, envFilter, sourceFilter, targetFilter);
+            // For now, basic filtering on the test id (case-insensitive) - this can be enhanced with more detailed data
+            const selectors = [app, env]
+                .filter(term => term)
+                .map(term => `#individualTestsTable tbody tr[data-test-id]:not([data-test-id*="${{CSS.escape(term)}}" i])`);
+            style.textContent = selectors.length ? `${{selectors.join(', ')}} {{ display: none; }}` : '';
+        }}
+        
+        function applyFilters() {{
+            const [appFilter, envFilter, sourceFilter, targetFilter] = getFilterElements().selects.map(select => select.value);
             
-            // Apply filters to all visible tables and charts
+            // Apply filters to tables
             filterIndividualTestsTable(appFilter, envFilter, sourceFilter, targetFilter);
             filterSheetsTable(appFilter, envFilter, sourceFilter, targetFilter);
             
-            // Note: Chart filtering would require more complex data restructuring
-            // For now, we focus on table filtering which is most useful
+            // Apply filters to time trends charts
+            updateTimeTrendsWithFilters(appFilter, envFilter, sourceFilter, targetFilter);
+            
+            // Update filter status
+            updateFilterStatus();
         }}
         
-        function clearAllFilters() {{
-            document.getElementById('applicationFilter').value = '';
-            document.getElementById('environmentFilter').value = '';
-            document.getElementById('sourceFilter').value = '';
-            document.getElementById('targetFilter').value = '';
-            updateFilterStatus('', '', '', '');
-            
-            // Show all rows
-            const tables = ['individualTestsTable'];
-            tables.forEach(tableId => {{
-                const table = document.getElementById(tableId);
-                if (table) {{
-                    const rows = table.querySelectorAll('tbody tr');
-                    rows.forEach(row => row.style.display = '');
-                }}
-            }});
-        }}
-        
-        function updateFilterStatus(app, env, source, target) {{
-            const filters = [];
-            if (app) filters.push(`App: ${{app}}`);
-            if (env) filters.push(`Env: ${{env}}`);
-            if (source) filters.push(`Source: ${{source}}`);
-            if (target) filters.push(`Target: ${{target}}`);
-            
-            const status = filters.length ? `Active filters: ${{filters.join(', ')}}` : 'No filters applied';
-            document.getElementById('filterStatus').textContent = status;
-        }}
-        
-        function filterIndividualTestsTable(app, env, source, target) {{
-            const table = document.getElementById('individualTestsTable');
-            if (!table) return;
-            
-            const rows = table.querySelectorAll('tbody tr');
-            rows.forEach(row => {{
-                let showRow = true;
-                
-                // Get test details from the row - this would need to be enhanced
-                // based on how we store the database info in the table
-                const testId = row.cells[0]?.textContent || '';
-                const category = row.cells[1]?.textContent || '';
-                
-                // For now, basic filtering - this can be enhanced with more detailed data
-                if (app && !testId.toLowerCase().includes(app.toLowerCase())) {{
-                    showRow = false;
-                }}
-                if (env && !testId.toLowerCase().includes(env.toLowerCase())) {{
-                    showRow = false;
-                }}
-                
-                row.style.display = showRow ? '' : 'none';
-            }});
-        }}
-        
-        function applyFilters() {{
-            const appFilter = document.getElementById('application-filter').value;
-            const envFilter = document.getElementById('environment-filter').value;
-            const sourceFilter = document.getElementById('source-db-filter').value;
-            const targetFilter = document.getElementById('target-db-filter').value;
-            
-            // Apply filters to tables
-            filterIndividualTestsTable(appFilter, envFilter, sourceFilter, targetFilter);
-            filterSheetsTable(appFilter, envFilter, sourceFilter, targetFilter);
-            
-            // Apply filters to time trends charts
-            updateTimeTrendsWithFilters(appFilter, envFilter, sourceFilter, targetFilter);
-            
-            // Update filter status
-            updateFilterStatus();
-        }}
-        
-        function updateTimeTrendsWithFilters(appFilter, envFilter, sourceFilter, targetFilter) {{
-            const hasFilters = appFilter || envFilter || sourceFilter || targetFilter;
-            const noticeElement = document.getElementById('trends-filter-notice');
+        async function updateTimeTrendsWithFilters(appFilter, envFilter, sourceFilter, targetFilter) {{
+            const hasFilters = appFilter || envFilter || sourceFilter || targetFilter;
+            const noticeElement = getFilterElements().trendsNotice;
             
             if (hasFilters) {{
                 // Show filter notice
@@ -1188,11 +1310,19 @@ class EnhancedTrendsHTMLReportGenerator:
                 }}
                 
                 // Filter the original data based on selected criteria
-                const filteredData = filterTimeData(appFilter, envFilter, sourceFilter, targetFilter);
+                let filteredData;
+                try {{
+                    filteredData = await filterTimeData(appFilter, envFilter, sourceFilter, targetFilter);
+                }} catch (error) {{
+                    // Show an empty chart rather than unfiltered trends under the filtered notice
+                    console.error('Filtered time trends are unavailable:', error);
+                    filteredData = {{}};
+                    getFilterElements().status.textContent = `⚠️ Filtered time trends are unavailable: ${{error.message}}`;
+                }}
                 const activeTimeframe = document.querySelector('[data-timeframe].active')?.dataset.timeframe || 'daily';
                 
                 // Update chart with filtered data
-                updateTimeTrendsChartWithData(activeTimeframe, filteredData[activeTimeframe]);
+                updateTimeTrendsChartWithData(activeTimeframe, filteredData[activeTimeframe] || {{}});
                 
                 // Update chart title
                 const chartTitle = `Test Execution Trends - ${{activeTimeframe.charAt(0).toUpperCase() + activeTimeframe.slice(1)}} View (Filtered)`;
@@ -1225,254 +1355,63 @@ class EnhancedTrendsHTMLReportGenerator:
             }}
         }}
         
-        function filterTimeData(appFilter, envFilter, sourceFilter, targetFilter) {{
-            // Get access to the raw execution history data
-            const rawData = window.rawExecutionData || [];
-            
-            // Filter the raw data based on criteria
-            const filteredExecutions = rawData.filter(record => {{
-                const metadata = record.execution_metadata || {{}};
-                
-                // Application filter
-                if (appFilter && metadata.application !== appFilter) {{
-                    return false;
-                }}
-                
-                // Environment filter  
-                if (envFilter && metadata.environment !== envFilter) {{
-                    return false;
-                }}
-                
-                // Source/Target DB filtering would require execution_details
-                // For now, we'll skip these filters since they're not in the main metadata
-                
-                return true;
-            }});
+        async function filterTimeData(appFilter, envFilter, sourceFilter, targetFilter) {{
+            // Source/Target DB filtering would require execution_details
+            // For now, we'll skip these filters since they're not in the main metadata
+            if (!appFilter && !envFilter) {{
+                return window.originalTimeData || {{}};
+            }}
             
-            // Regenerate time trends from filtered data
+            // Look up the trends aggregated for this application/environment pair
+            const partitions = await loadPartitionedTimeData();
+            const partition = (partitions[appFilter] || {{}})[envFilter] || {{}};
             return {{
-                hourly: generateHourlyTrends(filteredExecutions),
-                daily: generateDailyTrends(filteredExecutions),
-                weekly: generateWeeklyTrends(filteredExecutions),
-                monthly: generateMonthlyTrends(filteredExecutions),
-                yearly: generateYearlyTrends(filteredExecutions)
+                hourly: partition.hourly || {{}},
+                daily: partition.daily || {{}},
+                weekly: partition.weekly || {{}},
+                monthly: partition.monthly || {{}},
+                yearly: partition.yearly || {{}}
             }};
         }}
         
-        function generateDailyTrends(executions) {{
-            const dailyData = {{}};
-            
-            executions.forEach(record => {{
-                const execTime = new Date(record.execution_metadata.execution_time);
-                const dayKey = execTime.toISOString().split('T')[0]; // YYYY-MM-DD
-                const summary = record.overall_summary || {{}};
-                
-                if (!dailyData[dayKey]) {{
-                    dailyData[dayKey] = {{
-                        executions: 0, total_tests: 0, passed_tests: 0,
-                        failed_tests: 0, skipped_tests: 0
-                    }};
-                }}
-                
-                dailyData[dayKey].executions += 1;
-                dailyData[dayKey].total_tests += summary.total_tests || 0;
-                dailyData[dayKey].passed_tests += summary.passed_tests || 0;
-                dailyData[dayKey].failed_tests += summary.failed_tests || 0;
-                dailyData[dayKey].skipped_tests += summary.skipped_tests || 0;
-            }});
-            
-            // Calculate rates
-            Object.keys(dailyData).forEach(day => {{
-                const data = dailyData[day];
-                if (data.total_tests > 0) {{
-                    data.passed_rate = Math.round(data.passed_tests / data.total_tests * 100 * 100) / 100;
-                    data.failed_rate = Math.round(data.failed_tests / data.total_tests * 100 * 100) / 100;
-                    data.skipped_rate = Math.round(data.skipped_tests / data.total_tests * 100 * 100) / 100;
-                }}
-            }});
-            
-            return dailyData;
-        }}
-        
-        function generateHourlyTrends(executions) {{
-            const hourlyData = {{}};
-            
-            executions.forEach(record => {{
-                const execTime = new Date(record.execution_metadata.execution_time);
-                const hour = execTime.getHours();
-                const summary = record.overall_summary || {{}};
-                
-                if (!hourlyData[hour]) {{
-                    hourlyData[hour] = {{
-                        executions: 0, total_tests: 0, passed_tests: 0,
-                        failed_tests: 0, skipped_tests: 0
-                    }};
-                }}
-                
-                hourlyData[hour].executions += 1;
-                hourlyData[hour].total_tests += summary.total_tests || 0;
-                hourlyData[hour].passed_tests += summary.passed_tests || 0;
-                hourlyData[hour].failed_tests += summary.failed_tests || 0;
-                hourlyData[hour].skipped_tests += summary.skipped_tests || 0;
-            }});
-            
-            // Calculate rates
-            Object.keys(hourlyData).forEach(hour => {{
-                const data = hourlyData[hour];
-                if (data.total_tests > 0) {{
-                    data.passed_rate = Math.round(data.passed_tests / data.total_tests * 100 * 100) / 100;
-                }}
-            }});
-            
-            return hourlyData;
-        }}
-        
-        function generateWeeklyTrends(executions) {{
-            const weeklyData = {{}};
-            
-            executions.forEach(record => {{
-                const execTime = new Date(record.execution_metadata.execution_time);
-                const year = execTime.getFullYear();
-                const week = getWeekNumber(execTime);
-                const weekKey = `${{year}}-W${{week.toString().padStart(2, '0')}}`;
-                const summary = record.overall_summary || {{}};
-                
-                if (!weeklyData[weekKey]) {{
-                    weeklyData[weekKey] = {{
-                        executions: 0, total_tests: 0, passed_tests: 0,
-                        failed_tests: 0, skipped_tests: 0
-                    }};
-                }}
-                
-                weeklyData[weekKey].executions += 1;
-                weeklyData[weekKey].total_tests += summary.total_tests || 0;
-                weeklyData[weekKey].passed_tests += summary.passed_tests || 0;
-                weeklyData[weekKey].failed_tests += summary.failed_tests || 0;
-                weeklyData[weekKey].skipped_tests += summary.skipped_tests || 0;
-            }});
-            
-            // Calculate rates
-            Object.keys(weeklyData).forEach(week => {{
-                const data = weeklyData[week];
-                if (data.total_tests > 0) {{
-                    data.passed_rate = Math.round(data.passed_tests / data.total_tests * 100 * 100) / 100;
-                }}
-            }});
-            
-            return weeklyData;
-        }}
-        
-        function generateMonthlyTrends(executions) {{
-            const monthlyData = {{}};
-            
-            executions.forEach(record => {{
-                const execTime = new Date(record.execution_metadata.execution_time);
-                const monthKey = execTime.toISOString().substring(0, 7); // YYYY-MM
-                const summary = record.overall_summary || {{}};
-                
-                if (!monthlyData[monthKey]) {{
-                    monthlyData[monthKey] = {{
-                        executions: 0, total_tests: 0, passed_tests: 0,
-                        failed_tests: 0, skipped_tests: 0
-                    }};
-                }}
-                
-                monthlyData[monthKey].executions += 1;
-                monthlyData[monthKey].total_tests += summary.total_tests || 0;
-                monthlyData[monthKey].passed_tests += summary.passed_tests || 0;
-                monthlyData[monthKey].failed_tests += summary.failed_tests || 0;
-                monthlyData[monthKey].skipped_tests += summary.skipped_tests || 0;
-            }});
-            
-            // Calculate rates
-            Object.keys(monthlyData).forEach(month => {{
-                const data = monthlyData[month];
-                if (data.total_tests > 0) {{
-                    data.passed_rate = Math.round(data.passed_tests / data.total_tests * 100 * 100) / 100;
-                }}
-            }});
-            
-            return monthlyData;
-        }}
-        
-        function generateYearlyTrends(executions) {{
-            const yearlyData = {{}};
-            
-            executions.forEach(record => {{
-                const execTime = new Date(record.execution_metadata.execution_time);
-                const year = execTime.getFullYear().toString();
-                const summary = record.overall_summary || {{}};
-                
-                if (!yearlyData[year]) {{
-                    yearlyData[year] = {{
-                        executions: 0, total_tests: 0, passed_tests: 0,
-                        failed_tests: 0, skipped_tests: 0
-                    }};
-                }}
-                
-                yearlyData[year].executions += 1;
-                yearlyData[year].total_tests += summary.total_tests || 0;
-                yearlyData[year].passed_tests += summary.passed_tests || 0;
-                yearlyData[year].failed_tests += summary.failed_tests || 0;
-                yearlyData[year].skipped_tests += summary.skipped_tests || 0;
-            }});
-            
-            // Calculate rates
-            Object.keys(yearlyData).forEach(year => {{
-                const data = yearlyData[year];
-                if (data.total_tests > 0) {{
-                    data.passed_rate = Math.round(data.passed_tests / data.total_tests * 100 * 100) / 100;
-                }}
-            }});
-            
-            return yearlyData;
-        }}
-        
-        function getWeekNumber(date) {{
-            const d = new Date(Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()));
-            const dayNum = d.getUTCDay() || 7;
-            d.setUTCDate(d.getUTCDate() + 4 - dayNum);
-            const yearStart = new Date(Date.UTC(d.getUTCFullYear(),0,1));
-            return Math.ceil((((d - yearStart) / 86400000) + 1)/7);
-        }}
+        // Time trend updates with more points than this are applied without animation
+        const ANIMATED_UPDATE_MAX_POINTS = 50;
         
         function updateTimeTrendsChartWithData(timeframe, data) {{
             if (!window.timeTrendsChart || !data) return;
             
             const chartTitle = `Test Execution Trends - ${{timeframe.charAt(0).toUpperCase() + timeframe.slice(1)}} View`;
             
-            window.timeTrendsChart.data.labels = Object.keys(data);
-            window.timeTrendsChart.data.datasets[0].data = Object.values(data).map(d => d.passed_rate || 0);
-            window.timeTrendsChart.data.datasets[1].data = Object.values(data).map(d => d.executions || 0);
+            const datasets = window.timeTrendsChart.data.datasets;
             window.timeTrendsChart.options.plugins.title.text = chartTitle;
-            window.timeTrendsChart.update('active');
+            if (Object.keys(data).length === 0) {{
+                // Nothing to plot: assign fresh arrays, since with decimation active dataset.data holds the
+                // decimated points and truncating it would leave the full series in _data to be redrawn
+                window.timeTrendsChart.data.labels = [];
+                datasets[0].data = [];
+                datasets[1].data = [];
+                window.timeTrendsChart.update('none');
+                return;
+            }}
+            [window.timeTrendsChart.data.labels, datasets[0].data, datasets[1].data] = timeSeriesPoints(data);
+            // Tweening every point redraws the whole chart each frame, so larger swaps are not animated
+            const labelCount = window.timeTrendsChart.data.labels.length;
+            window.timeTrendsChart.update(labelCount > ANIMATED_UPDATE_MAX_POINTS ? 'none' : 'active');
         }}
         
         function clearAllFilters() {{
-            document.getElementById('application-filter').value = '';
-            document.getElementById('environment-filter').value = '';
-            document.getElementById('source-db-filter').value = '';
-            document.getElementById('target-db-filter').value = '';
+            getFilterElements().selects.forEach(select => select.value = '');
             applyFilters();
         }}
         
         function updateFilterStatus() {{
+            const {{ selects, status: statusEl }} = getFilterElements();
             const activeFilters = [];
-            const filterSelects = [
-                {{ id: 'application-filter', name: '🔹 Application', icon: 'fas fa-cube' }},
-                {{ id: 'environment-filter', name: '🔹 Environment', icon: 'fas fa-server' }},
-                {{ id: 'source-db-filter', name: '🔹 Source DB', icon: 'fas fa-database' }},
-                {{ id: 'target-db-filter', name: '🔹 Target DB', icon: 'fas fa-hdd' }}
-            ];
-            
-            filterSelects.forEach(filter => {{
-                const element = document.getElementById(filter.id);
-                if (element && element.value) {{
-                    activeFilters.push(`${{filter.name}} ${{element.value}}`);
-                }}
-            }});
+            for (let i = 0; i < FILTER_SELECTS.length; i++) {{
+                const value = selects[i]?.value;
+                if (value) activeFilters.push(`${{FILTER_SELECTS[i].name}} ${{value}}`);
+            }}
             
-            const statusEl = document.getElementById('filter-status');
             if (activeFilters.length > 0) {{
                 statusEl.innerHTML = `<strong>🎯 Active:</strong> ${{activeFilters.join(' • ')}}`;
                 statusEl.className = 'filter-status-text active';
@@ -1487,158 +1426,530 @@ class EnhancedTrendsHTMLReportGenerator:
             // Implementation would depend on sheet data structure
         }}
         """
+
+
+
+def _minify_script_parts(parts) -> Tuple:
+    """Strip indentation, blank lines and whole-line comments from pre-parsed script template parts."""
+    # Escaped braces split literal text into several parts; join each run of text up to a field first
+    merged = []
+    pending_text = ''
+    for literal_text, field_name, format_spec, conversion in parts:
+        pending_text += literal_text
+        if field_name is not None:
+            merged.append((pending_text, field_name, format_spec, conversion))
+            pending_text = ''
+    merged.append((pending_text, None, None, None))
     
-    def _generate_filters_section(self, filter_data: Dict) -> str:
-        """Generate the enhanced filters section HTML with improved styling."""
-        return f"""
-        <div class="row mb-5">
+    minified = []
+    for literal_text, field_name, format_spec, conversion in merged:
+        lines = literal_text.split('\n')
+        if len(lines) > 1:
+            # The first and last lines continue around replacement fields, so only their outer edges are trimmed
+            inner_lines = (line.strip() for line in lines[1:-1])
+            literal_text = '\n'.join([
+                lines[0].rstrip(),
+                *(line for line in inner_lines if line and not line.startswith('//')),
+                lines[-1].lstrip(),
+            ])
+        minified.append((literal_text, field_name, format_spec, conversion))
+    return tuple(minified)
+
+
+# Parsed and minified once at import; reports only fill in the data fields
+_CHARTS_SCRIPT_PARTS = _minify_script_parts(string.Formatter().parse(_CHARTS_SCRIPT_TEMPLATE))
+
+# Digest of the page markup, script and stylesheet, part of every cached report's key so pages
+# rendered by an older generator are not served next to a rewritten stylesheet
+_TEMPLATES_DIGEST = hashlib.blake2b('\0'.join((
+    _DASHBOARD_CSS,
+    _DASHBOARD_TEMPLATE,
+    _FILTERS_SECTION_TEMPLATE,
+    _METRIC_CARD_FMT,
+    _SHEET_ROW_FMT,
+    _SHEET_CATEGORY_FMT,
+    _SHEET_ROW_END,
+    _CATEGORY_ROW_FMT,
+    _INDIVIDUAL_ROW_FMT,
+    _INDIVIDUAL_MORE_ROW_FMT,
+    _INDIVIDUAL_LAZY_ROWS_FMT,
+    _CHARTS_SCRIPT_TEMPLATE,
+)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class EnhancedTrendsHTMLReportGenerator:
+    """
+    Generates comprehensive interactive HTML reports for test execution trends analysis.
+    Features tab-based navigation, drill-down capabilities, and time-series visualizations.
+    """
+    
+    # Rendered reports kept in the output directory's .cache folder for repeated snapshots
+    CACHE_SIZE = 20
+    # Bump when rendering changes outside the templates, so previously cached pages are not reused
+    CACHE_VERSION = 1
+    # Individual test rows rendered into the page; further rows are added as the table scrolls
+    INDIVIDUAL_ROW_LIMIT = 500
+    # Directories already created by this process, shared by all generators
+    _created_dirs = set()
+    
+    def __init__(self, execution_history: list = None, output_file: str = None):
+        self.execution_history = execution_history or []
+        # (fingerprint, chart script fields) of the last rendered chart script
+        self._charts_cache = None
+        if not output_file:
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
+            self.output_file = f"output/Enhanced_Test_Trends_Report_{timestamp}.html"
+        else:
+            self.output_file = output_file
+    
+    def generate_comprehensive_trends_report(self, trends_data: Dict, output_file: str = None,
+                                             gzip_output: bool = False) -> str:
+        """
+        Generate comprehensive HTML trends report from persistent data.
+        
+        Args:
+            trends_data: Comprehensive trends data from PersistentTrendsAnalyzer
+            output_file: Optional specific output file path to override default
+            gzip_output: Write a gzip-compressed report to the output path plus ".gz"
+            
+        Returns:
+            str: Path to the generated HTML report
+        """
+        print("🌐 Generating comprehensive interactive trends dashboard...")
+        
+        # Use provided output file or default
+        if output_file:
+            self.output_file = output_file
+        
+        # Ensure output directory exists
+        output_dir = os.path.dirname(self.output_file)
+        self._ensure_dir(output_dir)
+        self._write_stylesheet(output_dir)
+        
+        # Identical snapshots render identical pages, so reuse a cached copy when there is one
+        suffix = '.gz' if gzip_output else ''
+        report_path = self.output_file + suffix
+        cache_dir = os.path.join(output_dir, '.cache')
+        cache_path = os.path.join(cache_dir, f"trends_{self._cache_key(trends_data)}.html{suffix}")
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, report_path)
+            os.utime(cache_path)
+            return report_path
+        
+        # Stream sections into a buffered (or compressing) file instead of building the whole page first
+        if gzip_output:
+            report = gzip.open(report_path, 'wt', encoding='utf-8', compresslevel=6)
+        else:
+            report = open(report_path, 'w', encoding='utf-8', buffering=1 << 16)
+        with report as f:
+            f.writelines(self._iter_html_chunks(trends_data))
+        
+        try:
+            self._ensure_dir(cache_dir)
+            shutil.copyfile(report_path, cache_path)
+            self._evict_cached_reports(cache_dir)
+        except OSError as e:
+            print(f"⚠️ Could not cache trends report: {e}")
+        
+        return report_path
+    
+    def _ensure_dir(self, path: str):
+        """Create a directory once per process; later reports to the same place skip the check."""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+    
+    def _write_stylesheet(self, output_dir: str):
+        """Write the shared dashboard stylesheet unless an identical copy is already there."""
+        css_path = os.path.join(output_dir, _DASHBOARD_CSS_FILE)
+        if os.path.exists(css_path):
+            with open(css_path, 'r', encoding='utf-8') as f:
+                if f.read() == _DASHBOARD_CSS:
+                    return
+        with open(css_path, 'w', encoding='utf-8') as f:
+            f.write(_DASHBOARD_CSS)
+    
+    def _cache_key(self, trends_data: Dict) -> str:
+        """Hash the trends snapshot and raw execution history the page is rendered from, and the generator version."""
+        # The analyzer stamps every run with its own time; left in, no snapshot would ever hit the cache
+        metadata = trends_data.get('metadata')
+        if isinstance(metadata, dict) and not _VOLATILE_METADATA_KEYS.isdisjoint(metadata):
+            trends_data = {**trends_data, 'metadata': {
+                key: value for key, value in metadata.items() if key not in _VOLATILE_METADATA_KEYS
+            }}
+        payload = _dumps_compact(
+            [self.CACHE_VERSION, _TEMPLATES_DIGEST, trends_data, self.execution_history], sort_keys=True
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _evict_cached_reports(self, cache_dir: str):
+        """Keep only the most recently used cached reports."""
+        cached = [entry for entry in os.scandir(cache_dir) if entry.name.startswith('trends_')]
+        if len(cached) <= self.CACHE_SIZE:
+            return
+        cached.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in cached[self.CACHE_SIZE:]:
+            os.remove(entry.path)
+    
+    def _generate_comprehensive_html_content(self, trends_data: Dict) -> str:
+        """Generate comprehensive HTML content from persistent trends data."""
+        return ''.join(self._iter_html_chunks(trends_data))
+    
+    def _iter_html_chunks(self, trends_data: Dict):
+        """Yield the dashboard page piece by piece, rendering large sections only when reached."""
+        metadata = trends_data.get('metadata', {})
+        overall_trends = trends_data.get('overall_trends', {})
+        insights = trends_data.get('insights', [])
+        filter_data = trends_data.get('filter_data', {})
+        # Both filter panels list the same options, so build them once
+        filter_options = self._generate_filter_options(filter_data)
+        application_options, environment_options, source_db_options, target_db_options = filter_options
+        
+        # Large sections are callables so each is built just before it is written
+        context = {
+            'filters_section': self._iter_filters_section(filter_options),
+            'metric_cards': '\n'.join(
+                _METRIC_CARD_FMT.format(icon=icon, value=value, label=label)
+                for icon, value, label in (
+                    ('play-circle', metadata.get('total_executions', 0), 'Total Executions'),
+                    ('calendar-alt', f"{metadata.get('date_range', {}).get('span_days', 0)} Days", 'History Span'),
+                    ('percentage', f"{overall_trends.get('overall_passed_rate', 0):.1f}%", 'Overall Success Rate'),
+                    ('clock', f"{overall_trends.get('avg_execution_time_ms', 0):.0f}ms", 'Avg Execution Time'),
+                )
+            ),
+            'application_options': application_options,
+            'environment_options': environment_options,
+            'source_db_options': source_db_options,
+            'target_db_options': target_db_options,
+            'insights': ''.join(map(_INSIGHT_FMT, insights[:6])),
+            'sheet_analysis': partial(self._generate_sheet_analysis_content, trends_data.get('sheet_level_trends', {})),
+            'category_analysis': partial(self._generate_category_analysis_content, trends_data.get('category_level_trends', {})),
+            'individual_tests': partial(self._generate_individual_tests_content, trends_data.get('individual_test_trends', {})),
+            'generated_on': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'trends_json': partial(_json_island, trends_data),
+            'javascript_charts': partial(self._iter_javascript_charts, trends_data),
+        }
+        
+        yield from _iter_template(_DASHBOARD_PARTS, context)
+    
+    def _generate_sheet_analysis_content(self, sheet_trends: Dict) -> str:
+        """Generate detailed sheet analysis content."""
+        parts = ['''
+        <div class="row">
             <div class="col-12">
-                <div class="filters-container">
-                    <div class="filters-header">
-                        <div class="row align-items-center">
-                            <div class="col-auto">
-                                <div class="filter-icon-wrapper">
-                                    <i class="fas fa-sliders-h"></i>
-                                </div>
-                            </div>
-                            <div class="col">
-                                <h4 class="filters-title mb-0">Smart Filters</h4>
-                                <p class="filters-subtitle mb-0">Drill down into your test execution data</p>
-                            </div>
-                            <div class="col-auto">
-                                <button class="btn btn-outline-light btn-sm filter-clear-btn" onclick="clearAllFilters()">
-                                    <i class="fas fa-undo me-1"></i>Reset All
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <div class="filters-content">
-                        <div class="row g-4">
-                            <div class="col-lg-3 col-md-6">
-                                <div class="filter-group">
-                                    <div class="filter-label">
-                                        <i class="fas fa-cube text-primary me-2"></i>
-                                        <label for="application-filter" class="form-label">Application</label>
-                                    </div>
-                                    <select id="application-filter" class="form-select filter-select" onchange="applyFilters()">
-                                        <option value="">🌐 All Applications</option>
-                                        {self._generate_application_options(filter_data)}
-                                    </select>
-                                </div>
-                            </div>
-                            
-                            <div class="col-lg-3 col-md-6">
-                                <div class="filter-group">
-                                    <div class="filter-label">
-                                        <i class="fas fa-server text-success me-2"></i>
-                                        <label for="environment-filter" class="form-label">Environment</label>
-                                    </div>
-                                    <select id="environment-filter" class="form-select filter-select" onchange="applyFilters()">
-                                        <option value="">🏗️ All Environments</option>
-                                        {self._generate_environment_options(filter_data)}
-                                    </select>
-                                </div>
-                            </div>
-                            
-                            <div class="col-lg-3 col-md-6">
-                                <div class="filter-group">
-                                    <div class="filter-label">
-                                        <i class="fas fa-database text-info me-2"></i>
-                                        <label for="source-db-filter" class="form-label">Source Database</label>
-                                    </div>
-                                    <select id="source-db-filter" class="form-select filter-select" onchange="applyFilters()">
-                                        <option value="">📤 All Source DBs</option>
-                                        {self._generate_source_db_options(filter_data)}
-                                    </select>
-                                </div>
-                            </div>
-                            
-                            <div class="col-lg-3 col-md-6">
-                                <div class="filter-group">
-                                    <div class="filter-label">
-                                        <i class="fas fa-hdd text-warning me-2"></i>
-                                        <label for="target-db-filter" class="form-label">Target Database</label>
-                                    </div>
-                                    <select id="target-db-filter" class="form-select filter-select" onchange="applyFilters()">
-                                        <option value="">📥 All Target DBs</option>
-                                        {self._generate_target_db_options(filter_data)}
-                                    </select>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="row mt-4">
-                            <div class="col-12">
-                                <div class="filter-status-container">
-                                    <div class="filter-status-wrapper">
-                                        <i class="fas fa-info-circle me-2"></i>
-                                        <span id="filter-status" class="filter-status-text">No filters applied</span>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
+                <div class="chart-container">
+                    <h4><i class="fas fa-layer-group text-success"></i> Sheet Performance Analysis</h4>
+                    <div class="table-container">
+                        <table class="table table-hover">
+                            <thead class="table-dark">
+                                <tr>
+                                    <th>Sheet Name</th>
+                                    <th>Success Rate</th>
+                                    <th>Total Executions</th>
+                                    <th>Avg Execution Time</th>
+                                    <th>Actions</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+        ''']
+        
+        for sheet_name, data in sheet_trends.items():
+            row = {**_ROW_DEFAULTS, **data, 'sheet_name': sheet_name, 'anchor': sheet_name.translate(_ANCHOR_TBL)}
+            row['status_class'] = _STATUS_CLASS_TBL[_rate_bucket(row['overall_passed_rate'], 10, 10)]
+            parts.append(_SHEET_ROW_FMT.format_map(row))
+            
+            # Add category breakdown for this sheet
+            categories = data.get('categories', {})
+            for cat_name, cat_data in categories.items():
+                cat_row = {**_ROW_DEFAULTS, **cat_data, 'cat_name': cat_name}
+                cat_row['cat_class'] = _STATUS_CLASS_TBL[_rate_bucket(cat_row['passed_rate'], 10, 10)]
+                parts.append(_SHEET_CATEGORY_FMT.format_map(cat_row))
+            
+            parts.append(_SHEET_ROW_END)
+        
+        parts.append('''
+                            </tbody>
+                        </table>
                     </div>
                 </div>
             </div>
         </div>
-        """
+        ''')
+        return ''.join(parts)
     
-    def _generate_application_options(self, filter_data: Dict) -> str:
-        """Generate enhanced HTML options for application filter."""
-        applications = filter_data.get('applications', [])
-        options = []
-        app_icons = {
-            'DUMMY': '🎯',
-            'cross_db_validator': '⚡',
-            'default': '📦'
-        }
+    def _generate_category_analysis_content(self, category_trends: Dict) -> str:
+        """Generate detailed category analysis content."""
+        parts = ['''
+        <div class="row">
+            <div class="col-md-8">
+                <div class="chart-container">
+                    <h4><i class="fas fa-tags text-warning"></i> Category Performance Detailed Analysis</h4>
+                    <div class="table-container">
+                        <table class="table table-hover">
+                            <thead class="table-dark">
+                                <tr>
+                                    <th>Category</th>
+                                    <th>Success Rate</th>
+                                    <th>Total Tests</th>
+                                    <th>Executions</th>
+                                    <th>Avg Time</th>
+                                    <th>Trend</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+        ''']
         
-        for app in applications:
-            icon = app_icons.get(app, '🔧')
-            options.append(f'<option value="{app}">{icon} {app}</option>')
-        return ''.join(options)
-    
-    def _generate_environment_options(self, filter_data: Dict) -> str:
-        """Generate enhanced HTML options for environment filter."""
-        environments = filter_data.get('environments', [])
-        options = []
-        env_icons = {
-            'DEV': '🛠️',
-            'NP1': '🧪',
-            'production': '🏭',
-            'default': '🌐'
-        }
+        for cat_name, data in category_trends.items():
+            row = {**_ROW_DEFAULTS, **data, 'cat_name': cat_name}
+            success_rate = row['overall_passed_rate']
+            row['status_class'] = _STATUS_CLASS_TBL[_rate_bucket(success_rate, 10, 10)]
+            row['trend_icon'] = _TREND_ICON_TBL[_rate_bucket(success_rate, 5, 20)]
+            parts.append(_CATEGORY_ROW_FMT.format_map(row))
         
-        for env in environments:
-            icon = env_icons.get(env, '⚙️')
-            options.append(f'<option value="{env}">{icon} {env.upper()}</option>')
-        return ''.join(options)
+        parts.append('''
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            </div>
+            <div class="col-md-4">
+                <div class="chart-container">
+                    <h4><i class="fas fa-chart-pie"></i> Category Distribution</h4>
+                    <canvas id="categoryDistributionChart" class="chart-canvas"></canvas>
+                </div>
+            </div>
+        </div>
+        ''')
+        return ''.join(parts)
     
-    def _generate_source_db_options(self, filter_data: Dict) -> str:
-        """Generate enhanced HTML options for source database filter."""
-        source_apps = filter_data.get('source_applications', [])
-        source_envs = filter_data.get('source_environments', [])
-        options = []
+    def _generate_individual_tests_content(self, individual_trends: Dict) -> str:
+        """Generate detailed individual test analysis content."""
+        parts = ['''
+        <div class="row">
+            <div class="col-12">
+                <div class="chart-container">
+                    <h4><i class="fas fa-list text-info"></i> Individual Test Performance</h4>
+                    <div class="mb-3">
+                        <input type="text" class="form-control" id="testFilter" placeholder="🔍 Filter tests by name...">
+                    </div>
+                    <div class="table-container">
+                        <table class="table table-hover table-sm" id="individualTestsTable">
+                            <thead class="table-dark">
+                                <tr>
+                                    <th>Test ID</th>
+                                    <th>Category</th>
+                                    <th>Sheet</th>
+                                    <th>Success Rate</th>
+                                    <th>Executions</th>
+                                    <th>Avg Time</th>
+                                    <th>Status</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+        ''']
+        
+        # Sort tests by success rate (worst first for attention); rates are read once up front
+        # so the sort key is a C-level list lookup rather than a Python lambda per test
+        test_items = list(individual_trends.items())
+        passed_rates = [data.get('passed_rate', 0) for data in individual_trends.values()]
+        total_tests = len(test_items)
+        
+        # Large suites only render the worst tests up front; the rest are added on scroll
+        row_limit = self.INDIVIDUAL_ROW_LIMIT
+        if total_tests > _HEAP_SELECT_MIN_TESTS:
+            # Only the rendered rows need ordering; the browser sorts the remainder when it renders them
+            worst_indexes = heapq.nsmallest(row_limit, range(total_tests), key=passed_rates.__getitem__)
+            shown = set(worst_indexes)
+            visible_tests = [test_items[index] for index in worst_indexes]
+            remaining_tests = [item for index, item in enumerate(test_items) if index not in shown]
+        else:
+            sorted_tests = [test_items[index] for index in sorted(range(total_tests), key=passed_rates.__getitem__)]
+            visible_tests = sorted_tests[:row_limit]
+            remaining_tests = sorted_tests[row_limit:]
         
-        # Combine applications and environments for source databases
-        for app in source_apps:
-            for env in source_envs:
-                db_combo = f"{app}.{env}"
-                options.append(f'<option value="{db_combo}">📤 {db_combo}</option>')
+        for test_id, data in visible_tests:
+            passed_rate = data.get('passed_rate', 0)
+            bucket = _rate_bucket(passed_rate, 10, 10)
+            category = data.get('category', 'Unknown')
+            parts.append(_INDIVIDUAL_ROW_FMT % (
+                html.escape(test_id),
+                html.escape(f'{test_id}|{category}'.lower()),
+                test_id,
+                category,
+                data.get('sheet_name', 'Unknown'),
+                _STATUS_CLASS_TBL[bucket],
+                passed_rate,
+                data.get('execution_count', 0),
+                data.get('avg_execution_time_ms', 0),
+                _STATUS_TEXT_TBL[bucket],
+            ))
+        
+        if remaining_tests:
+            parts.append(_INDIVIDUAL_MORE_ROW_FMT.format(shown=row_limit, total=total_tests))
+        
+        parts.append('''
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            </div>
+        </div>
+        ''')
+        
+        if remaining_tests:
+            pending_rows = [
+                [
+                    test_id,
+                    data.get('category', 'Unknown'),
+                    data.get('sheet_name', 'Unknown'),
+                    data.get('passed_rate', 0),
+                    data.get('execution_count', 0),
+                    data.get('avg_execution_time_ms', 0),
+                ]
+                for test_id, data in remaining_tests
+            ]
+            parts.append(_INDIVIDUAL_LAZY_ROWS_FMT.format(
+                pending_json=_json_island(pending_rows), batch_size=row_limit, total=total_tests
+            ))
+        return ''.join(parts)
+    
+    def _generate_javascript_charts(self, trends_data: Dict) -> str:
+        """Generate comprehensive JavaScript for all charts."""
+        return ''.join(self._iter_javascript_charts(trends_data))
+    
+    def _iter_javascript_charts(self, trends_data: Dict):
+        """Yield the chart script in pieces so the embedded time trends are never copied into it."""
+        time_trends = trends_data.get('time_based_trends', {})
+        sheet_trends = trends_data.get('sheet_level_trends', {})
+        category_trends = trends_data.get('category_level_trends', {})
         
-        return ''.join(options)
+        # Repeated renders of the same data (e.g. plain and gzip output) reuse the serialized literals
+        fingerprint = hashlib.blake2b(
+            _dumps_compact([time_trends, sheet_trends, category_trends, self.execution_history]), digest_size=16
+        ).digest()
+        if self._charts_cache is not None and self._charts_cache[0] == fingerprint:
+            return _iter_template(_CHARTS_SCRIPT_PARTS, self._charts_cache[1])
+        
+        # Walk each trends dict once; the value lists follow the key order
+        sheet_values = list(sheet_trends.values())
+        category_values = list(category_trends.values())
+        
+        # Convert data to JSON literals
+        context = {
+            'partitioned_time_data': base64.b64encode(gzip.compress(
+                _dumps_compact(self._generate_partitioned_time_trends()), compresslevel=9, mtime=0
+            )).decode('ascii'),
+            'sheet_data': _json_island(list(sheet_trends)),
+            'sheet_rates': _json_island([data.get('overall_passed_rate', 0) for data in sheet_values]),
+            'category_data': _json_island(list(category_trends)),
+            'category_rates': _json_island([data.get('overall_passed_rate', 0) for data in category_values]),
+            'category_executions': _json_island([data.get('total_executions', 0) for data in category_values]),
+            'hourly_data': _json_island(time_trends.get('hourly', {})),
+            'daily_data': _json_island(time_trends.get('daily', {})),
+            'weekly_data': _json_island(time_trends.get('weekly', {})),
+            'monthly_data': _json_island(time_trends.get('monthly', {})),
+            'yearly_data': _json_island(time_trends.get('yearly', {})),
+        }
+        self._charts_cache = (fingerprint, context)
+        return _iter_template(_CHARTS_SCRIPT_PARTS, context)
     
-    def _generate_target_db_options(self, filter_data: Dict) -> str:
-        """Generate enhanced HTML options for target database filter."""
-        target_apps = filter_data.get('target_applications', [])
-        target_envs = filter_data.get('target_environments', [])
-        options = []
+    def _generate_partitioned_time_trends(self) -> Dict[str, Dict[str, Dict]]:
+        """Aggregate the execution history per application/environment filter for every time frame.
         
-        # Combine applications and environments for target databases
-        for app in target_apps:
-            for env in target_envs:
-                db_combo = f"{app}.{env}"
-                options.append(f'<option value="{db_combo}">📥 {db_combo}</option>')
+        Returns {application: {environment: {time_frame: {bucket: counters}}}}, where '' stands for
+        "any", so the page's filters only look trends up instead of re-aggregating executions.
+        """
+        rows = []
+        for record in self.execution_history:
+            metadata = record.get('execution_metadata', {})
+            summary = record.get('overall_summary') or {}
+            rows.append((
+                metadata.get('application') or '',
+                metadata.get('environment') or '',
+                metadata.get('execution_time'),
+                # Missing or null counters become 0 here, once, so the counter columns stay int64
+                *(summary.get(column) or 0 for column in _TIME_TREND_COUNTERS[1:]),
+            ))
+        if not rows:
+            return {}
+        
+        executions = pd.DataFrame(rows, columns=['application', 'environment', 'execution_time', *_TIME_TREND_COUNTERS[1:]])
+        executions['executions'] = 1
+        times = pd.to_datetime(executions.pop('execution_time').map(_wall_clock_time))
+        executions, times = executions[times.notna()], times[times.notna()]
+        # Buckets are keyed by their start so grouping stays on datetime64 values;
+        # labels are only formatted once per bucket below
+        days = times.dt.normalize()
+        time_frame_keys = {
+            'hourly': times.dt.hour,
+            'daily': days,
+            'weekly': days - pd.to_timedelta(times.dt.weekday, unit='D'),
+            'monthly': days - pd.to_timedelta(times.dt.day - 1, unit='D'),
+            'yearly': times.dt.year,
+        }
         
-        return ''.join(options)
\ No newline at end of file
+        partitions = {}
+        for time_frame, bucket in time_frame_keys.items():
+            by_pair = executions.assign(bucket=bucket).groupby(['application', 'environment', 'bucket'])[
+                list(_TIME_TREND_COUNTERS)
+            ].sum()
+            format_label = _BUCKET_LABEL_FORMATS[time_frame]
+            labels = {key: format_label(key) for key in by_pair.index.unique('bucket')}
+            # Filtering on only one of application/environment sums the pairs over the other ('' for any);
+            # all partitions share one frame so rates are computed and rows converted in a single pass
+            grouped = pd.concat([
+                by_pair,
+                by_pair.groupby(level=['application', 'bucket']).sum().assign(environment='')
+                    .set_index('environment', append=True).reorder_levels(by_pair.index.names),
+                by_pair.groupby(level=['environment', 'bucket']).sum().assign(application='')
+                    .set_index('application', append=True).reorder_levels(by_pair.index.names),
+            ])
+            total_tests = grouped['total_tests'].where(grouped['total_tests'] > 0)
+            for column in ('passed', 'failed', 'skipped'):
+                grouped[f'{column}_rate'] = (grouped[f'{column}_tests'] / total_tests * 100).round(2).fillna(0.0)
+            # Rows come grouped by partition, so each partition's buckets are looked up once, not per row;
+            # an unknown ('') application or environment repeats keys, and the 'any' sums win as before
+            partition_key = buckets = None
+            for (application, environment, bucket), counters in zip(grouped.index, grouped.to_dict('records')):
+                if (application, environment) != partition_key:
+                    partition_key = (application, environment)
+                    buckets = partitions.setdefault(application, {}).setdefault(environment, {}).setdefault(time_frame, {})
+                buckets[labels[bucket]] = counters
+        return partitions
+    
+    def _generate_filters_section(self, filter_data: Dict, filter_options: Tuple[str, str, str, str] = None) -> str:
+        """Generate the enhanced filters section HTML with improved styling."""
+        if filter_options is None:
+            filter_options = self._generate_filter_options(filter_data)
+        return ''.join(self._iter_filters_section(filter_options))
+    
+    def _iter_filters_section(self, filter_options: Tuple[str, str, str, str]):
+        """Yield the filters section as its static markup and option lists, without joining them."""
+        application_options, environment_options, source_db_options, target_db_options = filter_options
+        return _iter_template(_FILTERS_SECTION_PARTS, {
+            'application_options': application_options,
+            'environment_options': environment_options,
+            'source_db_options': source_db_options,
+            'target_db_options': target_db_options,
+        })
+    
+    def _generate_filter_options(self, filter_data: Dict) -> Tuple[str, str, str, str]:
+        """Generate the application, environment, source DB and target DB option lists."""
+        # The option builder is memoized on the filter values themselves, so rebuilt filter_data
+        # dicts and later generators reuse the option lists already generated
+        applications, environments, source_apps, source_envs, target_apps, target_envs = (
+            tuple(filter_data.get(key, ())) for key in _FILTER_DATA_KEYS
+        )
+        return (
+            self._generate_options('application', applications),
+            self._generate_options('environment', environments),
+            self._generate_options('source_db', _db_combos(source_apps, source_envs)),
+            self._generate_options('target_db', _db_combos(target_apps, target_envs)),
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_options(kind: str, items: Tuple[str, ...]) -> str:
+        """Generate enhanced HTML options for one filter, styled by its _FILTER_OPTION_STYLES entry."""
+        icons, default_icon, transform = _FILTER_OPTION_STYLES[kind]
+        return ''.join(f'<option value="{item}">{icons.get(item, default_icon)} {transform(item)}</option>' for item in items)
\ No newline at end of file
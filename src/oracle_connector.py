@@ -9,9 +9,13 @@ from src.database_connection_base import DatabaseConnectionBase
 class OracleConnector(DatabaseConnectionBase):
     """Oracle database connector"""
     
-    def __init__(self, host: str, port: int, username: str, password: str, service_name: str):
+    dialect = "oracle"
+    
+    def __init__(self, host: str, port: int, username: str, password: str, service_name: str,
+                 statement_cache_size: int = 64):
         super().__init__(host, port, username, password)
         self.service_name = service_name
+        self.statement_cache_size = statement_cache_size
     
     def connect(self) -> Tuple[bool, str]:
         """Connect to Oracle database"""
@@ -20,10 +24,13 @@ class OracleConnector(DatabaseConnectionBase):
             # Create DSN (Data Source Name)
             dsn = f"{self.host}:{self.port}/{self.service_name}"
             
+            # Repeated SQL text (SELECT 1, SYSDATE, COUNT(*) ...) reuses the
+            # driver's parsed statement instead of being re-parsed per call
             self.connection = oracledb.connect(
                 user=self.username,
                 password=self.password,
-                dsn=dsn
+                dsn=dsn,
+                stmtcachesize=self.statement_cache_size
             )
             self.is_connected = True
             return True, "Connected to Oracle successfully"
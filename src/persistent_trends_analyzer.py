@@ -8,10 +8,44 @@ Provides time-based aggregation: Hourly, Daily, Weekly, Monthly, and Yearly tren
 import os
 import json
 import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime as dt, timedelta
 
+import numpy as np
+
+# Time frames of the time-based trends, in report order
+TIME_FRAMES = ('hourly', 'daily', 'weekly', 'monthly', 'yearly')
+
+# Counters summed into every time-based trend bucket
+TIME_TREND_COUNTERS = ('executions', 'total_tests', 'passed_tests', 'failed_tests', 'skipped_tests')
+
+# Rates of the passed, failed and skipped counters over total_tests
+TIME_TREND_RATES = ('passed_rate', 'failed_rate', 'skipped_rate')
+
+
+def _bucket_sums(keys: np.ndarray, counters: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum counter rows per bucket key, returning buckets in chronological (ascending key) order."""
+    # Sorting once here means charts get ordered labels whatever order the history was recorded in
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    return sorted_keys[starts], np.add.reduceat(counters[order], starts, axis=0)
+
+
+def _bucket_label(time_frame: str, key: Any) -> Any:
+    """Convert a bucket key from _bucket_sums into its time-based trend label."""
+    if time_frame == 'hourly':
+        return key
+    if time_frame == 'weekly':
+        year, week, _ = (datetime.date(1970, 1, 5) + timedelta(weeks=key - 1)).isocalendar()
+        return f"{year}-W{week:02d}"
+    if time_frame == 'daily':
+        return key.isoformat()
+    if time_frame == 'monthly':
+        return key.strftime('%Y-%m')
+    return str(key.year)
+
 
 class PersistentTrendsAnalyzer:
     """
@@ -48,48 +82,49 @@ class PersistentTrendsAnalyzer:
                 'message': 'Run some tests first to generate trend data'
             }
         
+        # Parsed once, shared by the metadata date range and the frequency insight
+        time_range = self._get_execution_time_range()
         trends_analysis = {
-            'metadata': self._generate_trends_metadata(),
+            'metadata': self._generate_trends_metadata(time_range),
             'overall_trends': self._generate_overall_trends(),
             'filter_data': self._generate_filter_data(),
-            'time_based_trends': {
-                'hourly': self._generate_hourly_trends(),
-                'daily': self._generate_daily_trends(),
-                'weekly': self._generate_weekly_trends(),
-                'monthly': self._generate_monthly_trends(),
-                'yearly': self._generate_yearly_trends()
-            },
+            'time_based_trends': self._generate_time_trends(self.execution_history),
             'sheet_level_trends': self._generate_sheet_trends(),
             'category_level_trends': self._generate_category_trends(),
             'individual_test_trends': self._generate_individual_test_trends(),
             'performance_trends': self._generate_performance_trends(),
-            'insights': self._generate_trend_insights()
+            'insights': self._generate_trend_insights(time_range)
         }
         
         return trends_analysis
     
-    def _generate_trends_metadata(self) -> Dict:
+    def _get_execution_time_range(self) -> Tuple[dt, dt]:
+        """Get the earliest and latest execution times, parsing each timestamp once."""
+        execution_times = [dt.fromisoformat(record['execution_metadata']['execution_time']) 
+                          for record in self.execution_history]
+        return min(execution_times), max(execution_times)
+    
+    def _generate_trends_metadata(self, time_range: Optional[Tuple[dt, dt]] = None) -> Dict:
         """Generate metadata about the trends analysis."""
         if not self.execution_history:
             return {}
         
-        execution_times = [dt.fromisoformat(record['execution_metadata']['execution_time']) 
-                          for record in self.execution_history]
+        earliest, latest = time_range or self._get_execution_time_range()
         
         return {
             'total_executions': len(self.execution_history),
             'analysis_generated': datetime.datetime.now().isoformat(),
             'date_range': {
-                'earliest': min(execution_times).isoformat(),
-                'latest': max(execution_times).isoformat(),
-                'span_days': (max(execution_times) - min(execution_times)).days
+                'earliest': earliest.isoformat(),
+                'latest': latest.isoformat(),
+                'span_days': (latest - earliest).days
             },
             'data_source': self.data_file,
             'analysis_levels': [
                 'overall_summary', 'sheet_level', 'category_level', 
                 'individual_test_case', 'performance_metrics'
             ],
-            'time_aggregations': ['hourly', 'daily', 'weekly', 'monthly', 'yearly']
+            'time_aggregations': list(TIME_FRAMES)
         }
     
     def _generate_overall_trends(self) -> Dict:
@@ -209,142 +244,47 @@ class PersistentTrendsAnalyzer:
         
         return result
     
-    def _generate_hourly_trends(self) -> Dict:
-        """Generate hourly trend analysis."""
-        hourly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0, 
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in self.execution_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            hour_key = exec_time.hour
-            summary = record.get('overall_summary', {})
-            
-            hourly_data[hour_key]['executions'] += 1
-            hourly_data[hour_key]['total_tests'] += summary.get('total_tests', 0)
-            hourly_data[hour_key]['passed_tests'] += summary.get('passed_tests', 0)
-            hourly_data[hour_key]['failed_tests'] += summary.get('failed_tests', 0)
-            hourly_data[hour_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate success rates for each hour
-        for hour, data in hourly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(hourly_data)
-    
-    def _generate_daily_trends(self) -> Dict:
-        """Generate daily trend analysis."""
-        daily_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in self.execution_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            day_key = exec_time.strftime('%Y-%m-%d')
-            summary = record.get('overall_summary', {})
-            
-            daily_data[day_key]['executions'] += 1
-            daily_data[day_key]['total_tests'] += summary.get('total_tests', 0)
-            daily_data[day_key]['passed_tests'] += summary.get('passed_tests', 0)
-            daily_data[day_key]['failed_tests'] += summary.get('failed_tests', 0)
-            daily_data[day_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for day, data in daily_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(daily_data)
-    
-    def _generate_weekly_trends(self) -> Dict:
-        """Generate weekly trend analysis."""
-        weekly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in self.execution_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            # Get year and week number
-            year, week, _ = exec_time.isocalendar()
-            week_key = f"{year}-W{week:02d}"
-            summary = record.get('overall_summary', {})
-            
-            weekly_data[week_key]['executions'] += 1
-            weekly_data[week_key]['total_tests'] += summary.get('total_tests', 0)
-            weekly_data[week_key]['passed_tests'] += summary.get('passed_tests', 0)
-            weekly_data[week_key]['failed_tests'] += summary.get('failed_tests', 0)
-            weekly_data[week_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for week, data in weekly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(weekly_data)
-    
-    def _generate_monthly_trends(self) -> Dict:
-        """Generate monthly trend analysis."""
-        monthly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in self.execution_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            month_key = exec_time.strftime('%Y-%m')
-            summary = record.get('overall_summary', {})
-            
-            monthly_data[month_key]['executions'] += 1
-            monthly_data[month_key]['total_tests'] += summary.get('total_tests', 0)
-            monthly_data[month_key]['passed_tests'] += summary.get('passed_tests', 0)
-            monthly_data[month_key]['failed_tests'] += summary.get('failed_tests', 0)
-            monthly_data[month_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for month, data in monthly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(monthly_data)
-    
-    def _generate_yearly_trends(self) -> Dict:
-        """Generate yearly trend analysis."""
-        yearly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in self.execution_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            year_key = str(exec_time.year)
-            summary = record.get('overall_summary', {})
-            
-            yearly_data[year_key]['executions'] += 1
-            yearly_data[year_key]['total_tests'] += summary.get('total_tests', 0)
-            yearly_data[year_key]['passed_tests'] += summary.get('passed_tests', 0)
-            yearly_data[year_key]['failed_tests'] += summary.get('failed_tests', 0)
-            yearly_data[year_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for year, data in yearly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
+    def _generate_time_trends(self, records: List[Dict]) -> Dict[str, Dict]:
+        """Generate hourly, daily, weekly, monthly and yearly trends from the records."""
+        if not records:
+            return {time_frame: {} for time_frame in TIME_FRAMES}
+        
+        # One wall-clock time (epoch minutes) and one counter row per record
+        times = np.array([
+            dt.fromisoformat(record['execution_metadata']['execution_time']).replace(tzinfo=None)
+            for record in records
+        ], dtype='datetime64[m]')
+        # Missing or null counters become 0 here, once, so the sums stay integer-only
+        summaries = [record.get('overall_summary') or {} for record in records]
+        counters = np.array([
+            [1] + [summary.get(counter) or 0 for counter in TIME_TREND_COUNTERS[1:]]
+            for summary in summaries
+        ], dtype='int64')
+        
+        days = times.astype('datetime64[D]')
+        bucket_keys = {
+            'hourly': times.astype('int64') // 60 % 24,
+            # Epoch day 0 is a Thursday, so this counts Monday-based (ISO) weeks
+            'weekly': (days.astype('int64') + 3) // 7,
+            'daily': days,
+            'monthly': times.astype('datetime64[M]'),
+            'yearly': times.astype('datetime64[Y]'),
+        }
         
-        return dict(yearly_data)
+        time_trends = {}
+        for time_frame in TIME_FRAMES:
+            keys, sums = _bucket_sums(bucket_keys[time_frame], counters)
+            # Passed/failed/skipped rates of every bucket in one vectorised step
+            rates = np.round(sums[:, 2:] / np.maximum(sums[:, 1:2], 1) * 100, 2)
+            buckets = {}
+            for key, row, rate_row in zip(keys.tolist(), sums.tolist(), rates.tolist()):
+                data = dict(zip(TIME_TREND_COUNTERS, row))
+                if data['total_tests'] > 0:
+                    data.update(zip(TIME_TREND_RATES, rate_row))
+                buckets[_bucket_label(time_frame, key)] = data
+            time_trends[time_frame] = buckets
+        
+        return time_trends
     
     def _generate_sheet_trends(self) -> Dict:
         """Generate sheet-level trend analysis."""
@@ -483,7 +423,7 @@ class PersistentTrendsAnalyzer:
         
         return performance_trends
     
-    def _generate_trend_insights(self) -> List[str]:
+    def _generate_trend_insights(self, time_range: Optional[Tuple[dt, dt]] = None) -> List[str]:
         """Generate automated insights about the trends."""
         insights = []
         
@@ -506,9 +446,8 @@ class PersistentTrendsAnalyzer:
         
         # Execution frequency insights
         if len(self.execution_history) > 1:
-            exec_times = [dt.fromisoformat(record['execution_metadata']['execution_time']) 
-                         for record in self.execution_history]
-            time_span = (max(exec_times) - min(exec_times)).days
+            earliest, latest = time_range or self._get_execution_time_range()
+            time_span = (latest - earliest).days
             if time_span > 0:
                 frequency = len(self.execution_history) / time_span
                 insights.append(f"📊 Test execution frequency: {frequency:.1f} runs per day over {time_span} days")
@@ -560,11 +499,7 @@ class PersistentTrendsAnalyzer:
                     'target_db': target_db
                 }
             },
-            'hourly': self._generate_filtered_hourly_trends(filtered_history),
-            'daily': self._generate_filtered_daily_trends(filtered_history),
-            'weekly': self._generate_filtered_weekly_trends(filtered_history),
-            'monthly': self._generate_filtered_monthly_trends(filtered_history),
-            'yearly': self._generate_filtered_yearly_trends(filtered_history)
+            **self._generate_time_trends(filtered_history)
         }
     
     def _filter_execution_history(self, application: str = None, environment: str = None, 
@@ -666,139 +601,3 @@ class PersistentTrendsAnalyzer:
                     return f"{target_app}.{target_env}"
         
         return None
-    
-    def _generate_filtered_hourly_trends(self, filtered_history: List[Dict]) -> Dict:
-        """Generate hourly trends from filtered data."""
-        hourly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0, 
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in filtered_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            hour_key = exec_time.hour
-            summary = record.get('overall_summary', {})
-            
-            hourly_data[hour_key]['executions'] += 1
-            hourly_data[hour_key]['total_tests'] += summary.get('total_tests', 0)
-            hourly_data[hour_key]['passed_tests'] += summary.get('passed_tests', 0)
-            hourly_data[hour_key]['failed_tests'] += summary.get('failed_tests', 0)
-            hourly_data[hour_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate success rates
-        for hour, data in hourly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(hourly_data)
-    
-    def _generate_filtered_daily_trends(self, filtered_history: List[Dict]) -> Dict:
-        """Generate daily trends from filtered data."""
-        daily_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in filtered_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            day_key = exec_time.strftime('%Y-%m-%d')
-            summary = record.get('overall_summary', {})
-            
-            daily_data[day_key]['executions'] += 1
-            daily_data[day_key]['total_tests'] += summary.get('total_tests', 0)
-            daily_data[day_key]['passed_tests'] += summary.get('passed_tests', 0)
-            daily_data[day_key]['failed_tests'] += summary.get('failed_tests', 0)
-            daily_data[day_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for day, data in daily_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(daily_data)
-    
-    def _generate_filtered_weekly_trends(self, filtered_history: List[Dict]) -> Dict:
-        """Generate weekly trends from filtered data."""
-        weekly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in filtered_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            year, week, _ = exec_time.isocalendar()
-            week_key = f"{year}-W{week:02d}"
-            summary = record.get('overall_summary', {})
-            
-            weekly_data[week_key]['executions'] += 1
-            weekly_data[week_key]['total_tests'] += summary.get('total_tests', 0)
-            weekly_data[week_key]['passed_tests'] += summary.get('passed_tests', 0)
-            weekly_data[week_key]['failed_tests'] += summary.get('failed_tests', 0)
-            weekly_data[week_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for week, data in weekly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(weekly_data)
-    
-    def _generate_filtered_monthly_trends(self, filtered_history: List[Dict]) -> Dict:
-        """Generate monthly trends from filtered data."""
-        monthly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in filtered_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            month_key = exec_time.strftime('%Y-%m')
-            summary = record.get('overall_summary', {})
-            
-            monthly_data[month_key]['executions'] += 1
-            monthly_data[month_key]['total_tests'] += summary.get('total_tests', 0)
-            monthly_data[month_key]['passed_tests'] += summary.get('passed_tests', 0)
-            monthly_data[month_key]['failed_tests'] += summary.get('failed_tests', 0)
-            monthly_data[month_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for month, data in monthly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(monthly_data)
-    
-    def _generate_filtered_yearly_trends(self, filtered_history: List[Dict]) -> Dict:
-        """Generate yearly trends from filtered data."""
-        yearly_data = defaultdict(lambda: {
-            'executions': 0, 'total_tests': 0, 'passed_tests': 0,
-            'failed_tests': 0, 'skipped_tests': 0
-        })
-        
-        for record in filtered_history:
-            exec_time = dt.fromisoformat(record['execution_metadata']['execution_time'])
-            year_key = str(exec_time.year)
-            summary = record.get('overall_summary', {})
-            
-            yearly_data[year_key]['executions'] += 1
-            yearly_data[year_key]['total_tests'] += summary.get('total_tests', 0)
-            yearly_data[year_key]['passed_tests'] += summary.get('passed_tests', 0)
-            yearly_data[year_key]['failed_tests'] += summary.get('failed_tests', 0)
-            yearly_data[year_key]['skipped_tests'] += summary.get('skipped_tests', 0)
-        
-        # Calculate rates
-        for year, data in yearly_data.items():
-            if data['total_tests'] > 0:
-                data['passed_rate'] = round(data['passed_tests'] / data['total_tests'] * 100, 2)
-                data['failed_rate'] = round(data['failed_tests'] / data['total_tests'] * 100, 2)
-                data['skipped_rate'] = round(data['skipped_tests'] / data['total_tests'] * 100, 2)
-        
-        return dict(yearly_data)
\ No newline at end of file
@@ -9,6 +9,8 @@ from src.database_connection_base import DatabaseConnectionBase
 class PostgreSQLConnector(DatabaseConnectionBase):
     """PostgreSQL database connector"""
     
+    dialect = "postgresql"
+    
     def __init__(self, host: str, port: int, username: str, password: str, database: str):
         super().__init__(host, port, username, password)
         self.database = database
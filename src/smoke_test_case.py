@@ -73,10 +73,10 @@ class SmokeTestCase:
             functional_result = test_instance.execute()
             
             # Determine the basic functional outcome
-            if functional_result.startswith("PASSED"):
+            if functional_result.status == "PASSED":
                 test_passed_functionally = True
                 basic_status = "PASSED"
-            elif functional_result.startswith("SKIPPED"):
+            elif functional_result.status == "SKIPPED":
                 # For skipped tests, return as-is without expected result comparison
                 print(f"⏭️  {self.test_case_name}: {functional_result}")
                 self._record_execution_result("SKIPPED")
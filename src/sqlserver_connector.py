@@ -9,6 +9,8 @@ from src.database_connection_base import DatabaseConnectionBase
 class SQLServerConnector(DatabaseConnectionBase):
     """SQL Server database connector"""
     
+    dialect = "sqlserver"
+    
     def __init__(self, host: str, port: int, username: str, password: str, database: str, driver: str = "ODBC Driver 17 for SQL Server"):
         super().__init__(host, port, username, password)
         self.database = database
@@ -0,0 +1,398 @@
+"""
+Unit tests for the database test framework
+"""
+import asyncio
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock, patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import src.database_test_framework as framework
+from src.database_test_framework import (
+    DatabaseConnectionFactory,
+    DatabaseTest,
+    DatabaseTestFactory,
+    PerformanceTest,
+    QueriesTest,
+    SetupValidationTest,
+    TableBundleTest,
+    TableSelectTest,
+    TableStructureTest,
+    TestResult,
+)
+from src.oracle_connector import OracleConnector
+from src.postgresql_connector import PostgreSQLConnector
+from src.sqlserver_connector import SQLServerConnector
+
+
+class PostgreSQLStubConnector(MagicMock):
+    """Connector stub whose class name matches the PostgreSQL dialect checks."""
+
+    dialect = "postgresql"
+
+
+class OracleStubConnector(MagicMock):
+    """Connector stub whose class name matches the Oracle dialect checks."""
+
+    dialect = "oracle"
+
+
+def make_test(test_class, connector, **parameters):
+    """Create a test instance wired to a stub connector."""
+    test = test_class("DEV", "TEST", parameters)
+    test.connector = connector
+    return test
+
+
+@pytest.mark.unit
+class TestDatabaseConnectionFactory:
+    """Test class for DatabaseConnectionFactory"""
+
+    @patch('src.database_test_framework.DatabaseConfigManager.get_credentials', return_value=("user", "pass"))
+    def test_create_connection_loads_connector_class(self, mock_credentials):
+        """Test the connector class for the configured db_type is imported and cached"""
+        factory = DatabaseConnectionFactory()
+        factory.config_manager = MagicMock()
+        factory.config_manager.get_connection_details.return_value = {
+            "db_type": "postgresql", "host": "localhost", "port": 5432, "database": "db"
+        }
+
+        connector, message = factory.create_connection("DEV", "TEST")
+
+        assert isinstance(connector, PostgreSQLConnector)
+        assert message == "Created POSTGRESQL connector successfully"
+        assert framework._connector_classes["postgresql"] is PostgreSQLConnector
+
+    @patch('src.database_test_framework.DatabaseConfigManager.get_credentials', return_value=("user", "pass"))
+    def test_create_connection_unsupported_type(self, mock_credentials):
+        """Test unknown database types are rejected without importing anything"""
+        factory = DatabaseConnectionFactory()
+        factory.config_manager = MagicMock()
+        factory.config_manager.get_connection_details.return_value = {"db_type": "mysql"}
+
+        connector, message = factory.create_connection("DEV", "TEST")
+
+        assert connector is None
+        assert message == "Unsupported database type: mysql"
+
+
+@pytest.mark.unit
+class TestDatabaseTestExecute:
+    """Test class for DatabaseTest.execute"""
+
+    def test_execute_reports_errors_raised_by_test_logic(self):
+        """Test errors from test logic are reported once by execute and the connection is closed"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.side_effect = ValueError("bad result")
+        test = make_test(SetupValidationTest, connector)
+
+        with patch.object(SetupValidationTest, 'setup_connection', return_value=(True, "ok")):
+            result = test.execute()
+
+        assert result.status == "FAILED"
+        assert result.message == "Unexpected error - ValueError: bad result"
+        assert str(result) == "FAILED: Unexpected error - ValueError: bad result"
+        connector.disconnect.assert_called_once()
+
+    def test_execute_base_class_without_test_logic(self):
+        """Test the base class reports missing test logic as a failure"""
+        test = make_test(DatabaseTest, PostgreSQLStubConnector())
+
+        with patch.object(DatabaseTest, 'setup_connection', return_value=(True, "ok")):
+            result = test.execute()
+
+        assert str(result) == "FAILED: Unexpected error - NotImplementedError: DatabaseTest must implement execute_test_logic"
+
+    def test_execute_passes_and_disconnects(self):
+        """Test a passing test returns PASSED after closing the connection"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(1,)])
+        connector.is_connected = True
+        test = make_test(SetupValidationTest, connector)
+
+        with patch.object(SetupValidationTest, 'setup_connection', return_value=(True, "ok")):
+            result = test.execute()
+
+        assert result.status == "PASSED"
+        assert result.message == "Database setup validation passed"
+        assert result.duration_ns >= 0
+        assert str(result) == "PASSED"
+
+        connector.disconnect.assert_called_once()
+
+
+@pytest.mark.unit
+class TestDatabaseTestFactory:
+    """Test class for DatabaseTestFactory"""
+
+    @pytest.mark.parametrize("category", ["SETUP", "setup", "Setup"])
+    def test_create_test_any_case(self, category):
+        """Test categories resolve regardless of case"""
+        assert isinstance(DatabaseTestFactory.create_test(category, "DEV", "TEST"), SetupValidationTest)
+
+    def test_create_test_unknown_category(self):
+        """Test unknown categories return None"""
+        assert DatabaseTestFactory.create_test("SMOKE", "DEV", "TEST") is None
+
+    def test_every_category_has_a_test_class(self):
+        """Test the class table lines up with the supported categories"""
+        categories = DatabaseTestFactory.get_supported_categories()
+
+        assert len(categories) == len(DatabaseTestFactory._test_classes)
+        assert isinstance(DatabaseTestFactory.create_test("TABLE_STRUCTURE", "DEV", "TEST"), TableStructureTest)
+
+
+@pytest.mark.unit
+class TestTableSelectTest:
+    """Test class for TableSelectTest"""
+
+    @pytest.mark.parametrize("connector_class, expected", [
+        (PostgreSQLConnector, "SELECT * FROM orders LIMIT 5"),
+        (SQLServerConnector, "SELECT TOP 5 * FROM orders"),
+        (OracleConnector, "SELECT * FROM orders WHERE rownum <= 5"),
+    ])
+    def test_select_query_per_dialect(self, connector_class, expected):
+        """Test the row-limited SELECT matches each database dialect"""
+        connector = MagicMock(spec=connector_class)
+        connector.dialect = connector_class.dialect
+
+        assert TableSelectTest.build_select_query(connector, "orders", "5") == expected
+
+    def test_select_query_rejects_non_integer_limit(self):
+        """Test a non-numeric row limit is rejected instead of formatted into SQL"""
+        with pytest.raises(ValueError):
+            TableSelectTest.build_select_query(PostgreSQLStubConnector(), "orders", "1; DROP TABLE orders")
+
+
+@pytest.mark.unit
+class TestTableBundleTest:
+    """Test class for TableBundleTest"""
+
+    def test_factory_creates_bundle_test(self):
+        """Test TABLE_BUNDLE is a supported factory category"""
+        test = DatabaseTestFactory.create_test("table_bundle", "DEV", "TEST", {"table_name": "orders"})
+
+        assert isinstance(test, TableBundleTest)
+        assert "TABLE_BUNDLE" in DatabaseTestFactory.get_supported_categories()
+
+    def test_bundle_success_runs_one_query(self):
+        """Test bundle runs the select, count and structure checks as one combined query"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(1, 42, 2)])
+
+        success, message = make_test(TableBundleTest, connector, table_name="orders").execute_test_logic()
+
+        assert success is True
+        assert message == "Table 'orders' bundle passed - Retrieved 1 rows, 42 total rows, 2 columns found"
+        connector.table_exists.assert_not_called()
+        query = connector.execute_query.call_args.args[0]
+        assert connector.execute_query.call_count == 1
+        assert query.startswith("SELECT (SELECT COUNT(*) FROM (SELECT * FROM orders LIMIT 1) selected_rows) AS selected_count, ")
+        assert "(SELECT COUNT(*) FROM orders) AS row_count" in query
+        assert "information_schema.columns" in query and "ORDER BY" not in query
+
+    def test_bundle_query_selects_from_dual_on_oracle(self):
+        """Test the combined query gets Oracle's FROM DUAL"""
+        query = TableBundleTest.build_bundle_query(OracleStubConnector(), "orders", 5)
+
+        assert "FROM (SELECT * FROM orders WHERE rownum <= 5) selected_rows" in query
+        assert "user_tab_columns" in query
+        assert query.endswith(" FROM DUAL")
+
+    def test_bundle_missing_table(self):
+        """Test a failed bundle checks existence to report a missing table"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (False, 'relation "missing" does not exist')
+        connector.table_exists.return_value = False
+
+        success, message = make_test(TableBundleTest, connector, table_name="missing").execute_test_logic()
+
+        assert success is False
+        assert message == "Table 'missing' does not exist"
+        connector.table_exists.assert_called_once_with("missing")
+
+    def test_bundle_reports_failed_query(self):
+        """Test a failed bundle on an existing table reports the query error"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (False, "permission denied")
+        connector.table_exists.return_value = True
+
+        success, message = make_test(TableBundleTest, connector, table_name="orders").execute_test_logic()
+
+        assert success is False
+        assert message == "Table bundle query failed: permission denied"
+
+    def test_bundle_without_columns(self):
+        """Test a table without column metadata fails the structure check"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(0, 0, 0)])
+
+        success, message = make_test(TableBundleTest, connector, table_name="orders").execute_test_logic()
+
+        assert success is False
+        assert message == "No structure information found for table 'orders'"
+
+    def test_bundle_unknown_connector(self):
+        """Test bundle rejects connectors with an unknown dialect"""
+        connector = MagicMock()
+        connector.table_exists.return_value = True
+
+        success, message = make_test(TableBundleTest, connector).execute_test_logic()
+
+        assert success is False
+        assert "Unknown connector type" in message
+
+
+@pytest.mark.unit
+class TestQueriesTest:
+    """Test class for QueriesTest"""
+
+    def test_single_round_trip(self):
+        """Test all query checks are issued as one statement"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(1, "2024-01-01", 12)])
+
+        success, message = make_test(QueriesTest, connector).execute_test_logic()
+
+        assert success is True
+        assert message.startswith("Queries test passed")
+        connector.execute_query.assert_called_once_with(QueriesTest._COMBINED_QUERIES["postgresql"])
+
+    def test_query_failure(self):
+        """Test a failed combined query is reported"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (False, "syntax error")
+
+        success, message = make_test(QueriesTest, connector).execute_test_logic()
+
+        assert success is False
+        assert message.endswith("- syntax error")
+
+    def test_unknown_connector(self):
+        """Test connectors with an unknown dialect fail"""
+        connector = MagicMock()
+
+        success, message = make_test(QueriesTest, connector).execute_test_logic()
+
+        assert success is False
+        assert "Unknown connector type" in message
+
+
+@pytest.mark.unit
+class TestPerformanceTest:
+    """Test class for PerformanceTest"""
+
+    def test_instances_have_no_dict(self):
+        """Test test instances use __slots__ instead of a per-instance __dict__"""
+        test = PerformanceTest("DEV", "TEST")
+
+        assert not hasattr(test, "__dict__")
+        assert not hasattr(TableSelectTest("DEV", "TEST"), "__dict__")
+
+    def test_threshold_parsed_once(self):
+        """Test the max execution time parameter is converted at construction"""
+        test = PerformanceTest("DEV", "TEST", {"max_execution_time_ms": "250"})
+
+        assert test.max_execution_time == 250.0
+        assert test._max_execution_ns == 250_000_000
+
+    def test_invalid_threshold_reported_as_failed_result(self):
+        """Test a non-numeric max execution time fails the test run instead of its construction"""
+        connector = PostgreSQLStubConnector()
+
+        test = make_test(PerformanceTest, connector, max_execution_time_ms="fast")
+        success, message = test.execute_test_logic()
+
+        assert success is False
+        assert message == "Performance test error: invalid max_execution_time_ms - could not convert string to float: 'fast'"
+        connector.execute_query.assert_not_called()
+
+    def test_query_within_threshold(self):
+        """Test a fast query passes"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(1,)])
+
+        success, message = make_test(PerformanceTest, connector).execute_test_logic()
+
+        assert success is True
+        assert message.startswith("Performance test passed")
+
+    @patch('src.database_test_framework.perf_counter_ns', side_effect=[0, 10_000_000])
+    def test_query_over_threshold(self, mock_clock):
+        """Test a query slower than the threshold fails"""
+        connector = PostgreSQLStubConnector()
+        connector.execute_query.return_value = (True, [(1,)])
+
+        success, message = make_test(PerformanceTest, connector, max_execution_time_ms="5").execute_test_logic()
+
+        assert success is False
+        assert "took 10.00ms (max: 5.0ms)" in message
+
+
+@pytest.mark.unit
+class TestRunBatch:
+    """Test class for DatabaseTestFactory.run_batch and DatabaseSession"""
+
+    def test_one_connection_per_environment_application(self):
+        """Test tests for the same target share one connect/disconnect cycle"""
+        connectors = []
+
+        def create_connection(environment, application):
+            connector = PostgreSQLStubConnector()
+            connector.connect.return_value = (True, "connected")
+            connector.execute_query.return_value = (True, [(1,)])
+            connector.is_connected = True
+            connectors.append(connector)
+            return connector, "created"
+
+        specs = [
+            {"test_category": "SETUP", "environment": "DEV", "application": "TEST"},
+            {"test_category": "PERFORMANCE", "environment": "dev", "application": "test"},
+            {"test_category": "SETUP", "environment": "QA", "application": "TEST"},
+            {"test_category": "UNKNOWN", "environment": "DEV", "application": "TEST"},
+        ]
+
+        with patch.object(DatabaseConnectionFactory, 'create_connection', side_effect=create_connection):
+            results = DatabaseTestFactory.run_batch(specs)
+
+        assert [result.status for result in results] == ["PASSED", "PASSED", "PASSED", "SKIPPED"]
+        assert len(connectors) == 2
+        for connector in connectors:
+            connector.connect.assert_called_once()
+            connector.disconnect.assert_called_once()
+
+    def test_session_connection_failure(self):
+        """Test every test in a session fails with the session's connection error"""
+        with patch.object(DatabaseConnectionFactory, 'create_connection', return_value=(None, "Missing credentials for DEV/TEST")):
+            results = DatabaseTestFactory.run_batch([
+                {"test_category": "SETUP", "environment": "DEV", "application": "TEST"},
+                {"test_category": "QUERIES", "environment": "DEV", "application": "TEST"},
+            ])
+
+        assert [str(result) for result in results] == ["FAILED: Missing credentials for DEV/TEST"] * 2
+
+
+@pytest.mark.unit
+class TestRunBatchAsync:
+    """Test class for DatabaseTestFactory.run_batch_async"""
+
+    def test_results_keep_spec_order(self):
+        """Test results are returned in spec order with the concurrency limit applied"""
+        specs = [
+            {"test_category": "SETUP", "environment": "DEV", "application": "TEST"},
+            {"test_category": "UNKNOWN", "environment": "DEV", "application": "TEST"},
+            {"test_category": "QUERIES", "environment": "QA", "application": "TEST", "parameters": {}},
+        ]
+
+        with patch.object(SetupValidationTest, 'execute', return_value=TestResult("PASSED")), \
+             patch.object(QueriesTest, 'execute', return_value=TestResult("FAILED", "boom")):
+            results = asyncio.run(DatabaseTestFactory.run_batch_async(specs, limit=1))
+
+        assert [str(result) for result in results] == [
+            "PASSED",
+            "SKIPPED: Unsupported test category 'UNKNOWN'",
+            "FAILED: boom",
+        ]
@@ -0,0 +1,155 @@
+"""
+Unit tests for EnhancedMarkdownReportGenerator
+"""
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.enhanced_markdown_report_generator import EnhancedMarkdownReportGenerator
+
+
+def make_generator(output_file="report.md"):
+    """Create a generator with results across two sheets and several categories."""
+    generator = EnhancedMarkdownReportGenerator(title="Unit Report", output_file=output_file)
+    generator.add_test_result("SMOKE", "S1", "Connection", "PASSED", "CONNECTION")
+    generator.add_test_result("SMOKE", "S2", "Select", "FAILED", "TABLE_SELECT")
+    generator.add_test_result("SMOKE", "S3", "Rows", "passed", "")
+    generator.add_test_result("DATA", "D1", "Compare", "PASSED", "ROW_COUNT")
+    generator.add_test_result("DATA", "D2", "Compare 2", "FAILED", "ROW_COUNT")
+    generator.add_test_result("DATA", "D3", "Compare 3", "SKIPPED", "SCHEMA")
+    return generator
+
+
+@pytest.mark.unit
+class TestEnhancedMarkdownReportGenerator:
+    """Test class for EnhancedMarkdownReportGenerator"""
+
+    def test_category_breakdown_rows(self):
+        """Test one sorted row per category with the success rate excluding skipped tests"""
+        breakdown = make_generator()._generate_category_breakdown()
+
+        rows = [line for line in breakdown.splitlines() if line.startswith("| **")]
+        assert rows == [
+            "| **CONNECTION** | 1 | 0 | 0 | 1 | 100.0% |",
+            "| **ROW_COUNT** | 1 | 1 | 0 | 2 | 50.0% |",
+            "| **SCHEMA** | 0 | 0 | 1 | 1 | N/A |",
+            "| **TABLE_SELECT** | 0 | 1 | 0 | 1 | 0.0% |",
+            "| **Unknown** | 1 | 0 | 0 | 1 | 100.0% |",
+        ]
+
+    def test_sheet_summary_counts_and_rows(self):
+        """Test per-sheet counters and one table row per test"""
+        summary = make_generator()._generate_sheet_summary()
+
+        assert "**Summary:** 3 tests | ✅ 2 passed | ❌ 1 failed | ⏭️ 0 skipped | Success Rate: **66.7%**" in summary
+        assert "**Summary:** 3 tests | ✅ 1 passed | ❌ 1 failed | ⏭️ 1 skipped | Success Rate: **50.0%**" in summary
+        assert "| `S2` | Select | `TABLE_SELECT` | ❌ **FAILED** |" in summary
+        assert "| `S3` | Rows | N/A | ✅ **PASSED** |" in summary
+        assert summary.count("\n---\n") == 2
+
+    def test_empty_report_sections(self):
+        """Test sections render placeholders when there are no results"""
+        generator = EnhancedMarkdownReportGenerator()
+
+        assert generator._generate_sheet_summary() == "No sheet data available."
+        assert generator._generate_category_breakdown() == "No category data available."
+        assert "No test results to display." in generator.generate_markdown()
+
+    def test_quick_stats(self):
+        """Test best and failing categories in the quick stats section"""
+        markdown = make_generator().generate_markdown()
+
+        assert "**Best Performing Category:** CONNECTION (100.0%)" in markdown
+        assert "**Categories Needing Attention:** TABLE_SELECT (1 failures, 100.0%), ROW_COUNT (1 failures, 50.0%)" in markdown
+
+    def test_save_writes_report(self, tmp_path):
+        """Test save writes the generated report to the output file"""
+        output_file = tmp_path / "report.md"
+        generator = make_generator(str(output_file))
+
+        assert generator.save() is True
+        content = output_file.read_text(encoding="utf-8")
+        assert content.startswith("# 🚀 Unit Report")
+        assert "### 📋 DATA" in content
+
+    def test_aggregates_refresh_after_new_results(self):
+        """Test cached aggregates are rebuilt when results are added after a report"""
+        generator = make_generator()
+        generator.generate_markdown()
+
+        generator.add_test_result("DATA", "D4", "Schema", "FAILED", "SCHEMA")
+
+        assert "| **SCHEMA** | 0 | 1 | 1 | 2 | 0.0% |" in generator._generate_category_breakdown()
+        assert "SCHEMA (1 failures, 50.0%)" in generator._get_failing_categories()
+
+    def test_generate_markdown_cached_until_results_change(self):
+        """Test the rendered report is reused until a new result is added"""
+        generator = make_generator()
+        first = generator.generate_markdown()
+
+        with patch.object(generator, '_markdown_chunks') as mock_chunks:
+            assert generator.generate_markdown() is first
+            mock_chunks.assert_not_called()
+
+        generator.add_test_results([
+            {"sheet_name": "DATA", "test_case_id": "D4", "test_case_name": "Schema", "status": "FAILED"}
+        ])
+
+        assert "| `D4` | Schema | N/A | ❌ **FAILED** |" in generator.generate_markdown()
+
+    def test_save_streams_cached_sections(self, tmp_path):
+        """Test save writes the cached sections and streams the per-sheet rows into the file without joining the report"""
+        output_file = tmp_path / "report.md"
+        generator = make_generator(str(output_file))
+        markdown = generator.generate_markdown()
+
+        with patch.object(generator, '_markdown_chunks') as mock_chunks, \
+                patch.object(generator, 'generate_markdown') as mock_generate, \
+                patch.object(generator, '_write_sheet_summary', wraps=generator._write_sheet_summary) as mock_sheets:
+            assert generator.save() is True
+            mock_chunks.assert_not_called()
+            mock_generate.assert_not_called()
+            assert mock_sheets.call_args.args[0].name == str(output_file)
+
+        assert output_file.read_text(encoding="utf-8") == markdown
+
+    def test_add_test_results_matches_single_adds(self):
+        """Test bulk-added rows produce the same counters and sections as one-by-one adds"""
+        single = make_generator()
+        bulk = EnhancedMarkdownReportGenerator(title="Unit Report")
+        bulk.add_test_results(
+            {key: value for key, value in test.items() if not key.startswith("_") and key != "timestamp"}
+            for test in single.test_results
+        )
+
+        assert bulk.summary_stats == single.summary_stats
+        assert list(bulk.sheets_data) == ["SMOKE", "DATA"]
+        for name, sheet in single.sheets_data.items():
+            assert {key: bulk.sheets_data[name][key] for key in ("passed", "failed", "skipped")} == \
+                {key: sheet[key] for key in ("passed", "failed", "skipped")}
+        assert bulk._generate_category_breakdown() == single._generate_category_breakdown()
+
+    def test_add_test_results_empty(self):
+        """Test an empty batch leaves the report unchanged"""
+        generator = EnhancedMarkdownReportGenerator()
+        generator.add_test_results([])
+
+        assert generator.summary_stats["total"] == 0
+        assert generator.sheets_data == {}
+
+    def test_timestamp_formatted_once_per_second(self):
+        """Test results added within the same second reuse the formatted timestamp"""
+        generator = EnhancedMarkdownReportGenerator()
+
+        with patch('src.enhanced_markdown_report_generator.time.time', side_effect=[100.1, 100.9, 101.2]), \
+             patch('src.enhanced_markdown_report_generator.time.strftime', side_effect=["first", "second"]) as mock_strftime:
+            generator.add_test_result("S", "1", "a", "PASSED")
+            generator.add_test_result("S", "2", "b", "PASSED")
+            generator.add_test_result("S", "3", "c", "PASSED")
+
+        assert [test["timestamp"] for test in generator.test_results] == ["first", "first", "second"]
+        assert mock_strftime.call_count == 2
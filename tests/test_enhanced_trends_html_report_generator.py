@@ -0,0 +1,405 @@
+"""
+Unit tests for EnhancedTrendsHTMLReportGenerator
+"""
+import base64
+import gzip
+import json
+import os
+import re
+import sys
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.enhanced_trends_html_report_generator import EnhancedTrendsHTMLReportGenerator
+
+
+def make_trends_data():
+    """Create a small trends snapshot covering every dashboard section."""
+    return {
+        'metadata': {'total_executions': 7, 'date_range': {'span_days': 3}},
+        'overall_trends': {'overall_passed_rate': 87.25, 'avg_execution_time_ms': 41.6},
+        'filter_data': {
+            'applications': ['DUMMY'],
+            'environments': ['DEV'],
+            'source_applications': ['APP'],
+            'source_environments': ['QA'],
+            'target_applications': ['APP'],
+            'target_environments': ['PROD'],
+        },
+        'sheet_level_trends': {
+            'Smoke Tests': {
+                'overall_passed_rate': 95.0,
+                'total_executions': 4,
+                'avg_execution_time_ms': 12.0,
+                'categories': {'CONNECTION': {'passed_rate': 65.0}},
+            },
+        },
+        'category_level_trends': {
+            'CONNECTION': {'overall_passed_rate': 75.0, 'unique_test_count': 2, 'total_executions': 4},
+        },
+        'individual_test_trends': {
+            'TC_OK': {'passed_rate': 100.0, 'category': 'CONNECTION', 'sheet_name': 'Smoke Tests'},
+            'TC_BAD': {'passed_rate': 20.0, 'execution_count': 5, 'avg_execution_time_ms': 9.0},
+        },
+        'insights': ['insight %d' % index for index in range(8)],
+    }
+
+
+def make_history():
+    """Create three executions across two applications, two environments and two weeks."""
+    def execution(application, environment, execution_time, total, passed, failed, skipped=0):
+        return {
+            'execution_metadata': {'application': application, 'environment': environment, 'execution_time': execution_time},
+            'overall_summary': {'total_tests': total, 'passed_tests': passed, 'failed_tests': failed, 'skipped_tests': skipped},
+        }
+    return [
+        execution('APP', 'DEV', '2025-07-07T09:30:00', 10, 8, 2),
+        execution('APP', 'QA', '2025-07-07T10:15:00.250000', 5, 5, 0),
+        execution('OTHER', 'DEV', '2025-07-14T09:00:00', 4, 1, 2, 1),
+    ]
+
+
+@pytest.mark.unit
+class TestEnhancedTrendsHTMLReportGenerator:
+    """Test class for EnhancedTrendsHTMLReportGenerator"""
+
+    def test_html_content_fills_dashboard(self):
+        """Test metrics, filter options, insights and tab contents are rendered into the page"""
+        html = EnhancedTrendsHTMLReportGenerator()._generate_comprehensive_html_content(make_trends_data())
+
+        assert html.startswith("\n<!DOCTYPE html>")
+        assert "<h4>7</h4>" in html
+        assert "<h4>3 Days</h4>" in html
+        assert "<h4>87.2%</h4>" in html
+        assert "<h4>42ms</h4>" in html
+        assert '<option value="DUMMY">🎯 DUMMY</option>' in html
+        assert '<option value="APP.PROD">📥 APP.PROD</option>' in html
+        assert html.count('<div class="alert alert-info mb-2">') == 6
+        assert 'data-bs-target="#sheet-Smoke_Tests"' in html
+        assert '<link href="trends_dashboard.css" rel="stylesheet">' in html and "{{" not in html
+
+    def test_trends_data_embedded_as_json_block(self):
+        """Test the snapshot is embedded as compact JSON that cannot close its script block"""
+        trends_data = make_trends_data()
+        trends_data['insights'] = ['</script><b>x</b>']
+        html = EnhancedTrendsHTMLReportGenerator()._generate_comprehensive_html_content(trends_data)
+
+        block = re.search(r'<script type="application/json" id="trendsData">(.*?)</script>', html).group(1)
+        assert json.loads(block) == trends_data
+        assert ', "' not in block
+
+    def test_sheet_anchor_sanitized(self):
+        """Test sheet names with spaces, dots and slashes give matching, selector-safe ids"""
+        html = EnhancedTrendsHTMLReportGenerator()._generate_sheet_analysis_content({'Smoke v1.2/DEV': {}})
+
+        assert 'data-bs-target="#sheet-Smoke_v1_2_DEV"' in html
+        assert 'id="sheet-Smoke_v1_2_DEV"' in html
+
+    def test_filter_options_cached_by_value(self):
+        """Test equal filter data rebuilt as a new dict, even for a new generator, reuses the generated option lists"""
+        first = EnhancedTrendsHTMLReportGenerator()._generate_filter_options(make_trends_data()['filter_data'])
+        hits = EnhancedTrendsHTMLReportGenerator._generate_options.cache_info().hits
+
+        generator = EnhancedTrendsHTMLReportGenerator()
+        second = generator._generate_filter_options(make_trends_data()['filter_data'])
+
+        assert all(options is cached for options, cached in zip(second, first))
+        assert EnhancedTrendsHTMLReportGenerator._generate_options.cache_info().hits == hits + 4
+
+        changed = make_trends_data()['filter_data']
+        changed['applications'] = ['cross_db_validator']
+        assert generator._generate_filter_options(changed)[0] == '<option value="cross_db_validator">⚡ cross_db_validator</option>'
+
+    def test_json_block_same_without_orjson(self):
+        """Test the standard json fallback embeds the same compact JSON as orjson"""
+        trends_data = make_trends_data()
+        trends_data['time_based_trends'] = {'hourly': {9: {'runs': 2}}}
+        generator = EnhancedTrendsHTMLReportGenerator()
+
+        with_default = generator._generate_comprehensive_html_content(trends_data)
+        with patch('src.enhanced_trends_html_report_generator.orjson', None):
+            with_stdlib = generator._generate_comprehensive_html_content(trends_data)
+
+        block = lambda html: re.search(r'id="trendsData">(.*?)</script>', html).group(1)
+        assert block(with_default) == block(with_stdlib)
+
+    def test_chart_data_inlined_compactly(self):
+        """Test chart literals are compact and tolerate values the json module cannot encode"""
+        trends_data = make_trends_data()
+        trends_data['time_based_trends'] = {'daily': {'2025-07-07': {'last_run': datetime(2025, 7, 7, 9, 30)}}}
+        script = EnhancedTrendsHTMLReportGenerator()._generate_javascript_charts(trends_data)
+
+        assert 'const sheetData = ["Smoke Tests"];' in script
+        assert 'const dailyData = {"2025-07-07":{"last_run":"2025-07-07 09:30:00"}};' in script
+
+    def test_chart_script_minified(self):
+        """Test the chart script is emitted without indentation, blank lines or comment lines"""
+        script = EnhancedTrendsHTMLReportGenerator()._generate_javascript_charts(make_trends_data())
+        lines = script.strip().split('\n')
+
+        assert all(line and line == line.strip() and not line.startswith('//') for line in lines)
+        assert 'function makeChart(canvas, config) {' in lines
+
+    def test_time_trends_partitioned_by_filter(self):
+        """Test time trends are aggregated per application/environment pair and per single filter"""
+        partitions = EnhancedTrendsHTMLReportGenerator(make_history())._generate_partitioned_time_trends()
+
+        assert partitions['APP']['DEV']['daily'] == {'2025-07-07': {
+            'executions': 1, 'total_tests': 10, 'passed_tests': 8, 'failed_tests': 2, 'skipped_tests': 0,
+            'passed_rate': 80.0, 'failed_rate': 20.0, 'skipped_rate': 0.0,
+        }}
+        assert list(partitions['APP']['']['hourly']) == [9, 10]
+        assert partitions['APP']['']['yearly']['2025']['total_tests'] == 15
+        assert {week: data['executions'] for week, data in partitions['']['DEV']['weekly'].items()} == \
+            {'2025-W28': 1, '2025-W29': 1}
+        assert '' not in partitions['']
+
+    def test_time_trends_partitions_empty_history(self):
+        """Test an empty history gives no partitions"""
+        assert EnhancedTrendsHTMLReportGenerator()._generate_partitioned_time_trends() == {}
+
+    def test_time_trends_partitions_null_counters(self):
+        """Test missing or null summary counters count as zero and keep the counters integers"""
+        history = make_history()
+        history[0]['overall_summary']['skipped_tests'] = None
+        history[1]['overall_summary'] = None
+
+        daily = EnhancedTrendsHTMLReportGenerator(history)._generate_partitioned_time_trends()['APP']['']['daily']
+
+        assert daily['2025-07-07']['executions'] == 2
+        assert daily['2025-07-07']['total_tests'] == 10
+        assert type(daily['2025-07-07']['skipped_tests']) is int
+
+    def test_time_trends_partitions_mixed_utc_offsets(self):
+        """Test histories mixing UTC offsets and naive times bucket on wall-clock time, skipping unparseable times"""
+        history = make_history()
+        history[0]['execution_metadata']['execution_time'] = '2025-07-07T09:30:00+01:00'
+        history[1]['execution_metadata']['execution_time'] = '2025-07-07T10:15:00.250000+02:00'
+        history.append({'execution_metadata': {'application': 'APP', 'execution_time': 'not a time'}})
+
+        trends = EnhancedTrendsHTMLReportGenerator(history)._generate_partitioned_time_trends()
+
+        assert list(trends['APP']['']['daily']) == ['2025-07-07']
+        assert trends['APP']['']['daily']['2025-07-07']['executions'] == 2
+        assert list(trends['APP']['']['hourly']) == [9, 10]
+
+    def test_partitioned_time_data_embedded_compressed(self):
+        """Test the time trends are embedded as base64 gzip JSON, identically without orjson"""
+        history = make_history()
+        history[0]['execution_metadata']['environment'] = '</script>é'
+        generator = EnhancedTrendsHTMLReportGenerator(execution_history=history)
+
+        with_default = generator._generate_javascript_charts(make_trends_data())
+        generator._charts_cache = None
+        with patch('src.enhanced_trends_html_report_generator.orjson', None):
+            with_stdlib = generator._generate_javascript_charts(make_trends_data())
+
+        assert with_default == with_stdlib
+        payload = re.search(r'const partitionedTimeDataGzip = "([A-Za-z0-9+/=]*)";', with_default).group(1)
+        partitions = json.loads(gzip.decompress(base64.b64decode(payload)))
+        assert partitions == json.loads(json.dumps(generator._generate_partitioned_time_trends()))
+        assert partitions['APP']['</script>é']['daily']['2025-07-07']['passed_rate'] == 80.0
+
+    def test_partitioned_time_data_streamed_as_own_chunk(self):
+        """Test the embedded time trends are yielded as their own page chunk rather than joined into the script"""
+        generator = EnhancedTrendsHTMLReportGenerator(execution_history=make_history())
+        chunks = list(generator._iter_html_chunks(make_trends_data()))
+
+        assert generator._charts_cache[1]['partitioned_time_data'] in chunks
+        assert ''.join(chunks).rstrip().endswith("</html>")
+
+    def test_partitioned_time_data_embedded_once(self):
+        """Test the time trends are only embedded gzip-compressed, with unsupported browsers reported instead"""
+        generator = EnhancedTrendsHTMLReportGenerator(execution_history=make_history())
+
+        html = generator._generate_comprehensive_html_content(make_trends_data())
+
+        assert 'id="partitionedTimeData"' not in html
+        assert html.count(generator._charts_cache[1]['partitioned_time_data']) == 1
+        assert "typeof DecompressionStream === 'undefined'" in html
+
+    def test_filters_section_streamed_in_parts(self):
+        """Test the filters section is yielded as template pieces and option lists, matching the joined section"""
+        generator = EnhancedTrendsHTMLReportGenerator()
+        trends_data = make_trends_data()
+        chunks = list(generator._iter_html_chunks(trends_data))
+        filter_options = generator._generate_filter_options(trends_data['filter_data'])
+
+        assert all(options in chunks for options in filter_options)
+        assert generator._generate_filters_section(trends_data['filter_data']) in ''.join(chunks)
+
+    def test_chart_script_reused_for_unchanged_data(self):
+        """Test the chart literals are serialized once until the trends or history change"""
+        generator = EnhancedTrendsHTMLReportGenerator(execution_history=make_history())
+        first = generator._generate_javascript_charts(make_trends_data())
+
+        with patch('src.enhanced_trends_html_report_generator._json_island') as mock_literal:
+            assert generator._generate_javascript_charts(make_trends_data()) == first
+            mock_literal.assert_not_called()
+
+        generator.execution_history.append({
+            'execution_metadata': {'application': 'NEW', 'environment': 'DEV', 'execution_time': '2025-07-08T08:00:00'},
+        })
+        assert generator._generate_javascript_charts(make_trends_data()) != first
+
+    def test_individual_tests_sorted_worst_first(self):
+        """Test individual tests are listed by ascending success rate with defaults for missing fields"""
+        html = EnhancedTrendsHTMLReportGenerator()._generate_individual_tests_content(
+            make_trends_data()['individual_test_trends']
+        )
+
+        assert html.index("<code>TC_BAD</code>") < html.index("<code>TC_OK</code>")
+        assert '<span class="badge bg-secondary">Unknown</span>' in html
+        assert "❌ Failing" in html and "✅ Stable" in html
+
+    def test_out_of_range_rates_use_end_buckets(self):
+        """Test negative and above-100% success rates clamp to the lowest and highest status buckets"""
+        generator = EnhancedTrendsHTMLReportGenerator()
+
+        categories = generator._generate_category_analysis_content({
+            'LOW': {'overall_passed_rate': -15}, 'HIGH': {'overall_passed_rate': 150}
+        })
+        individual = generator._generate_individual_tests_content({'TC_NEG': {'passed_rate': -15}})
+
+        assert '<span class="badge bg-danger">-15.0%</span>' in categories
+        assert '<span class="badge bg-success">150.0%</span>' in categories
+        assert categories.index('📉') < categories.index('📈')
+        assert "❌ Failing" in individual and "Stable" not in individual
+
+    def test_individual_rows_carry_test_id_attribute(self):
+        """Test each individual test row exposes its id and lowercased search text, attribute-escaped, for the filters"""
+        html = EnhancedTrendsHTMLReportGenerator()._generate_individual_tests_content(
+            {'TC "A"&B': {'passed_rate': 50, 'category': 'Row_Count'}}
+        )
+
+        assert '<tr data-test-id="TC &quot;A&quot;&amp;B" data-search="tc &quot;a&quot;&amp;b|row_count">' in html
+
+    def test_individual_tests_beyond_limit_are_deferred(self):
+        """Test only the worst tests are rendered and the rest are embedded for lazy rendering"""
+        generator = EnhancedTrendsHTMLReportGenerator()
+        generator.INDIVIDUAL_ROW_LIMIT = 1
+        html = generator._generate_individual_tests_content(make_trends_data()['individual_test_trends'])
+
+        assert "<code>TC_BAD</code>" in html and "<code>TC_OK</code>" not in html
+        assert "Showing 1 of 2 tests" in html
+        pending = re.search(r'id="pendingIndividualTests">(.*?)</script>', html).group(1)
+        assert json.loads(pending) == [["TC_OK", "CONNECTION", "Smoke Tests", 100.0, 0, 0]]
+
+    def test_heap_selection_matches_full_sort(self):
+        """Test heap selection of the rendered rows gives the same rows as a full sort"""
+        individual_trends = {'T%d' % index: {'passed_rate': (index * 37) % 100} for index in range(30)}
+        generator = EnhancedTrendsHTMLReportGenerator()
+        generator.INDIVIDUAL_ROW_LIMIT = 10
+
+        sorted_html = generator._generate_individual_tests_content(individual_trends)
+        with patch('src.enhanced_trends_html_report_generator._HEAP_SELECT_MIN_TESTS', 0):
+            heap_html = generator._generate_individual_tests_content(individual_trends)
+
+        rendered = lambda html: re.findall(r'<td><code>(T\d+)</code></td>', html)
+        assert rendered(heap_html) == rendered(sorted_html)
+        assert len(rendered(heap_html)) == 10
+
+    def test_html_content_with_empty_trends(self):
+        """Test an empty snapshot still renders a complete page"""
+        html = EnhancedTrendsHTMLReportGenerator()._generate_comprehensive_html_content({})
+
+        assert "<h4>0.0%</h4>" in html
+        assert html.rstrip().endswith("</html>")
+
+    def test_generate_report_writes_file(self, tmp_path):
+        """Test the report is written to the requested output file"""
+        output_file = tmp_path / "reports" / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator()
+
+        path = generator.generate_comprehensive_trends_report(make_trends_data(), output_file=str(output_file))
+
+        assert path == str(output_file)
+        assert "Comprehensive Test Execution Trends" in output_file.read_text(encoding='utf-8')
+        assert "body {" in (output_file.parent / "trends_dashboard.css").read_text(encoding='utf-8')
+
+    def test_generate_report_gzip_output(self, tmp_path):
+        """Test gzip output writes a compressed copy of the page next to the requested path"""
+        output_file = tmp_path / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(output_file))
+
+        path = generator.generate_comprehensive_trends_report(make_trends_data(), gzip_output=True)
+
+        assert path == str(output_file) + ".gz"
+        assert not output_file.exists()
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            assert f.read().rstrip().endswith("</html>")
+
+    def test_generate_report_reuses_cached_page(self, tmp_path):
+        """Test an identical snapshot is copied from the cache instead of being rendered again"""
+        output_file = tmp_path / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(output_file))
+        generator.generate_comprehensive_trends_report(make_trends_data())
+        first_page = output_file.read_text(encoding='utf-8')
+        output_file.unlink()
+
+        with patch.object(generator, '_iter_html_chunks') as mock_chunks:
+            generator.generate_comprehensive_trends_report(make_trends_data())
+
+        mock_chunks.assert_not_called()
+        assert output_file.read_text(encoding='utf-8') == first_page
+
+    def test_generate_report_renders_changed_snapshot(self, tmp_path):
+        """Test a changed snapshot misses the cache and is rendered"""
+        output_file = tmp_path / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(output_file))
+        generator.generate_comprehensive_trends_report(make_trends_data())
+
+        trends_data = make_trends_data()
+        trends_data['metadata']['total_executions'] = 8
+        generator.generate_comprehensive_trends_report(trends_data)
+
+        assert "<h4>8</h4>" in output_file.read_text(encoding='utf-8')
+        assert len(list((tmp_path / ".cache").iterdir())) == 2
+
+    def test_generate_report_cache_ignores_analysis_time(self, tmp_path):
+        """Test snapshots differing only in their analysis timestamp share one cached page"""
+        output_file = tmp_path / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(output_file))
+        trends_data = make_trends_data()
+        trends_data['metadata']['analysis_generated'] = '2025-07-10T08:00:00'
+        generator.generate_comprehensive_trends_report(trends_data)
+
+        trends_data = make_trends_data()
+        trends_data['metadata']['analysis_generated'] = '2025-07-10T09:30:00'
+        with patch.object(generator, '_iter_html_chunks') as mock_chunks:
+            generator.generate_comprehensive_trends_report(trends_data)
+
+        mock_chunks.assert_not_called()
+        assert len(list((tmp_path / ".cache").iterdir())) == 1
+        assert trends_data['metadata']['analysis_generated'] == '2025-07-10T09:30:00'
+
+    def test_generate_report_renders_after_version_change(self, tmp_path):
+        """Test pages cached by another generator version or other templates are not reused"""
+        output_file = tmp_path / "trends.html"
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(output_file))
+        generator.generate_comprehensive_trends_report(make_trends_data())
+
+        generator.CACHE_VERSION += 1
+        with patch.object(generator, '_iter_html_chunks', wraps=generator._iter_html_chunks) as mock_chunks:
+            generator.generate_comprehensive_trends_report(make_trends_data())
+        mock_chunks.assert_called_once()
+
+        with patch('src.enhanced_trends_html_report_generator._TEMPLATES_DIGEST', 'changed'):
+            generator.generate_comprehensive_trends_report(make_trends_data())
+        assert len(list((tmp_path / ".cache").iterdir())) == 3
+
+    def test_cached_reports_are_evicted(self, tmp_path):
+        """Test only the most recent CACHE_SIZE pages are kept"""
+        generator = EnhancedTrendsHTMLReportGenerator(output_file=str(tmp_path / "trends.html"))
+        generator.CACHE_SIZE = 2
+
+        for total in range(4):
+            trends_data = make_trends_data()
+            trends_data['metadata']['total_executions'] = total
+            generator.generate_comprehensive_trends_report(trends_data)
+
+        assert len(list((tmp_path / ".cache").iterdir())) == 2
@@ -61,6 +61,7 @@ class TestOracleConnector:
         
         # Verify oracledb.connect was called with correct parameters
         mock_oracledb.connect.assert_called_once()
+        assert mock_oracledb.connect.call_args.kwargs["stmtcachesize"] == 64
 
     @pytest.mark.unit
     @patch('builtins.__import__')
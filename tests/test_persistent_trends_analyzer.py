@@ -0,0 +1,90 @@
+"""
+Unit tests for PersistentTrendsAnalyzer
+"""
+import json
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.persistent_trends_analyzer import PersistentTrendsAnalyzer
+
+
+def make_record(execution_time, total, passed, failed, skipped=0):
+    """Create an execution record with the given time and overall summary."""
+    return {
+        'execution_metadata': {'execution_time': execution_time},
+        'overall_summary': {
+            'total_tests': total, 'passed_tests': passed,
+            'failed_tests': failed, 'skipped_tests': skipped
+        }
+    }
+
+
+@pytest.mark.unit
+class TestPersistentTrendsAnalyzer:
+    """Test class for PersistentTrendsAnalyzer"""
+
+    def test_time_trends_bucketed_per_time_frame(self, tmp_path):
+        """Test records are summed into hourly, daily, ISO weekly, monthly and yearly buckets in chronological order"""
+        analyzer = PersistentTrendsAnalyzer(str(tmp_path / "missing.json"))
+        records = [
+            make_record('2025-01-01T09:30:00', 10, 8, 2),
+            make_record('2024-12-30T10:15:00.250000', 4, 1, 2, 1),
+            make_record('2025-01-01T09:45:00+05:30', 0, 0, 0),
+        ]
+
+        trends = analyzer._generate_time_trends(records)
+
+        assert list(trends['hourly']) == [9, 10]
+        assert trends['hourly'][9] == {
+            'executions': 2, 'total_tests': 10, 'passed_tests': 8,
+            'failed_tests': 2, 'skipped_tests': 0,
+            'passed_rate': 80.0, 'failed_rate': 20.0, 'skipped_rate': 0.0
+        }
+        assert list(trends['daily']) == ['2024-12-30', '2025-01-01']
+        assert trends['weekly'] == {'2025-W01': trends['weekly']['2025-W01']}
+        assert trends['weekly']['2025-W01']['executions'] == 3
+        assert list(trends['monthly']) == ['2024-12', '2025-01']
+        assert list(trends['yearly']) == ['2024', '2025']
+        assert trends['yearly']['2024']['skipped_rate'] == 25.0
+
+    def test_time_trends_without_tests_have_no_rates(self, tmp_path):
+        """Test buckets without tests carry counters only, null counters count as zero and no records give empty frames"""
+        analyzer = PersistentTrendsAnalyzer(str(tmp_path / "missing.json"))
+
+        trends = analyzer._generate_time_trends([make_record('2025-07-07T09:00:00', 0, 0, 0)])
+
+        assert trends['yearly'] == {'2025': {
+            'executions': 1, 'total_tests': 0, 'passed_tests': 0,
+            'failed_tests': 0, 'skipped_tests': 0
+        }}
+        assert analyzer._generate_time_trends([
+            {'execution_metadata': {'execution_time': '2025-07-07T09:00:00'}, 'overall_summary': None},
+            make_record('2025-07-07T10:00:00', 2, None, 1),
+        ])['daily']['2025-07-07']['passed_tests'] == 0
+        assert analyzer._generate_time_trends([]) == {
+            'hourly': {}, 'daily': {}, 'weekly': {}, 'monthly': {}, 'yearly': {}
+        }
+
+    def test_execution_time_range_shared_by_metadata_and_insights(self, tmp_path):
+        """Test the execution time range is computed once for the date range and the frequency insight"""
+        data_file = tmp_path / "history.json"
+        data_file.write_text(json.dumps({'execution_history': [
+            make_record('2025-07-10T08:00:00', 4, 4, 0),
+            make_record('2025-07-07T09:00:00', 4, 2, 2),
+            make_record('2025-07-11T10:00:00', 4, 3, 1),
+        ]}), encoding='utf-8')
+        analyzer = PersistentTrendsAnalyzer(str(data_file))
+
+        with patch.object(analyzer, '_get_execution_time_range', wraps=analyzer._get_execution_time_range) as mock_range:
+            trends = analyzer.generate_comprehensive_trends()
+
+        assert mock_range.call_count == 1
+        assert trends['metadata']['date_range'] == {
+            'earliest': '2025-07-07T09:00:00', 'latest': '2025-07-11T10:00:00', 'span_days': 4
+        }
+        assert "📊 Test execution frequency: 0.8 runs per day over 4 days" in trends['insights']
@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.smoke_test_case import SmokeTestCase
+from src.database_test_framework import TestResult
 
 
 @pytest.mark.unit
@@ -209,7 +210,7 @@ class TestSmokeTestCase:
         """Test execute_test returning PASSED"""
         # Mock the test instance and its execute method
         mock_test_instance = MagicMock()
-        mock_test_instance.execute.return_value = "PASSED"
+        mock_test_instance.execute.return_value = TestResult("PASSED")
         mock_create_test.return_value = mock_test_instance
         
         test_case = SmokeTestCase(
@@ -230,7 +231,7 @@ class TestSmokeTestCase:
         """Test execute_test returning FAILED"""
         # Mock the test instance and its execute method
         mock_test_instance = MagicMock()
-        mock_test_instance.execute.return_value = "FAILED: Test error"
+        mock_test_instance.execute.return_value = TestResult("FAILED", "Test error")
         mock_create_test.return_value = mock_test_instance
         
         test_case = SmokeTestCase(
@@ -249,7 +250,7 @@ class TestSmokeTestCase:
         """Test execute_test returning SKIPPED"""
         # Mock the test instance and its execute method
         mock_test_instance = MagicMock()
-        mock_test_instance.execute.return_value = "SKIPPED: Test skipped"
+        mock_test_instance.execute.return_value = TestResult("SKIPPED", "Test skipped")
         mock_create_test.return_value = mock_test_instance
         
         test_case = SmokeTestCase(